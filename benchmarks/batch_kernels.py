@@ -0,0 +1,119 @@
+"""calculateBatch with the array kernels of kernels.py against calling the electronics_calculator functions.
+
+First runs verifyKernels of test_kernels.py, the differential check of every kernel against its function over random
+inputs, and stops with a non-zero status if any element disagrees. Then times one calculateBatch call of --points
+elements for each function in the catalog, with the engine's useKernels set and cleared, on two sets of inputs:
+
+    clean      positive values from 1e-3 to 1e3, valid for every function
+    zeros      the same with 1% of the values set to 0
+
+Without kernels, a function taking arrays runs at NumPy speed on clean inputs, but one zero divisor sends the whole
+call to the one element at a time loop, as does every function that branches or calls the math module. The kernels
+only loop over the elements that fail. Tuple calculations get --tuple copies of one array, so that series currents and
+parallel voltages are equal, as they must be.
+
+Usage:
+    python benchmarks/batch_kernels.py [--points N] [--tuple N] [--verify-count N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np  # noqa: E402
+
+from ElectricalEngineeringCalculator.batch import calculateBatch  # noqa: E402
+from ElectricalEngineeringCalculator.engine import CalculationEngine  # noqa: E402
+from ElectricalEngineeringCalculator.kernels import KERNELS, get_Numba  # noqa: E402
+from test_kernels import VERIFY_COUNT, verifyKernels  # noqa: E402
+
+
+def get_Inputs(plan, points, tupleCount, zeros):
+    """Input arrays for a calculation, with a share of zeros if asked for"""
+
+    generator = np.random.default_rng(len(plan.methodName))
+    arrays = []
+
+    for _ in range(tupleCount if plan.tupleMode else plan.arity):
+        array = 10.0 ** generator.uniform(-3, 3, points)
+
+        if zeros:
+            array[generator.random(points) < 0.01] = 0.0
+
+        arrays.append(array)
+
+    if plan.tupleMode:
+        arrays = [arrays[0]] * tupleCount
+
+    return arrays
+
+
+def timed(engine, plan, arrays):
+    """Seconds of one calculateBatch call, after a warm-up call, and its error count"""
+
+    calculateBatch(engine, plan.displayName, [array[:100] for array in arrays])
+    start = time.perf_counter()
+    results, errors = calculateBatch(engine, plan.displayName, arrays)
+
+    return time.perf_counter() - start, len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=100000, help="elements per call (default 100000)")
+    parser.add_argument("--tuple", type=int, default=3, help="values of a tuple calculation (default 3)")
+    parser.add_argument("--verify-count", type=int, default=VERIFY_COUNT,
+                        help="random elements per verified kernel (default %d)" % VERIFY_COUNT)
+    args = parser.parse_args()
+
+    kernelEngine = CalculationEngine(cacheSize=0)
+    libraryEngine = CalculationEngine(kernelEngine.catalog, cacheSize=0, useKernels=False)
+    print("numba: %s" % ("installed, kernels compiled" if get_Numba() else "not used, NumPy kernels"))
+
+    start = time.perf_counter()
+    mismatches = verifyKernels(kernelEngine, count=args.verify_count)
+    print("verifyKernels: %d kernels, %d elements each, %d mismatches (%.1f s)" % (
+        len(KERNELS), args.verify_count, len(mismatches), time.perf_counter() - start))
+
+    for mismatch in mismatches[:10]:
+        print("  %s%r: kernel %r, function %r" % mismatch)
+
+    if mismatches:
+        sys.exit(1)
+
+    plans = {}
+
+    for plan in kernelEngine.plans.values():
+        if plan.function is not None and plan.methodName in KERNELS:
+            plans.setdefault(plan.methodName, plan)
+
+    print("%d elements per call, ms" % args.points)
+    print("  %-34s %10s %10s %8s %10s %10s %8s" % ("function", "library", "kernel", "speedup", "zeros lib",
+                                                  "zeros kern", "speedup"))
+    totals = np.zeros(4)
+
+    for methodName in sorted(plans):
+        plan = plans[methodName]
+        row = []
+
+        for zeros in (False, True):
+            arrays = get_Inputs(plan, args.points, args.tuple, zeros)
+            librarySeconds, libraryErrors = timed(libraryEngine, plan, arrays)
+            kernelSeconds, kernelErrors = timed(kernelEngine, plan, arrays)
+            assert libraryErrors == kernelErrors
+            row += [librarySeconds, kernelSeconds]
+
+        totals += row
+        print("  %-34s %10.2f %10.2f %7.1fx %10.2f %10.2f %7.1fx" % (
+            methodName, row[0] * 1000, row[1] * 1000, row[0] / row[1], row[2] * 1000, row[3] * 1000, row[2] / row[3]))
+
+    print("  %-34s %10.1f %10.1f %7.1fx %10.1f %10.1f %7.1fx" % (
+        "all", totals[0] * 1000, totals[1] * 1000, totals[0] / totals[1], totals[2] * 1000, totals[3] * 1000,
+        totals[2] / totals[3]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Bulk throughput: vectorized arrays, mixed job rows and a batch file, per synthetic catalog size."""
+
+import csv
+import random
+
+import numpy as np
+from conftest import get_InputValues
+
+from ElectricalEngineeringCalculator.batch import calculateBatch
+from ElectricalEngineeringCalculator.runner import evaluateChunk, runBatchFile
+
+ARRAY_SIZE = 100000
+ROW_COUNT = 10000
+
+
+def get_Rows(engine, count):
+    """Job rows, as read from a batch file, for calculations picked at random from the catalog"""
+
+    rng = random.Random(1)
+    rows = []
+
+    for _ in range(count):
+        plan = engine.get_Plan(rng.choice(engine.catalog.displayNames))
+        row = {"calculation": plan.displayName}
+
+        for number, value in enumerate(get_InputValues(plan), 1):
+            row["parameter_%d" % number] = str(value)
+
+        rows.append(row)
+
+    return rows
+
+
+def bench_calculateBatch(benchmark, engine):
+    """One calculateBatch call over arrays of ARRAY_SIZE inputs for the first calculation of the catalog"""
+
+    plan = engine.get_Plan(engine.catalog.calculations[0]["displayName"])
+    inputValues = [np.full(ARRAY_SIZE, value) for value in get_InputValues(plan)]
+    results, errors = benchmark(calculateBatch, engine, plan.displayName, inputValues)
+    benchmark.extra_info["elements"] = ARRAY_SIZE
+
+    assert not errors
+
+
+def bench_evaluateChunk(benchmark, engine):
+    """ROW_COUNT job rows spread over the catalog, grouped by calculation and evaluated group by group"""
+
+    rows = get_Rows(engine, ROW_COUNT)
+    results, errors = benchmark(evaluateChunk, engine, rows)
+    benchmark.extra_info["rows"] = ROW_COUNT
+
+    assert not any(errors)
+
+
+def bench_runBatchFile(benchmark, engine, tmp_path):
+    """A CSV batch file of ROW_COUNT jobs, read, evaluated and written"""
+
+    rows = get_Rows(engine, ROW_COUNT)
+    columns = ["calculation"] + ["parameter_%d" % number for number in range(1, 6)]
+    inputPath = str(tmp_path / "jobs.csv")
+    outputPath = str(tmp_path / "results.csv")
+
+    with open(inputPath, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    summary = benchmark.pedantic(runBatchFile, (engine, inputPath, outputPath), rounds=5)
+    benchmark.extra_info["rows"] = ROW_COUNT
+
+    assert summary.rows == ROW_COUNT and summary.errors == 0
@@ -0,0 +1,55 @@
+"""Per-evaluation cost: unit scaling, the calculation and output scaling, with and without the result cache."""
+
+import itertools
+
+from conftest import get_InputValues
+
+from ElectricalEngineeringCalculator.catalog import Catalog
+from ElectricalEngineeringCalculator.engine import CalculationEngine
+
+
+def get_Jobs(engine):
+    """One calculate() argument tuple per calculation of the catalog, in the catalog's default unit scales"""
+
+    jobs = []
+
+    for displayName in engine.catalog.displayNames:
+        plan = engine.get_Plan(displayName)
+        inputValues = get_InputValues(plan)
+        jobs.append((displayName, inputValues, plan.inputUnitScales[:len(inputValues)], plan.outputUnitScale))
+
+    return jobs
+
+
+def bench_calculate(benchmark, engine):
+    """CalculationEngine.calculate cycling through every calculation, through the result cache"""
+
+    jobs = itertools.cycle(get_Jobs(engine))
+    benchmark(lambda: engine.calculate(*next(jobs)))
+
+
+def bench_calculateUncached(benchmark, calculations):
+    """CalculationEngine.calculate cycling through every calculation, calling the function every time"""
+
+    engine = CalculationEngine(Catalog(calculations), cacheSize=0)
+    jobs = itertools.cycle(get_Jobs(engine))
+    benchmark(lambda: engine.calculate(*next(jobs)))
+
+
+def bench_calculateClick(benchmark, qapp, window):
+    """A Calculate click, from reading the inputs to the result on the LCD, through the CalculationRunner"""
+
+    window.cmbCalculationSelect.setCurrentIndex(1)
+
+    for txtParameter, value in zip(window.parameterPanel.txtParameters, get_InputValues(
+            window.engine.get_Plan(window.displayName))):
+        txtParameter.setText(str(value))
+
+    def click():
+        window.cmdCalculate_Click()
+        window.calculationRunner.waitForDone()
+        qapp.processEvents()
+
+    benchmark(click)
+
+    assert window.lcdOutput.value() != 0 and not window.lblErrorDisplay.isVisible()
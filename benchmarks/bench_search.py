@@ -0,0 +1,58 @@
+"""Type-to-search: building the SearchIndex, queries against it, and one keystroke in the search box."""
+
+import itertools
+
+import pytest
+
+from ElectricalEngineeringCalculator.calculationsearch import MAX_MATCHES
+from ElectricalEngineeringCalculator.catalog import Catalog
+from ElectricalEngineeringCalculator.searchindex import SearchIndex
+
+QUERIES = ("r", "res", "resistance", "par res", "cap freq react", "zzz")
+
+
+@pytest.fixture(scope="session")
+def searchIndex(calculations):
+    return SearchIndex(Catalog(calculations))
+
+
+def bench_searchIndexBuild(benchmark, calculations):
+    """SearchIndex over the whole catalog, as built on the first keystroke"""
+
+    catalog = Catalog(calculations)
+    benchmark(SearchIndex, catalog)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def bench_search(benchmark, searchIndex, query):
+    """One query for the matches the popup lists"""
+
+    benchmark(searchIndex.search, query, MAX_MATCHES)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def bench_searchLinearScan(benchmark, calculations, query):
+    """For comparison: the substring filter over the name, parameters and description of every calculation"""
+
+    texts = [(calculation["displayName"], " ".join((calculation["displayName"], calculation["outputName"],
+                                                   calculation["methodName"], calculation["description"],
+                                                   " ".join(calculation["parameters"].values()))).lower())
+             for calculation in calculations]
+    words = query.split()
+
+    benchmark(lambda: [displayName for displayName, text in texts if all(word in text for word in words)])
+
+
+def bench_searchKeystroke(benchmark, qapp, window):
+    """A keystroke in the search box: the query, the result model update and the popup repaint"""
+
+    texts = itertools.cycle(("v", "vo", "vol", "volt", "volt p", "volt po", "volt pow"))
+
+    def type():
+        window.txtCalculationSearch.setText(next(texts))
+        window.txtCalculationSearch.textEdited.emit(window.txtCalculationSearch.text())
+        qapp.processEvents()
+
+    benchmark(type)
+
+    assert window.txtCalculationSearch.resultModel.matches
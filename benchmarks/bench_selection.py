@@ -0,0 +1,30 @@
+"""Selection latency: cmbCalculationSelect_Change and the repaint it causes, per synthetic catalog size."""
+
+import itertools
+
+
+def nextIndexes(window):
+    """Cycles through every calculation of the selector, skipping the placeholder at index 0"""
+
+    return itertools.cycle(range(1, window.cmbCalculationSelect.count()))
+
+
+def bench_selectionChange(benchmark, window):
+    """The handler alone: the widget updates of one selection change"""
+
+    indexes = nextIndexes(window)
+    benchmark(lambda: window.cmbCalculationSelect.setCurrentIndex(next(indexes)))
+
+    assert window.displayName is not None
+
+
+def bench_selectionChangeRepaint(benchmark, qapp, window):
+    """The handler and the repaint and relayout that follow it"""
+
+    indexes = nextIndexes(window)
+
+    def select():
+        window.cmbCalculationSelect.setCurrentIndex(next(indexes))
+        qapp.processEvents()
+
+    benchmark(select)
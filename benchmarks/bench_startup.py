@@ -0,0 +1,51 @@
+"""Cold and warm start: catalog load and main window construction, per synthetic catalog size."""
+
+from conftest import closeWindow
+
+from ElectricalEngineeringCalculator.catalog import Catalog, loadCalculations, loadCalculationsCached
+from ElectricalEngineeringCalculator.engine import CalculationEngine
+
+
+def bench_parseCatalog(benchmark, catalogPath):
+    """The XML parse a cold start makes when the catalog cache is stale"""
+
+    calculations = benchmark(loadCalculations, catalogPath)
+
+    assert calculations
+
+
+def bench_loadCatalogCached(benchmark, catalogPath, tmp_path):
+    """The catalog cache read a warm start makes instead of the parse"""
+
+    cacheDirectory = str(tmp_path)
+    loadCalculationsCached(catalogPath, cacheDirectory)
+
+    assert benchmark(loadCalculationsCached, catalogPath, cacheDirectory)
+
+
+def bench_buildEngine(benchmark, calculations):
+    """Indexing the catalog and precompiling the call plan of every calculation"""
+
+    engine = benchmark(lambda: CalculationEngine(Catalog(calculations)))
+
+    assert len(engine.plans) == len(calculations)
+
+
+def bench_coldStart(benchmark, qapp, monkeypatch, catalogPath):
+    """init_UI from XML parse to the first paint of the shown window"""
+
+    from ElectricalEngineeringCalculator import eecalc
+
+    monkeypatch.setattr(eecalc, "loadCalculationsCached", lambda: loadCalculations(catalogPath))
+    windows = []
+
+    def start():
+        window = eecalc.App()
+        window.show()
+        qapp.processEvents()
+        windows.append(window)
+
+    benchmark.pedantic(start, rounds=5, warmup_rounds=1)
+
+    for window in windows:
+        closeWindow(qapp, window)
@@ -0,0 +1,58 @@
+"""Startup timing report for loading the calculation catalog.
+
+Each measurement runs in a fresh interpreter so that module import cost is included, just as it
+is when the application starts. Compares parsing calculations.xml on every launch with loading the parsed catalog
+cache.
+
+Usage:
+    python benchmarks/catalog_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SRC_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+TIMED_LOAD = """
+import time
+start = time.perf_counter()
+from ElectricalEngineeringCalculator import catalog
+catalog.{function}()
+print(time.perf_counter() - start)
+"""
+
+
+def timeLoad(function, cacheDirectory, runs):
+    environment = dict(os.environ, PYTHONPATH=SRC_DIRECTORY, XDG_CACHE_HOME=cacheDirectory)
+    timings = []
+
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", TIMED_LOAD.format(function=function)], env=environment,
+                                check=True, capture_output=True, text=True).stdout
+        timings.append(float(output))
+
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7, help="fresh interpreters per measurement (default 7)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cacheDirectory:
+        parsed = timeLoad("loadCalculations", cacheDirectory, args.runs)
+        timeLoad("loadCalculationsCached", cacheDirectory, 1)  # populate the cache
+        cached = timeLoad("loadCalculationsCached", cacheDirectory, args.runs)
+
+    print("Catalog load including imports (median of %d fresh interpreters)" % args.runs)
+    print("  parse calculations.xml : %8.2f ms" % (parsed * 1000))
+    print("  parsed catalog cache   : %8.2f ms" % (cached * 1000))
+    print("  saving                 : %8.2f ms (%.1fx faster)" % ((parsed - cached) * 1000, parsed / cached))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Fixtures of the pytest-benchmark suite: a headless QApplication and synthetic catalogs of 10, 1k and 10k formulas.
+
+A synthetic catalog repeats the calculations of the bundled calculations.xml under numbered displayNames, so every
+formula resolves to a real ElectronicsCalculator function and evaluates like the real one. Calculations that fail
+on the inputs the suite uses are left out, so the throughput benchmarks measure evaluation rather than error paths.
+Each catalog is also written as XML, for the benchmarks that parse it.
+"""
+
+import os
+import sys
+from xml.etree import ElementTree
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from ElectricalEngineeringCalculator.catalog import CALCULATIONS_PATH, Catalog, loadCalculations  # noqa: E402
+from ElectricalEngineeringCalculator.engine import CalculationEngine  # noqa: E402
+
+CATALOG_SIZES = (10, 1000, 10000)
+INPUT_VALUES = (0.5, 0.25, 0.2, 0.1, 0.05)  # Valid for every bundled calculation the suite keeps
+
+
+def get_InputValues(plan):
+    """Returns the inputs the suite passes to a calculation: one per parameter, or one per tuple slot"""
+
+    return INPUT_VALUES[:len(plan.inputUnitScales) if plan.tupleMode else plan.arity]
+
+
+def get_WorkingCalculations():
+    """Returns the displayNames of the bundled calculations that evaluate INPUT_VALUES without an error"""
+
+    engine = CalculationEngine(cacheSize=0)
+    working = set()
+
+    for calculation in engine.catalog:
+        plan = engine.get_Plan(calculation["displayName"])
+
+        try:
+            engine.calculate(plan.displayName, get_InputValues(plan))
+        except Exception:
+            continue
+
+        working.add(plan.displayName)
+
+    return working
+
+
+def writeSyntheticCatalog(path, count):
+    """Writes a catalog XML file of count calculations, cycling through the working bundled calculations"""
+
+    working = get_WorkingCalculations()
+    templates = [element for element in ElementTree.parse(CALCULATIONS_PATH).getroot()
+                 if element.get("displayName") in working]
+    root = ElementTree.Element("calculations")
+
+    for index in range(count):
+        template = templates[index % len(templates)]
+        element = ElementTree.SubElement(root, "calculation", dict(template.attrib))
+        element.set("displayName", "%s #%05d" % (template.get("displayName"), index))
+        element.extend(list(template))
+
+    ElementTree.ElementTree(root).write(path, encoding="UTF-8", xml_declaration=True)
+
+
+@pytest.fixture(scope="session", params=CATALOG_SIZES, ids=lambda count: "%d_formulas" % count)
+def catalogPath(request, tmp_path_factory):
+    """Path of a synthetic catalog XML file, once per catalog size"""
+
+    path = str(tmp_path_factory.mktemp("catalogs") / ("calculations_%d.xml" % request.param))
+    writeSyntheticCatalog(path, request.param)
+
+    return path
+
+
+@pytest.fixture(scope="session")
+def calculations(catalogPath):
+    return loadCalculations(catalogPath)
+
+
+@pytest.fixture(scope="session")
+def engine(calculations):
+    return CalculationEngine(Catalog(calculations))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt5.QtWidgets import QApplication
+
+    from ElectricalEngineeringCalculator.eecalc import StyleSheet
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyleSheet(StyleSheet)
+
+    return app
+
+
+@pytest.fixture
+def useCatalog(monkeypatch, calculations):
+    """Makes App load the synthetic catalog instead of the bundled one"""
+
+    from ElectricalEngineeringCalculator import eecalc
+
+    monkeypatch.setattr(eecalc, "loadCalculationsCached", lambda: calculations)
+
+
+@pytest.fixture
+def window(qapp, useCatalog):
+    """A shown main window over the synthetic catalog"""
+
+    from ElectricalEngineeringCalculator.eecalc import App
+
+    window = App()
+    window.show()
+    qapp.processEvents()
+    yield window
+    closeWindow(qapp, window)
+
+
+def closeWindow(qapp, window):
+    window.calculationRunner.waitForDone()
+    window.formulaImages.waitForPrefetch()
+    window.close()
+    window.deleteLater()
+    qapp.processEvents()
@@ -0,0 +1,61 @@
+"""Cost of showing a formula image: decoding the PNG on every selection versus FormulaImageCache.
+
+"Before" is what cmbCalculationSelect_Change used to do, QPixmap(path) from disk for every selection. "After" is
+FormulaImageCache.get_Pixmap once the cache is warm. Both cycle through every formula image in the bundled catalog,
+forwards and back. Runs headless.
+
+Usage:
+    python benchmarks/formula_images.py [--passes N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from PyQt5.QtGui import QPixmap  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from ElectricalEngineeringCalculator.catalog import loadCalculationsCached  # noqa: E402
+from ElectricalEngineeringCalculator.formulaimages import FormulaImageCache  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--passes", type=int, default=20, help="passes over the catalog (default 20)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)  # noqa: F841 - QPixmap needs an application
+    imageNames = [calculation["formulaImage"] for calculation in loadCalculationsCached()]
+    sequence = (imageNames + imageNames[::-1]) * args.passes
+
+    cache = FormulaImageCache()
+    start = time.perf_counter()
+
+    for imageName in sequence:
+        QPixmap(cache.get_ImagePath(imageName))
+
+    before = (time.perf_counter() - start) / len(sequence)
+
+    for imageName in imageNames:
+        cache.get_Pixmap(imageName)
+
+    warmReads = cache.diskReads
+    start = time.perf_counter()
+
+    for imageName in sequence:
+        cache.get_Pixmap(imageName)
+
+    after = (time.perf_counter() - start) / len(sequence)
+
+    print("%d selections over %d formula images" % (len(sequence), len(imageNames)))
+    print("  decode every time   %7.1f µs" % (before * 1e6))
+    print("  FormulaImageCache   %7.1f µs   %.0fx faster, %d disk reads after warm-up" %
+          (after * 1e6, before / after, cache.diskReads - warmReads))
+
+
+if __name__ == "__main__":
+    main()
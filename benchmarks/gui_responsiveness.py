@@ -0,0 +1,91 @@
+"""Event loop responsiveness while a slow calculation runs, on the GUI thread versus through CalculationRunner.
+
+A 16 ms QTimer stands in for 60 fps repaints. A calculation made artificially slow (a pure Python busy loop of
+--seconds, which holds the GIL just as a slow formula would) is started once directly on the GUI thread, as
+cmdCalculate_Click used to, and once through the CalculationRunner. The report is the longest gap between timer
+ticks and the share of 16 ms frames that were late. Runs headless.
+
+Usage:
+    python benchmarks/gui_responsiveness.py [--seconds S]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from PyQt5.QtCore import QEventLoop, QTimer  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from ElectricalEngineeringCalculator.calculationrunner import CalculationRunner  # noqa: E402
+from ElectricalEngineeringCalculator.engine import CalculationEngine  # noqa: E402
+
+FRAME = 0.016
+
+
+class SlowEngine(CalculationEngine):
+    def __init__(self, seconds):
+        super().__init__(cacheSize=0)
+        self.seconds = seconds
+
+    def calculate(self, *arguments):
+        end = time.perf_counter() + self.seconds
+
+        while time.perf_counter() < end:
+            pass
+
+        return super().calculate(*arguments)
+
+
+def measureFrames(app, startJob, seconds):
+    """Runs the event loop for seconds plus a margin with a 16 ms timer, returning the gaps between its ticks"""
+
+    gaps = []
+    last = [time.perf_counter()]
+
+    def tick():
+        now = time.perf_counter()
+        gaps.append(now - last[0])
+        last[0] = now
+
+    timer = QTimer()
+    timer.timeout.connect(tick)
+    timer.start(int(FRAME * 1000))
+    QTimer.singleShot(50, startJob)
+    loop = QEventLoop()
+    QTimer.singleShot(int((seconds + 0.3) * 1000), loop.quit)
+    loop.exec_()
+    timer.stop()
+
+    return gaps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="duration of the slow calculation (default 1)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    engine = SlowEngine(args.seconds)
+    runner = CalculationRunner(engine)
+    results = []
+    runner.calculationFinished.connect(results.append)
+    job = ("voltage_ir", [2.0, 3.0])
+
+    print("%.1f s calculation, 16 ms timer" % args.seconds)
+
+    for label, startJob in (("GUI thread", lambda: results.append(engine.calculate(*job))),
+                            ("CalculationRunner", lambda: runner.submit(*job))):
+        gaps = measureFrames(app, startJob, args.seconds)
+        late = sum(1 for gap in gaps if gap > FRAME * 1.5)
+        print("  %-18s longest gap %7.1f ms   %3d of %3d frames late" % (label, max(gaps) * 1000, late, len(gaps)))
+
+    runner.waitForDone()
+    assert results == [6.0, 6.0], results
+
+
+if __name__ == "__main__":
+    main()
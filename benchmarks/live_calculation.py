@@ -0,0 +1,92 @@
+"""Keystroke latency and evaluation count of live calculation, measured headless.
+
+With live calculation on, a value is typed into the first parameter of "Current from Voltage and Resistance" one key
+at a time through QTest, --interval ms apart, as a burst of typing would. Each keystroke's handling (the text box
+edit, its validation and the restart of the debounce timer) is timed, and the calculations that reach the
+CalculationRunner are counted, with the debounce timer and with a zero delay that evaluates after every keystroke.
+Typing a non-numeric value checks that nothing is evaluated for it.
+
+Usage:
+    python benchmarks/live_calculation.py [--interval MS] [--text TEXT]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from PyQt5.QtCore import QEventLoop, QTimer  # noqa: E402
+from PyQt5.QtTest import QTest  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from ElectricalEngineeringCalculator.eecalc import LIVE_CALCULATION_DELAY, App, StyleSheet  # noqa: E402
+
+FRAME = 0.016
+CALCULATION = "Current from Voltage and Resistance"
+
+
+def wait(app, msecs):
+    loop = QEventLoop()
+    QTimer.singleShot(msecs, loop.quit)
+    loop.exec_()
+
+
+def typeBurst(app, window, text, interval):
+    """Types text into the first parameter a key at a time, returning the keystroke timings and evaluation count"""
+
+    submitted = []
+    submit = window.calculationRunner.submit
+    window.calculationRunner.submit = lambda *arguments: submitted.append(arguments) or submit(*arguments)
+    txtParameter = window.parameterPanel.txtParameters[0]
+    timings = []
+
+    for key in text:
+        start = time.perf_counter()
+        QTest.keyClicks(txtParameter, key)
+        timings.append(time.perf_counter() - start)
+        wait(app, interval)
+
+    wait(app, LIVE_CALCULATION_DELAY * 2)
+    window.calculationRunner.waitForDone()
+    app.processEvents()
+    del window.calculationRunner.submit
+
+    return timings, len(submitted)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interval", type=int, default=40, help="ms between keystrokes (default 40)")
+    parser.add_argument("--text", default="1234.5678", help="value typed (default 1234.5678)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(StyleSheet)
+    window = App()
+    window.show()
+    window.menuLiveCalculation_Toggled(True)
+    window.cmbCalculationSelect.setCurrentIndex(window.listDisplayNames.index(CALCULATION) + 1)
+    window.parameterPanel.txtParameters[1].setText("2")
+    app.processEvents()
+
+    print("%d keystrokes %d ms apart, %d ms debounce" % (len(args.text), args.interval, LIVE_CALCULATION_DELAY))
+
+    for label, delay, text in (("debounced", LIVE_CALCULATION_DELAY, args.text), ("no debounce", 0, args.text),
+                               ("non-numeric", LIVE_CALCULATION_DELAY, args.text + "x")):
+        window.tmrLiveCalculation.setInterval(delay)
+        window.parameterPanel.txtParameters[0].clear()
+        wait(app, LIVE_CALCULATION_DELAY * 2)
+        timings, evaluations = typeBurst(app, window, text, args.interval)
+        timings.sort()
+        print("  %-12s keystroke mean %6.1f µs   max %6.1f µs   %2d evaluations   LCD %s" % (
+            label, sum(timings) / len(timings) * 1e6, timings[-1] * 1e6, evaluations, window.lcdOutput.value()))
+        assert timings[-1] < FRAME, "a keystroke took longer than a frame"
+
+    window.tmrLiveCalculation.setInterval(LIVE_CALCULATION_DELAY)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Load test of the HTTP/JSON calculation server: latency percentiles and throughput against localhost.
+
+Starts `python -m ElectricalEngineeringCalculator serve` on a free port (or uses a running server given with --port)
+and keeps --connections keep-alive connections busy for --duration seconds per scenario, each sending its next
+request as soon as the previous answer arrives. The scenarios are single jobs, batches of --batch-size jobs, and
+GET /calculations. The report gives requests/s, jobs/s and the p50/p99/max latency of each.
+
+Usage:
+    python benchmarks/loadtest_server.py [--connections N] [--duration S] [--batch-size N] [--workers N] [--port P]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+JOB_TEMPLATES = (
+    ("current_er", ("VOLTS", "KILOHMS"), "MILLIAMPERES"),
+    ("voltage_divider_r", ("VOLTS", "KILOHMS", "KILOHMS"), "VOLTS"),
+    ("reactance_capacitive_fc", ("NANOFARADS", "KILOHERTZ"), "OHMS"),
+    ("power_ie", ("MILLIAMPERES", "VOLTS"), "MILLIWATTS"),
+)
+
+
+def makeJob(rng):
+    calculation, inputUnitScales, outputUnitScale = rng.choice(JOB_TEMPLATES)
+
+    return {"calculation": calculation, "inputValues": [rng.uniform(0.1, 100) for _ in inputUnitScales],
+            "inputUnitScales": list(inputUnitScales), "outputUnitScale": outputUnitScale}
+
+
+def makeRequest(method, path, body=None):
+    body = json.dumps(body).encode("utf-8") if body is not None else b""
+
+    return b"%s %s HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s" % (
+        method.encode("ascii"), path.encode("ascii"), len(body), body)
+
+
+async def runConnection(host, port, requests, deadline, latencies, failures):
+    """Sends requests over one keep-alive connection, cycling through them, until the deadline"""
+
+    reader, writer = await asyncio.open_connection(host, port)
+    index = 0
+
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        writer.write(requests[index % len(requests)])
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(head.split(b"Content-Length: ", 1)[1].split(b"\r\n", 1)[0])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+
+        if not head.startswith(b"HTTP/1.1 200"):
+            failures.append(head.split(b"\r\n", 1)[0])
+
+        index += 1
+
+    writer.close()
+
+
+async def runScenario(host, port, requests, connections, duration):
+    latencies = []
+    failures = []
+    start = time.perf_counter()
+    await asyncio.gather(*[runConnection(host, port, requests[offset::connections] or requests,
+                                         start + duration, latencies, failures)
+                           for offset in range(connections)])
+
+    return latencies, failures, time.perf_counter() - start
+
+
+def get_FreePort():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def startServer(port, workers):
+    environment = dict(os.environ, PYTHONPATH=SOURCE_DIRECTORY + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    server = subprocess.Popen([sys.executable, "-m", "ElectricalEngineeringCalculator", "serve", "--port", str(port),
+                               "--workers", str(workers)], env=environment, stderr=subprocess.PIPE, text=True)
+    print(server.stderr.readline().strip())  # "Serving ...", written once the server listens
+
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=16, help="concurrent connections (default 16)")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per scenario (default 5)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="jobs per batch request (default 1000)")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes of the started server "
+                                                               "(default 0: one per core)")
+    parser.add_argument("--port", type=int, default=None, help="port of a running server; one is started if omitted")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    port = args.port or get_FreePort()
+    server = startServer(port, args.workers) if args.port is None else None
+    scenarios = (
+        ("single job", 1, [makeRequest("POST", "/calculate", makeJob(rng)) for _ in range(1000)]),
+        ("batch", args.batch_size, [makeRequest("POST", "/calculate",
+                                                {"jobs": [makeJob(rng) for _ in range(args.batch_size)]})
+                                    for _ in range(20)]),
+        ("catalog", 0, [makeRequest("GET", "/calculations")]),
+    )
+
+    try:
+        print("%d connections, %.0f s per scenario" % (args.connections, args.duration))
+
+        for label, jobsPerRequest, requests in scenarios:
+            latencies, failures, seconds = asyncio.run(runScenario("127.0.0.1", port, requests, args.connections,
+                                                                   args.duration))
+            latencies.sort()
+            print("  %-12s %8.0f requests/s %10.0f jobs/s   p50 %7.2f ms   p99 %7.2f ms   max %7.2f ms   %d failed" % (
+                label, len(latencies) / seconds, len(latencies) * jobsPerRequest / seconds,
+                latencies[len(latencies) // 2] * 1000, latencies[int(len(latencies) * 0.99)] * 1000,
+                latencies[-1] * 1000, len(failures)))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
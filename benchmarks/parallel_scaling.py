@@ -0,0 +1,60 @@
+"""Scaling of ParallelEvaluator from 1 to N worker processes.
+
+Evaluates an impedance grid (impedance_rcl over resistance x capacitive reactance x inductive reactance) with
+ParallelEvaluator.calculateBatch. impedance_rcl calls math.sqrt, so it cannot take whole arrays and every point is a
+Python call: the CPU-bound case that benefits from more cores. The in-process calculateBatch is the baseline.
+
+Usage:
+    python benchmarks/parallel_scaling.py [--points N] [--max-workers N] [--chunk-size N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from ElectricalEngineeringCalculator.batch import calculateBatch  # noqa: E402
+from ElectricalEngineeringCalculator.engine import CalculationEngine  # noqa: E402
+from ElectricalEngineeringCalculator.parallel import DEFAULT_CHUNK_SIZE, ParallelEvaluator  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=1000000, help="grid points (default 1M)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="default: CPU cores")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    engine = CalculationEngine()
+    side = round(args.points ** (1 / 3))
+    resistance, capacitiveReactance, inductiveReactance = np.meshgrid(np.linspace(1, 1000, side),
+                                                                      np.linspace(0, 500, side),
+                                                                      np.linspace(0, 500, side), indexing="ij")
+    inputValues = [resistance, capacitiveReactance, inductiveReactance]
+    points = resistance.size
+
+    start = time.perf_counter()
+    reference, _ = calculateBatch(engine, "impedance_rcl", inputValues)
+    baseline = time.perf_counter() - start
+
+    print("impedance_rcl over %d points, chunks of %d" % (points, args.chunk_size))
+    print("  in-process   %8.2f s  %10.0f points/s" % (baseline, points / baseline))
+
+    for workers in range(1, args.max_workers + 1):
+        with ParallelEvaluator(engine, workers, args.chunk_size) as evaluator:
+            evaluator.calculateBatch("impedance_rcl", [1.0, 1.0, 1.0])  # start the workers outside the timing
+            start = time.perf_counter()
+            results, _ = evaluator.calculateBatch("impedance_rcl", inputValues)
+            elapsed = time.perf_counter() - start
+
+        assert np.array_equal(results, reference, equal_nan=True)
+        print("  %2d worker%s   %8.2f s  %10.0f points/s  %5.2fx" % (workers, " " if workers == 1 else "s", elapsed,
+                                                                     points / elapsed, baseline / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Batch evaluation with and without the persistent result cache, on a design table evaluated twice.
+
+The table holds --rows jobs in chunks of 10000, either spread over every calculation of the catalog or only over the
+calculations that cannot take arrays and are evaluated one element at a time when the array kernels are off. Each
+chunk is evaluated with evaluateChunk without a cache, then with an empty PersistentCache (every group a miss, then
+written), then again (every group a hit). The results must not change. A whole batch file run with a warm cache is
+timed as well, since reading and parsing the rows cost the same either way.
+
+Usage:
+    python benchmarks/persistent_cache.py [--rows N]
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np  # noqa: E402
+
+from ElectricalEngineeringCalculator import batch  # noqa: E402
+from ElectricalEngineeringCalculator.engine import CalculationEngine  # noqa: E402
+from ElectricalEngineeringCalculator.persistentcache import PersistentCache  # noqa: E402
+from ElectricalEngineeringCalculator.runner import evaluateChunk, runBatchFile  # noqa: E402
+
+CHUNK_SIZE = 10000
+INPUT_VALUES = (0.5, 0.25, 0.2, 0.1, 0.05)
+
+
+def get_ScalarOnlyNames(engine):
+    """displayNames of the calculations that batch.calculateBatch evaluates one element at a time"""
+
+    for displayName in engine.catalog.displayNames:
+        plan = engine.get_Plan(displayName)
+        batch.calculateBatch(engine, displayName, [[value] * 2 for value in INPUT_VALUES[:len(plan.inputUnitScales)]])
+
+    return [displayName for displayName in engine.catalog.displayNames
+            if engine.get_Plan(displayName).methodName in batch._scalarOnlyMethods]
+
+
+def get_Rows(engine, displayNames, count):
+    rng = random.Random(1)
+    rows = []
+
+    for _ in range(count):
+        plan = engine.get_Plan(rng.choice(displayNames))
+        row = {"calculation": plan.displayName}
+
+        for number in range(1, len(plan.inputUnitScales) + 1):
+            row["parameter_%d" % number] = str(rng.choice(INPUT_VALUES) * rng.randint(1, 50))
+
+        rows.append(row)
+
+    return rows
+
+
+def timeChunks(engine, chunks):
+    start = time.perf_counter()
+    outcomes = [evaluateChunk(engine, rows) for rows in chunks]
+
+    return time.perf_counter() - start, outcomes
+
+
+def is_SameOutcomes(outcomes, expected):
+    return all(np.array_equal(results, expectedResults, equal_nan=True) and errors == expectedErrors
+               for (results, errors), (expectedResults, expectedErrors) in zip(outcomes, expected))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000, help="jobs in the design table (default 200000)")
+    args = parser.parse_args()
+
+    engine = CalculationEngine(cacheSize=0)
+    libraryEngine = CalculationEngine(engine.catalog, cacheSize=0, useKernels=False)
+    tables = (("every calculation", engine, engine.catalog.displayNames),
+              ("one element at a time, without kernels", libraryEngine, get_ScalarOnlyNames(libraryEngine)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        print("evaluateChunk over %d jobs in chunks of %d (s)      no cache      cold      warm   speed-up" % (
+            args.rows, CHUNK_SIZE))
+
+        for label, tableEngine, displayNames in tables:
+            rows = get_Rows(engine, displayNames, args.rows)
+            chunks = [rows[offset:offset + CHUNK_SIZE] for offset in range(0, len(rows), CHUNK_SIZE)]
+            uncached, expected = timeChunks(tableEngine, chunks)
+
+            with PersistentCache(os.path.join(directory, "%s.sqlite" % len(displayNames))) as persistentCache:
+                cachedEngine = CalculationEngine(engine.catalog, cacheSize=0, persistentCache=persistentCache,
+                                                 useKernels=tableEngine.useKernels)
+                cold, coldOutcomes = timeChunks(cachedEngine, chunks)
+                warm, warmOutcomes = timeChunks(cachedEngine, chunks)
+                stats = persistentCache.get_Stats()
+
+            assert is_SameOutcomes(coldOutcomes, expected) and is_SameOutcomes(warmOutcomes, expected), \
+                "the cache changed a result"
+            print("  %-45s %9.3f %9.3f %9.3f %9.1fx" % (label, uncached, cold, warm, uncached / warm))
+            print("  %-45s %s" % ("", stats))
+
+        inputPath = os.path.join(directory, "jobs.csv")
+        rows = get_Rows(engine, engine.catalog.displayNames, args.rows)
+
+        with open(inputPath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, ["calculation"] + ["parameter_%d" % number for number in range(1, 6)])
+            writer.writeheader()
+            writer.writerows(rows)
+
+        print("Batch file of %d jobs, every calculation (s)" % args.rows)
+        summary = runBatchFile(engine, inputPath, os.path.join(directory, "results.csv"), CHUNK_SIZE)
+        print("  %-45s %9.3f" % ("no cache", summary.seconds))
+
+        with PersistentCache(os.path.join(directory, "file.sqlite")) as persistentCache:
+            cachedEngine = CalculationEngine(engine.catalog, cacheSize=0, persistentCache=persistentCache)
+            runBatchFile(cachedEngine, inputPath, os.path.join(directory, "results.csv"), CHUNK_SIZE)
+            summary = runBatchFile(cachedEngine, inputPath, os.path.join(directory, "results.csv"), CHUNK_SIZE)
+            print("  %-45s %9.3f" % ("warm cache", summary.seconds))
+
+
+if __name__ == "__main__":
+    main()
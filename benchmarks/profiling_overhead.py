@@ -0,0 +1,78 @@
+"""Cost of the stage timing instrumentation, with profiling off and on.
+
+Each mode runs in a fresh interpreter, since EECALC_PROFILE is read when the GUI modules are imported. Times a timed()
+no-op call, a selection change (cmbCalculationSelect_Change and the formula image it shows) and a Calculate click
+through the CalculationRunner, so the per-call overhead can be read off the difference between the modes.
+
+Usage:
+    python benchmarks/profiling_overhead.py [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+SRC_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+TIMED_SESSION = """
+import itertools, json, sys, time
+from PyQt5.QtWidgets import QApplication
+from ElectricalEngineeringCalculator import profiling
+from ElectricalEngineeringCalculator.eecalc import App
+
+repeat = {repeat}
+
+def perCall(function, count):
+    start = time.perf_counter_ns()
+    for _ in range(count):
+        function()
+    return (time.perf_counter_ns() - start) / count / 1000
+
+noop = profiling.timed(lambda: None)
+app = QApplication(sys.argv)
+window = App()
+indexes = itertools.cycle(range(1, window.cmbCalculationSelect.count()))
+select = lambda: window.cmbCalculationSelect.setCurrentIndex(next(indexes))
+perCall(select, window.cmbCalculationSelect.count())
+
+window.cmbCalculationSelect.setCurrentIndex(window.listDisplayNames.index("Current from Voltage and Resistance") + 1)
+window.parameterPanel.txtParameters[0].setText("5")
+window.parameterPanel.txtParameters[1].setText("2")
+
+def click():
+    window.cmdCalculate_Click()
+    window.calculationRunner.waitForDone()
+    app.processEvents()
+
+print(json.dumps({{"noop": perCall(noop, repeat * 100), "select": perCall(select, repeat),
+                  "click": perCall(click, repeat)}}))
+"""
+
+
+def timeSession(setting, repeat):
+    environment = dict(os.environ, PYTHONPATH=SRC_DIRECTORY, EECALC_PROFILE=setting)
+    environment.setdefault("QT_QPA_PLATFORM", "offscreen")
+    output = subprocess.run([sys.executable, "-c", TIMED_SESSION.format(repeat=repeat)], env=environment,
+                            check=True, capture_output=True, text=True).stdout
+
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000, help="selection changes and clicks timed (default 2000)")
+    args = parser.parse_args()
+
+    off = timeSession("0", args.repeat)
+    on = timeSession("1", args.repeat)
+
+    print("Per call (µs)                 off        on  overhead")
+
+    for key, label in (("noop", "timed() no-op"), ("select", "selection change"), ("click", "Calculate click")):
+        print("  %-22s %9.2f %9.2f %9.2f" % (label, off[key], on[key], on[key] - off[key]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Cost of an evaluation with and without the engine's LRU result cache.
+
+Three workloads:
+    repeat          the same voltage_divider_r inputs over and over, as when the GUI recalculates after a unit change
+    output units    the same inputs cycling through every output unit; each change only rescales the cached result
+    unique inputs   a different input every time, so every lookup misses and the cache is pure overhead
+
+voltage_divider_r is a few multiplies, about as cheap as the lookup itself, so this shows what the cache costs in
+the worst case rather than what it saves on a costly calculation.
+
+Usage:
+    python benchmarks/result_cache.py [--evaluations N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from ElectricalEngineeringCalculator.engine import CalculationEngine  # noqa: E402
+from ElectricalEngineeringCalculator.units import get_SiblingScales  # noqa: E402
+
+NAME = "voltage_divider_r"
+INPUT_UNIT_SCALES = ("VOLTS", "KILOHMS", "KILOHMS")
+
+
+def timeWorkload(engine, jobs):
+    start = time.perf_counter()
+
+    for inputValues, outputUnitScale in jobs:
+        engine.calculate(NAME, inputValues, INPUT_UNIT_SCALES, outputUnitScale)
+
+    return (time.perf_counter() - start) / len(jobs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--evaluations", type=int, default=100000, help="evaluations per workload (default 100k)")
+    args = parser.parse_args()
+
+    outputScales = list(get_SiblingScales("VOLTS"))
+    workloads = (
+        ("repeat", [((5.0, 4.7, 10.0), "VOLTS")] * args.evaluations),
+        ("output units", [((5.0, 4.7, 10.0), outputScales[count % len(outputScales)])
+                          for count in range(args.evaluations)]),
+        ("unique inputs", [((5.0, 4.7, 10.0 + count), "VOLTS") for count in range(args.evaluations)]),
+    )
+
+    uncached = CalculationEngine(cacheSize=0)
+    print("%d evaluations of %s per workload" % (args.evaluations, NAME))
+
+    for label, jobs in workloads:
+        cached = CalculationEngine()
+        before = timeWorkload(uncached, jobs)
+        after = timeWorkload(cached, jobs)
+
+        for inputValues, outputUnitScale in jobs[:100]:
+            assert (cached.calculate(NAME, inputValues, INPUT_UNIT_SCALES, outputUnitScale) ==
+                    uncached.calculate(NAME, inputValues, INPUT_UNIT_SCALES, outputUnitScale))
+
+        print("  %-14s no cache %6.2f µs   cache %6.2f µs   %5.2fx   %s" %
+              (label, before * 1e6, after * 1e6, before / after, cached.get_CacheStats()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Memory per point and speed of the columnar ResultStore against Python records, for a sweep of --points points.
+
+Each layout holds the swept input and the output of every point. The memory is what tracemalloc sees allocated while
+the layout is alive, so a store on disk counts only what it keeps in RAM, not the page cache behind its memory map:
+
+    dicts      one {"Frequency": x, "Reactance": y} dict per point, as records parsed one at a time are kept
+    lists      one list of Python floats per column
+    memory     a ResultStore filled by appending blocks of --block points
+    disk       a ResultStore on disk, filled the same way
+
+The store is then saved as .npy files, Arrow IPC and CSV, opened back memory-mapped, and reduced for plotting
+straight from the map.
+
+Usage:
+    python benchmarks/result_store.py [--points N] [--block N]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np  # noqa: E402
+import pyarrow.compute  # noqa: E402, F401  Imported up front, so the Arrow timings leave out the import
+
+from ElectricalEngineeringCalculator.resultstore import ResultStore  # noqa: E402
+from ElectricalEngineeringCalculator.sweep import downsampleMinMax  # noqa: E402
+
+COLUMNS = (("Frequency", "HERTZ"), ("Reactance", "OHMS"))
+PLOT_WIDTH = 780
+
+
+def get_Blocks(points, block):
+    """The sweep in blocks of points, as a batch or a long sweep produces them"""
+
+    for start in range(0, points, block):
+        x = 10 * 1e8 ** (np.arange(start, min(start + block, points)) / max(points - 1, 1))
+        yield x, 1 / (2 * np.pi * x * 100e-9)
+
+
+def measure(build):
+    """Builds a layout, returning it with the seconds taken and the bytes allocated for it"""
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    layout = build()
+    seconds = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return layout, seconds, size
+
+
+def build_Dicts(blocks):
+    return [{"Frequency": x, "Reactance": y} for xs, ys in blocks for x, y in zip(xs.tolist(), ys.tolist())]
+
+
+def build_Lists(blocks):
+    columns = ([], [])
+
+    for xs, ys in blocks:
+        columns[0].extend(xs.tolist())
+        columns[1].extend(ys.tolist())
+
+    return columns
+
+
+def build_Store(blocks, path=None):
+    store = ResultStore(COLUMNS, path)
+
+    for block in blocks:
+        store.append(block)
+
+    store.flush()
+
+    return store
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    value = function(*args)
+
+    return value, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=1000000, help="points in the sweep (default 1000000)")
+    parser.add_argument("--block", type=int, default=10000, help="points appended at a time (default 10000)")
+    args = parser.parse_args()
+
+    print("%d points of 2 columns, appended %d at a time" % (args.points, args.block))
+    print("  %-8s %12s %14s %12s" % ("layout", "build (ms)", "bytes/point", "MB"))
+
+    with tempfile.TemporaryDirectory() as directory:
+        layouts = (("dicts", build_Dicts), ("lists", build_Lists), ("memory", build_Store),
+                   ("disk", lambda blocks: build_Store(blocks, os.path.join(directory, "disk"))))
+
+        for label, build in layouts:
+            layout, seconds, size = measure(lambda: build(get_Blocks(args.points, args.block)))
+            print("  %-8s %12.1f %14.1f %12.1f" % (label, seconds * 1000, size / args.points, size / 1048576))
+
+            if label == "memory":
+                store = layout
+
+            del layout
+
+        x, y = store.get_Column(0), store.get_Column(1)
+        print("Read-only views: %s" % ("zero-copy" if np.shares_memory(x, store.buffers[0]) else "copied"))
+
+        for label, path in (("npy", os.path.join(directory, "store")), ("arrow", os.path.join(directory, "s.arrow")),
+                            ("csv", os.path.join(directory, "s.csv"))):
+            _, save = timed(store.save, path)
+
+            if label == "csv":
+                print("  %-8s save %8.1f ms" % (label, save * 1000))
+                continue
+
+            opened, openSeconds = timed(ResultStore.open, path)
+            xs, ys = opened.get_Column(0), opened.get_Column(1)
+            _, plot = timed(downsampleMinMax, xs, ys, PLOT_WIDTH)
+            assert np.array_equal(ys, y)
+            print("  %-8s save %8.1f ms, open %6.2f ms, plot reduction from the map %6.1f ms" % (
+                label, save * 1000, openSeconds * 1000, plot * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Time to solve a calculation for one of its inputs, for one target and for many at once.
+
+Solves "Capacitive Reactance from Frequency and Capacitance" for the frequency giving each of --targets reactances
+spread over six decades, with the capacitance fixed. The targets are solved:
+
+    vector     with one Solver.solve call for all of them, by a new Solver
+    loop       one Solver.solve call per target, each by a new Solver, for the first --loop targets
+    repeated   by the same Solver again, each target starting from its remembered bracket
+    warm       by the same Solver, for targets 0.1% off the ones it has solved, so each starts near its solution
+
+Every set of solutions is put back through the calculation, and the largest relative difference from the targets is
+reported beside the timing. The default keeps the targets within the HISTORY_TARGETS a Solver remembers; beyond it,
+the repeated targets only warm start.
+
+Usage:
+    python benchmarks/reverse_solver.py [--targets N] [--loop N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np  # noqa: E402
+
+from ElectricalEngineeringCalculator.batch import calculateBatch  # noqa: E402
+from ElectricalEngineeringCalculator.engine import CalculationEngine  # noqa: E402
+from ElectricalEngineeringCalculator.solver import Solver  # noqa: E402
+
+CALCULATION = "Capacitive Reactance from Frequency and Capacitance"
+CAPACITANCE = 100e-9
+
+
+def get_Error(engine, targets, solutions):
+    """Largest relative difference between the targets and the calculation's output at the solutions"""
+
+    results, errors = calculateBatch(engine, CALCULATION, [solutions, CAPACITANCE])
+    assert not errors
+
+    return float(np.max(np.abs(results - targets) / np.abs(targets)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", type=int, default=4000, help="targets solved at once (default 4000)")
+    parser.add_argument("--loop", type=int, default=200, help="targets solved one call each (default 200)")
+    args = parser.parse_args()
+
+    engine = CalculationEngine()
+    targets = np.logspace(-2, 4, args.targets)
+    solver = Solver(engine)
+    rows = []
+
+    for label, solve, count in (
+            ("vector", lambda: solver.solve(CALCULATION, 0, targets, [0, CAPACITANCE]), len(targets)),
+            ("loop", lambda: [Solver(engine).solve(CALCULATION, 0, [target], [0, CAPACITANCE])
+                              for target in targets[:args.loop]], min(args.loop, len(targets))),
+            ("repeated", lambda: solver.solve(CALCULATION, 0, targets, [0, CAPACITANCE]), len(targets)),
+            ("warm", lambda: solver.solve(CALCULATION, 0, targets * 1.001, [0, CAPACITANCE]), len(targets))):
+        start = time.perf_counter()
+        outcome = solve()
+        seconds = time.perf_counter() - start
+
+        if label == "loop":
+            solved = targets[:count]
+            solutions = np.concatenate([solutions for solutions, errors, stats in outcome])
+            stats = None
+        else:
+            solved = targets * 1.001 if label == "warm" else targets
+            solutions, errors, stats = outcome
+            assert not errors
+
+        rows.append((label, count, seconds, get_Error(engine, solved, solutions), stats))
+
+    print("Solving %s for the frequency, %d targets" % (CALCULATION, len(targets)))
+
+    for label, count, seconds, error, stats in rows:
+        print("  %-9s %7d targets %9.1f ms %8.2f us per target, max relative error %.1e" % (
+            label, count, seconds * 1000, seconds / count * 1e6, error))
+
+        if stats is not None:
+            print("            %s" % (stats,))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Per-evaluation overhead before and after the precomputed scale-factor table, over 100k evaluations.
+
+"Before" reproduces what App.calculate used to do for every click: resolve the scale_factors Enum class of each of the
+five inputs and the output by walking dir(scale_factors) (mapUnitToEnum), index the Enum, and convert with
+sf.scale_in / sf.scale_out, then find the function with getattr and inspect its signature. "After" is
+CalculationEngine.calculate, which looks the factors up in units.SCALE_FACTORS.
+
+Usage:
+    python benchmarks/scaling_overhead.py [--evaluations N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from inspect import signature
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import ElectronicsCalculator.electronics_calculator as ec  # noqa: E402
+import ElectronicsCalculator.scale_factors as sf  # noqa: E402
+
+from ElectricalEngineeringCalculator.engine import CalculationEngine  # noqa: E402
+from ElectricalEngineeringCalculator.units import get_ScaleFactor  # noqa: E402
+
+# Voltage divider: 5 V in, R1 = 4.7 kΩ, R2 = 10 kΩ, result in millivolts. Unused slots are scaled too, as before.
+INPUTS = [("Voltage", "VOLTS", 5.0), ("Resistance", "KILOHMS", 4.7), ("Resistance", "KILOHMS", 10.0),
+          ("Resistance", "OHMS", 0.0), ("Resistance", "OHMS", 0.0)]
+OUTPUT = ("Voltage", "MILLIVOLTS")
+
+
+def mapUnitToEnum(unitType):
+    """The lookup App.mapUnitToEnum used to do"""
+    scale = None
+
+    for moduleItem in dir(sf):
+        if unitType == moduleItem:
+            scale = getattr(sf, moduleItem)
+            break
+
+    return scale
+
+
+def scalingBefore():
+    parameters = [sf.scale_in(value, mapUnitToEnum(unitType)[unitScale]) for unitType, unitScale, value in INPUTS]
+    retval = ec.voltage_divider_r(*parameters[:3])
+
+    return sf.scale_out(retval, mapUnitToEnum(OUTPUT[0])[OUTPUT[1]])
+
+
+def scalingAfter():
+    parameters = [value * get_ScaleFactor(unitScale) for unitType, unitScale, value in INPUTS]
+    retval = ec.voltage_divider_r(*parameters[:3])
+
+    return retval / get_ScaleFactor(OUTPUT[1])
+
+
+def calculateBefore():
+    func = getattr(ec, "voltage_divider_r")
+    parameterCount = len(signature(func).parameters)
+
+    return scalingBefore() if parameterCount == 3 else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--evaluations", type=int, default=100000, help="evaluations per measurement (default 100k)")
+    args = parser.parse_args()
+
+    engine = CalculationEngine()
+    inputValues = [value for unitType, unitScale, value in INPUTS[:3]]
+    inputUnitScales = [unitScale for unitType, unitScale, value in INPUTS[:3]]
+
+    def calculateAfter():
+        return engine.calculate("voltage_divider_r", inputValues, inputUnitScales, OUTPUT[1])
+
+    assert scalingBefore() == scalingAfter() == calculateBefore() == calculateAfter()
+
+    print("%d evaluations of voltage_divider_r" % args.evaluations)
+
+    for label, before, after in (("unit scaling only", scalingBefore, scalingAfter),
+                                 ("full evaluation", calculateBefore, calculateAfter)):
+        timings = []
+
+        for function in (before, after):
+            start = time.perf_counter()
+
+            for _ in range(args.evaluations):
+                function()
+
+            timings.append((time.perf_counter() - start) / args.evaluations)
+
+        print("  %-18s before %7.2f µs   after %6.2f µs   %5.1fx faster" %
+              (label, timings[0] * 1e6, timings[1] * 1e6, timings[0] / timings[1]))
+
+
+if __name__ == "__main__":
+    main()
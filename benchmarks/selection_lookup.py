@@ -0,0 +1,83 @@
+"""Micro-benchmark of the calculation lookups made for one selection change in the GUI.
+
+A selection change reads seven fields of the selected calculation (description, formulaImage, methodName,
+outputUnitScale, outputName, parameters and outputUnitScale again). This compares the old linear scan of the
+calculation list per field with the Catalog's displayName index, on synthetic catalogs of increasing size.
+
+Usage:
+    python benchmarks/selection_lookup.py
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from ElectricalEngineeringCalculator.catalog import Catalog  # noqa: E402
+
+FIELDS = ("description", "formulaImage", "methodName", "outputUnitScale", "outputName", "parameters",
+          "outputUnitScale")
+
+
+def syntheticCalculations(count):
+    calculations = []
+
+    for index in range(count):
+        calculations.append({
+            "methodName": "power_er",
+            "displayName": "Synthetic Calculation %05d" % index,
+            "formulaImage": "power_er.png",
+            "description": "Synthetic calculation %d" % index,
+            "parameters": {"parameter_1": "Voltage", "inputUnitScale_1": "VOLTS",
+                           "parameter_2": "Resistance", "inputUnitScale_2": "OHMS"},
+            "outputName": "Power",
+            "outputUnitScale": "WATTS"
+        })
+
+    return calculations
+
+
+def linearScan(calculations, dataItem, displayName):
+    """The lookup App.get_Data used to do"""
+
+    retval = object
+
+    for calculation in calculations:
+        if calculation["displayName"] == displayName:
+            retval = calculation[dataItem]
+            break
+
+    return retval
+
+
+def main():
+    print("%8s  %16s  %16s  %8s" % ("formulas", "linear scan", "catalog index", "speedup"))
+
+    for count in (10, 1000, 10000):
+        calculations = syntheticCalculations(count)
+        catalog = Catalog(calculations)
+        selections = [random.choice(catalog.displayNames) for _ in range(1000)]
+
+        def selectLinear():
+            for displayName in selections:
+                for dataItem in FIELDS:
+                    linearScan(calculations, dataItem, displayName)
+
+        def selectIndexed():
+            for displayName in selections:
+                calculation = catalog.byDisplayName[displayName]
+
+                for dataItem in FIELDS:
+                    calculation[dataItem]
+
+        number = 1 if count >= 1000 else 20
+        linear = min(timeit.repeat(selectLinear, number=number, repeat=3)) / number / len(selections)
+        indexed = min(timeit.repeat(selectIndexed, number=20, repeat=3)) / 20 / len(selections)
+
+        print("%8d  %13.2f µs  %13.2f µs  %7.0fx" % (count, linear * 1e6, indexed * 1e6, linear / indexed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Time to switch the main window from one calculation to another, measured headless.
+
+Selects every calculation in the bundled catalog in turn, forwards and back, through cmbCalculationSelect, so each
+switch runs cmbCalculationSelect_Change with its widget updates ("handler"), then lets Qt repaint what changed
+("repaint"). Formula images are warmed first, so the timing is of the widgets only.
+
+Usage:
+    python benchmarks/selection_switching.py [--passes N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from ElectricalEngineeringCalculator.eecalc import App, StyleSheet  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--passes", type=int, default=10, help="passes over the catalog (default 10)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(StyleSheet)
+    window = App()
+    window.show()
+    count = window.cmbCalculationSelect.count()
+    indexes = list(range(1, count)) + list(range(count - 1, 0, -1))
+
+    for index in indexes:
+        window.cmbCalculationSelect.setCurrentIndex(index)
+
+    app.processEvents()
+    handlerTimings = []
+    paintTimings = []
+
+    for _ in range(args.passes):
+        for index in indexes:
+            start = time.perf_counter()
+            window.cmbCalculationSelect.setCurrentIndex(index)
+            handled = time.perf_counter()
+            app.processEvents()  # the repaint and relayout the switch causes
+            handlerTimings.append(handled - start)
+            paintTimings.append(time.perf_counter() - handled)
+
+    print("%d switches between %d calculations" % (len(handlerTimings), count - 1))
+
+    for label, timings in (("handler", handlerTimings), ("repaint", paintTimings),
+                           ("total", [handler + paint for handler, paint in zip(handlerTimings, paintTimings)])):
+        timings.sort()
+        print("  %-8s mean %7.1f µs   median %7.1f µs   p99 %7.1f µs" % (label, sum(timings) / len(timings) * 1e6,
+                                                                       timings[len(timings) // 2] * 1e6,
+                                                                       timings[int(len(timings) * 0.99)] * 1e6))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Time to first window and the import time behind it, measured with python -X importtime.
+
+Each run starts a fresh interpreter that imports eecalc, builds the window and shows it, and reports when the first
+paint is done. The -X importtime output of the run is split into PyQt5, which is a fixed cost, and the rest of the
+eecalc import: the application's own modules and the standard library modules they pull in. That remainder is
+checked against OWN_IMPORT_TARGET, which is half of what it was before imports were deferred. --src measures another
+tree, e.g. a checkout of an older commit, for comparison. Both are byte-compiled first, as an installed package is.
+
+Usage:
+    python benchmarks/startup_imports.py [--runs N] [--src DIR]
+"""
+
+import argparse
+import compileall
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+SRC_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+OWN_IMPORT_TARGET = 14.0  # ms; eecalc imported in 28 ms beside PyQt5 before imports were deferred
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+FIRST_WINDOW = """
+import sys, time
+from ElectricalEngineeringCalculator import eecalc
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv)
+app.setStyleSheet(eecalc.StyleSheet)
+window = eecalc.App()
+window.show()
+app.processEvents()
+print(time.time())
+"""
+
+
+def get_ImportTimes(importTimeOutput):
+    """
+    Reads the -X importtime report of a run.
+
+    Output:
+        eecalc [float] - Cumulative import time of eecalc in ms
+
+        pyqt [float] - Import time of the PyQt5 modules eecalc imports, in ms
+    """
+
+    eecalc = 0.0
+    pyqt = {}  # depth -> summed cumulative time of the PyQt5 modules imported at that depth
+
+    for line in importTimeOutput.splitlines():
+        match = IMPORT_LINE.match(line)
+
+        if match is None:
+            continue
+
+        cumulative, depth, name = int(match.group(2)) / 1000, len(match.group(3)), match.group(4)
+
+        if name == "ElectricalEngineeringCalculator.eecalc":
+            eecalc = cumulative
+        elif name == "PyQt5" or name.startswith("PyQt5."):
+            pyqt[depth] = pyqt.get(depth, 0.0) + cumulative
+
+    return eecalc, pyqt[min(pyqt)] if pyqt else 0.0
+
+
+def timeFirstWindow(srcDirectory):
+    environment = dict(os.environ, PYTHONPATH=srcDirectory)
+    environment.setdefault("QT_QPA_PLATFORM", "offscreen")
+    start = time.time()
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", FIRST_WINDOW], env=environment, check=True,
+                            capture_output=True, text=True)
+    painted = float(output.stdout.split()[-1])
+
+    return ((painted - start) * 1000,) + get_ImportTimes(output.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15, help="fresh interpreters measured (default 15)")
+    parser.add_argument("--src", default=SRC_DIRECTORY, help="src directory of the tree to measure")
+    args = parser.parse_args()
+
+    compileall.compile_dir(args.src, quiet=1)  # an installed package has its bytecode; do not time the compiler
+    timeFirstWindow(args.src)  # let the catalog cache and the OS file cache warm up
+    runs = [timeFirstWindow(args.src) for _ in range(args.runs)]
+    firstWindow, eecalc, pyqt = (statistics.median(column) for column in zip(*runs))
+    own = statistics.median(run[1] - run[2] for run in runs)
+
+    print("Startup, median of %d fresh interpreters (ms)" % args.runs)
+    print("  process start to first paint : %8.1f" % firstWindow)
+    print("  import eecalc                : %8.1f" % eecalc)
+    print("    of which PyQt5             : %8.1f" % pyqt)
+    print("    everything else            : %8.1f   (target %.1f)" % (own, OWN_IMPORT_TARGET))
+
+    if own > OWN_IMPORT_TARGET:
+        print("Import time beside PyQt5 is over target")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
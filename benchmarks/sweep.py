@@ -0,0 +1,91 @@
+"""Time to evaluate and plot a parameter sweep, measured headless.
+
+Sweeps the frequency of "Capacitive Reactance from Frequency and Capacitance" logarithmically over --points values
+and times each stage: the batched evaluation, the first paint of the PlotWidget (which reduces the series to a min/max
+pair per pixel column) and a repaint. For comparison, the same series is drawn as one polyline through every point,
+as a plot without the reduction would. The CSV export is timed last.
+
+Usage:
+    python benchmarks/sweep.py [--points N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np  # noqa: E402
+from PyQt5.QtCore import QPointF  # noqa: E402
+from PyQt5.QtGui import QColor, QImage, QPainter, QPen, QPolygonF  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from ElectricalEngineeringCalculator.engine import CalculationEngine  # noqa: E402
+from ElectricalEngineeringCalculator.resultstore import ResultStore  # noqa: E402
+from ElectricalEngineeringCalculator.sweep import PlotWidget, calculateSweep, get_SweepValues  # noqa: E402
+
+CALCULATION = "Capacitive Reactance from Frequency and Capacitance"
+
+
+def drawEveryPoint(plot, sweepValues, results):
+    """Draws the series through every point, with the plot's own mapping, onto an image the size of the plot"""
+
+    image = QImage(plot.size(), QImage.Format_ARGB32_Premultiplied)
+    image.fill(QColor("#3D3D3D"))
+    rect = plot.get_PlotRect()
+    xs = plot.map_X(sweepValues, rect)
+    ys = plot.map_Y(results, rect)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(QPen(QColor("orange"), 1.5))
+    painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())]))
+    painter.end()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=100000, help="points in the sweep (default 100000)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    engine = CalculationEngine()
+    plot = PlotWidget()
+    plot.resize(780, 360)
+    plot.show()
+    app.processEvents()
+
+    start = time.perf_counter()
+    sweepValues = get_SweepValues(10, 1e9, (args.points - 1) / 8, logarithmic=True)
+    results, errors = calculateSweep(engine, CALCULATION, 1, sweepValues, [100e-9, 0])
+    evaluated = time.perf_counter()
+    plot.set_Series(sweepValues, results, True, "Frequency (Hz)", "Capacitive Reactance (Ω)")
+    plot.repaint()
+    painted = time.perf_counter()
+    firstPaint = plot.paintSeconds
+    plot.repaint()
+    repaint = plot.paintSeconds
+    drawStart = time.perf_counter()
+    drawEveryPoint(plot, sweepValues, results)
+    everyPoint = time.perf_counter() - drawStart
+    assert not errors and np.isfinite(results).all()
+
+    with tempfile.TemporaryDirectory() as directory:
+        exportStart = time.perf_counter()
+        store = ResultStore.from_Arrays([("Frequency", "HERTZ"), ("Capacitive Reactance", "OHMS")],
+                                        [sweepValues, results], errors)
+        store.save(os.path.join(directory, "sweep.csv"))
+        export = time.perf_counter() - exportStart
+
+    print("%d point sweep, %d px wide plot" % (len(sweepValues), plot.width()))
+
+    for label, seconds in (("evaluate", evaluated - start), ("first paint (min/max)", firstPaint),
+                           ("evaluate and plot", painted - start), ("repaint", repaint),
+                           ("every point drawn", everyPoint), ("CSV export", export)):
+        print("  %-22s %8.1f ms" % (label, seconds * 1000))
+
+
+if __name__ == "__main__":
+    main()
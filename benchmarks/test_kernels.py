@@ -0,0 +1,113 @@
+"""Differential check of the array kernels of kernels.py against the electronics_calculator functions they repeat.
+
+For every kernel, the kernel path of calculateBatch is compared element by element with calling the function, over
+random inputs: magnitudes from 1e-300 to 1e300 of either sign, with zeros, repeats, infinities and NaN mixed in. A
+result must match the function's to VERIFY_TOLERANCE, and an error must be the function's error message.
+benchmarks/batch_kernels.py runs the same check before timing the kernels.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from ElectricalEngineeringCalculator.batch import _calculateKernel
+from ElectricalEngineeringCalculator.engine import CalculationEngine
+from ElectricalEngineeringCalculator.kernels import KERNELS
+
+VERIFY_COUNT = 20000  # Elements per kernel and input count checked by verifyKernels
+VERIFY_TOLERANCE = 1e-15  # Relative difference allowed; 100000 random elements per check differ by 3.9e-16 at most
+
+
+def verifyKernels(engine, methodNames=None, count=VERIFY_COUNT, seed=0, tolerance=VERIFY_TOLERANCE):
+    """
+    Compares the kernel path of calculateBatch with calling each function element by element.
+
+    Inputs:
+        engine [CalculationEngine] - Engine whose useKernels is set
+
+        methodNames [sequence] - Functions to check. Defaults to every kernel the engine's catalog uses.
+
+        count [int] - Elements checked per function, and per input count of a tuple function
+
+        seed [int] - Seed of the random inputs
+
+        tolerance [float] - Largest relative difference allowed between the two results of an element
+
+    Output:
+        mismatches [list] - (methodName, inputs, kernel result or error, reference result or error) of every element
+                            where the two disagree, empty when the kernels match
+    """
+
+    plans = {}
+
+    for plan in engine.plans.values():
+        if plan.function is not None and plan.methodName in KERNELS:
+            plans.setdefault(plan.methodName, plan)
+
+    generator = np.random.default_rng(seed)
+    mismatches = []
+
+    for methodName in methodNames or sorted(plans):
+        plan = plans[methodName]
+
+        for inputCount in range(1, len(plan.inputFactors) + 1) if plan.tupleMode else (plan.arity,):
+            scaledArrays = get_VerifyInputs(generator, inputCount, count)
+            results, errors = _calculateKernel(engine, plan, scaledArrays, (count,))
+
+            for index, values in enumerate(zip(*[array.tolist() for array in scaledArrays])):
+                try:
+                    expected = engine.callFunction(plan, values)
+                except Exception as e:
+                    expected = str(e)
+
+                actual = errors.get(index, results[index])
+
+                if isinstance(expected, str) or isinstance(actual, str):
+                    same = expected == actual
+                else:
+                    same = (math.isnan(expected) and math.isnan(actual)) or expected == actual or abs(
+                        actual - expected) <= tolerance * abs(expected)
+
+                if not same:
+                    mismatches.append((methodName, values, actual, expected))
+
+    return mismatches
+
+
+def get_VerifyInputs(generator, inputCount, count):
+    """Random base unit inputs for verifyKernels, sharing values between inputs so tuples are often identical"""
+
+    magnitudes = 10.0 ** generator.uniform(-300, 300, count)
+    magnitudes[: count // 2] = 10.0 ** generator.uniform(-6, 6, count // 2)  # half in the range of real circuits
+    pool = magnitudes * generator.choice((-1.0, 1.0), count)
+    pool[generator.random(count) < 0.02] = 0.0
+    special = generator.random(count) < 0.01
+    pool[special] = generator.choice((np.inf, -np.inf, np.nan, -0.0), int(special.sum()))
+
+    arrays = []
+
+    for _ in range(inputCount):
+        array = generator.permutation(pool)
+        repeated = generator.random(count) < 0.3
+
+        if arrays:
+            array[repeated] = arrays[0][repeated]
+
+        arrays.append(array)
+
+    return arrays
+
+
+@pytest.fixture(scope="module")
+def kernelEngine():
+    return CalculationEngine(cacheSize=0)
+
+
+@pytest.mark.parametrize("methodName", sorted(KERNELS))
+def test_kernel(kernelEngine, methodName):
+    """Every element of one kernel agrees with its function, reporting the first few that do not"""
+
+    mismatches = verifyKernels(kernelEngine, [methodName])
+
+    assert not mismatches, "%d mismatches, first: %r" % (len(mismatches), mismatches[:5])
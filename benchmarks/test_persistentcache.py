@@ -0,0 +1,135 @@
+"""Checks of the SQLite result cache: hits, invalidation by library version, eviction and concurrent writers."""
+
+import multiprocessing
+
+import numpy as np
+
+from ElectricalEngineeringCalculator.batch import calculateBatch
+from ElectricalEngineeringCalculator.engine import CalculationEngine
+from ElectricalEngineeringCalculator.persistentcache import EVICTION_TARGET, PersistentCache
+from ElectricalEngineeringCalculator.resultcache import MISSING
+
+WRITER_ENTRIES = 200  # Entries each concurrent writer puts, one transaction apiece
+
+
+def get_Arrays(value, count=10):
+    return [np.full(count, float(value))]
+
+
+def writeEntries(path, first):
+    """Worker of test_concurrentWriters: puts and flushes WRITER_ENTRIES entries, one transaction each"""
+
+    with PersistentCache(path, libraryVersion="test") as persistentCache:
+        for value in range(first, first + WRITER_ENTRIES):
+            key = persistentCache.get_Key("current_er", get_Arrays(value))
+            persistentCache.put(key, get_Arrays(value)[0], {0: "error %d" % value})
+            persistentCache.flush()
+
+
+def test_hitAfterPut(tmp_path):
+    """An entry is served while pending, after its flush and after reopening the file, and counts one hit each"""
+
+    path = str(tmp_path / "results.sqlite")
+
+    with PersistentCache(path, libraryVersion="test") as persistentCache:
+        key = persistentCache.get_Key("current_er", get_Arrays(1))
+
+        assert persistentCache.get(key, (10,)) is MISSING
+
+        persistentCache.put(key, np.arange(10.0), {3: "Resistance cannot be 0"})
+
+        for _ in range(2):
+            results, errors = persistentCache.get(key, (10,))
+
+            assert np.array_equal(results, np.arange(10.0)) and errors == {3: "Resistance cannot be 0"}
+
+            persistentCache.flush()
+
+    with PersistentCache(path, libraryVersion="test") as persistentCache:
+        results, errors = persistentCache.get(persistentCache.get_Key("current_er", get_Arrays(1)), (10,))
+        stats = persistentCache.get_Stats()
+
+    assert np.array_equal(results, np.arange(10.0)) and errors == {3: "Resistance cannot be 0"}
+    assert (stats.hits, stats.misses, stats.entries) == (3, 1, 1)
+
+
+def test_batchHit(tmp_path):
+    """A calculateBatch call asked for again in other unit scales is a hit on the same base unit inputs"""
+
+    with PersistentCache(str(tmp_path / "results.sqlite"), libraryVersion="test") as persistentCache:
+        engine = CalculationEngine(cacheSize=0, persistentCache=persistentCache)
+        volts, ohms = np.array([5.0, 10.0]), np.array([2.0, 0.0])
+        expected = calculateBatch(engine, "current_er", [volts, ohms], ("VOLTS", "OHMS"))
+        cached = calculateBatch(engine, "current_er", [volts * 1000, ohms], ("MILLIVOLTS", "OHMS"))
+        stats = persistentCache.get_Stats()
+
+    assert np.array_equal(cached[0], expected[0], equal_nan=True) and cached[1] == expected[1] and 1 in cached[1]
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_versionChange(tmp_path):
+    """Opening the file for another library version empties it, and keys of other versions never match"""
+
+    path = str(tmp_path / "results.sqlite")
+
+    with PersistentCache(path, libraryVersion="1.0") as persistentCache:
+        oldKey = persistentCache.get_Key("current_er", get_Arrays(1))
+        persistentCache.put(oldKey, np.ones(10), {})
+
+    with PersistentCache(path, libraryVersion="1.1") as persistentCache:
+        newKey = persistentCache.get_Key("current_er", get_Arrays(1))
+
+        assert newKey != oldKey
+        assert persistentCache.get_Stats().entries == 0
+        assert persistentCache.get(oldKey, (10,)) is MISSING
+
+
+def test_eviction(tmp_path):
+    """Past maxBytes, the least recently used entries are evicted until the rest fit in EVICTION_TARGET of it"""
+
+    maxBytes = 1000
+    entrySize = 80  # 10 float64 results
+
+    with PersistentCache(str(tmp_path / "results.sqlite"), maxBytes=maxBytes, libraryVersion="test") as cache:
+        keys = [cache.get_Key("current_er", get_Arrays(value)) for value in range(20)]
+
+        for key in keys[:12]:
+            cache.put(key, np.zeros(10), {})
+            cache.flush()
+
+        assert cache.get_Stats().entries == 12  # 960 bytes, still within maxBytes
+
+        cache.get(keys[0], (10,))  # used again, so the oldest entry is now keys[1]
+        cache.put(keys[12], np.zeros(10), {})
+        cache.flush()
+        stats = cache.get_Stats()
+
+        assert stats.bytes <= maxBytes * EVICTION_TARGET < stats.bytes + entrySize
+        assert stats.evictions == 2 and stats.entries == 11
+        assert cache.get(keys[1], (10,)) is MISSING and cache.get(keys[2], (10,)) is MISSING
+        assert cache.get(keys[0], (10,)) is not MISSING and cache.get(keys[12], (10,)) is not MISSING
+
+
+def test_concurrentWriters(tmp_path):
+    """Two processes writing the same file wait for each other's BEGIN IMMEDIATE transaction and lose no entry"""
+
+    path = str(tmp_path / "results.sqlite")
+    PersistentCache(path, libraryVersion="test").close()  # creates the schema before either writer starts
+    context = multiprocessing.get_context("spawn")
+    writers = [context.Process(target=writeEntries, args=(path, first)) for first in (0, WRITER_ENTRIES)]
+
+    for writer in writers:
+        writer.start()
+
+    for writer in writers:
+        writer.join(60)
+
+    assert [writer.exitcode for writer in writers] == [0, 0]
+
+    with PersistentCache(path, libraryVersion="test") as persistentCache:
+        assert persistentCache.get_Stats().entries == 2 * WRITER_ENTRIES
+
+        for value in range(2 * WRITER_ENTRIES):
+            results, errors = persistentCache.get(persistentCache.get_Key("current_er", get_Arrays(value)), (10,))
+
+            assert np.array_equal(results, get_Arrays(value)[0]) and errors == {0: "error %d" % value}
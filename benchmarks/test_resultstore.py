@@ -0,0 +1,100 @@
+"""Checks of the columnar result store: growth in memory, a disk store round trip, exports and read-only stores."""
+
+import csv
+
+import numpy as np
+import pytest
+
+from ElectricalEngineeringCalculator.resultstore import ERROR_COLUMN, INITIAL_CAPACITY, ResultStore
+
+COLUMNS = [("Frequency", "KILOHERTZ"), ("Reactance", "OHMS")]
+
+
+def get_Points(start, count):
+    """Frequencies start ... start + count - 1 with their reactances, NaN and an error at every hundredth"""
+
+    frequencies = np.arange(start, start + count, dtype=np.float64)
+    reactances = 1.0 / frequencies
+    failed = np.flatnonzero(frequencies % 100 == 0)
+    reactances[failed] = np.nan
+
+    return frequencies, reactances, {int(index): "Frequency %d failed" % frequencies[index] for index in failed}
+
+
+def fill(store, blocks):
+    """Appends blocks of (start, count) points, returning the frequencies, reactances and errors of all of them"""
+
+    frequencies, reactances, errors = [], [], {}
+
+    for start, count in blocks:
+        blockFrequencies, blockReactances, blockErrors = get_Points(start, count)
+        errors.update((len(store) + index, message) for index, message in blockErrors.items())
+        store.append([blockFrequencies, blockReactances], blockErrors)
+        frequencies.append(blockFrequencies)
+        reactances.append(blockReactances)
+
+    return np.concatenate(frequencies), np.concatenate(reactances), errors
+
+
+def check_Store(store, frequencies, reactances, errors):
+    assert len(store) == len(frequencies)
+    assert [tuple(column) for column in store.columns] == COLUMNS
+    assert np.array_equal(store.get_Column("Frequency"), frequencies)
+    assert np.array_equal(store.get_Column(1), reactances, equal_nan=True)
+    assert store.errors == errors
+
+
+def test_inMemoryGrowth():
+    """An in-memory store grows past INITIAL_CAPACITY by doubling, keeping every point appended before"""
+
+    store = ResultStore(COLUMNS)
+    blocks = [(1, INITIAL_CAPACITY - 1), (INITIAL_CAPACITY, 2), (INITIAL_CAPACITY + 2, 3 * INITIAL_CAPACITY)]
+    expected = fill(store, blocks)
+
+    check_Store(store, *expected)
+    assert len(store.buffers[0]) >= len(store) > 2 * INITIAL_CAPACITY
+    assert not store.get_Column(0).flags.writeable
+
+
+def test_diskRoundTrip(tmp_path):
+    """A disk store appended to, closed and opened again, then exported to CSV and Arrow and read back"""
+
+    path = str(tmp_path / "store")
+
+    with ResultStore(COLUMNS, path) as store:
+        expected = fill(store, [(1, 250), (251, 500)])
+        check_Store(store, *expected)  # mapped while still open for appending
+
+    opened = ResultStore.open(path)
+    check_Store(opened, *expected)
+
+    csvPath = str(tmp_path / "store.csv")
+    opened.save(csvPath)
+
+    with open(csvPath, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+
+    assert rows[0] == ["Frequency (KHz)", "Reactance (Ω)", ERROR_COLUMN]
+    assert len(rows) == len(opened) + 1
+    assert [float(value) for value in rows[150][:2]] == [expected[0][149], expected[1][149]]
+    assert rows[99] == ["99.0", repr(1 / 99.0), ""] and rows[100] == ["100.0", "", "Frequency 100 failed"]
+
+    pytest.importorskip("pyarrow")
+    arrowPath = str(tmp_path / "store.arrow")
+    opened.save(arrowPath)
+    check_Store(ResultStore.open(arrowPath), *expected)
+
+
+def test_readOnly(tmp_path):
+    """Appending is refused to a store that has been closed or opened from a file"""
+
+    path = str(tmp_path / "store")
+    store = ResultStore(COLUMNS, path)
+    fill(store, [(1, 10)])
+    store.close()
+
+    for readOnly in (store, ResultStore.open(path)):
+        with pytest.raises(ValueError, match="read only"):
+            readOnly.append([1.0, 2.0])
+
+        assert len(readOnly) == 10
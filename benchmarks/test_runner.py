@@ -0,0 +1,55 @@
+"""Checks of the batch runner: rows that fail are reported on their own row and never stop the rest of the batch."""
+
+import csv
+
+import pytest
+
+from ElectricalEngineeringCalculator import cli
+from ElectricalEngineeringCalculator.engine import CalculationEngine
+from ElectricalEngineeringCalculator.runner import DEFAULT_CHUNK_SIZE, evaluateChunk, runBatchFile
+
+
+def test_emptyTupleRow(tmp_path):
+    """A tuple calculation row with every parameter_N empty is an error of its own row"""
+
+    inputPath = str(tmp_path / "jobs.csv")
+    outputPath = str(tmp_path / "results.csv")
+
+    with open(inputPath, "w", newline="", encoding="utf-8") as f:
+        f.write("calculation,parameter_1,parameter_2\n"
+                "total_parallel_resistance,,\n"
+                "current_er,5,2\n")
+
+    summary = runBatchFile(CalculationEngine(cacheSize=0), inputPath, outputPath)
+
+    with open(outputPath, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    assert summary.rows == 2 and summary.errors == 1
+    assert rows[0]["error"] == "parameter_1 is missing" and rows[0]["result"] == ""
+    assert float(rows[1]["result"]) == 2.5 and rows[1]["error"] == ""
+
+
+def test_emptyTupleJob():
+    """The same row among jobs, as the server evaluates a jobs POST"""
+
+    rows = [{"calculation": "total_parallel_resistance"},
+            {"calculation": "current_er", "parameter_1": 5, "parameter_2": 2}]
+    results, errors = evaluateChunk(CalculationEngine(cacheSize=0), rows)
+
+    assert errors == {0: "parameter_1 is missing"}
+    assert results[1] == 2.5
+
+
+@pytest.mark.parametrize("chunkSize", ["0", "-5", "abc"])
+def test_invalidChunkSize(tmp_path, capsys, chunkSize):
+    """--chunk-size below 1 is rejected before the batch starts, rather than replaced or passed on"""
+
+    with pytest.raises(SystemExit) as exit:
+        cli.main(["batch", str(tmp_path / "jobs.csv"), "--chunk-size", chunkSize])
+
+    assert exit.value.code == 2 and "--chunk-size" in capsys.readouterr().err
+
+
+def test_chunkSizeDefault():
+    assert cli.DEFAULT_CHUNK_SIZE == DEFAULT_CHUNK_SIZE
@@ -0,0 +1,120 @@
+"""Checks of the HTTP/JSON server over a local connection: single jobs, inline and worker batches, and errors."""
+
+import asyncio
+import json
+
+import pytest
+
+from ElectricalEngineeringCalculator.server import INLINE_BATCH_SIZE, NOT_FINITE_ERROR, CalculationServer
+
+CURRENT_JOB = {"calculation": "current_er", "inputValues": [5, 2], "inputUnitScales": ["VOLTS", "KILOHMS"],
+               "outputUnitScale": "MILLIAMPERES"}
+OVERFLOW_JOB = {"calculation": "total_series_resistance", "inputValues": [1e308, 1e308]}
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = CalculationServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture(scope="module")
+def workerServer():
+    server = CalculationServer(workers=2, chunkSize=100)
+    yield server
+    server.close()
+
+
+async def send(port, body):
+    """POSTs body to /calculate and returns the status and the decoded JSON answer, read until the server closes"""
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payload = json.dumps(body).encode("utf-8")
+    writer.write(b"POST /calculate HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\nContent-Length: %d\r\n\r\n%s"
+                 % (len(payload), payload))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, body = response.split(b"\r\n\r\n", 1)
+
+    return int(head.split(b" ")[1]), json.loads(body)
+
+
+def post(server, *bodies):
+    """Starts server on a free port, sends each body in turn and returns their (status, answer) pairs"""
+
+    async def run():
+        listener = await server.start(port=0)
+
+        async with listener:
+            port = listener.sockets[0].getsockname()[1]
+            return [await send(port, body) for body in bodies]
+
+    return asyncio.run(run())
+
+
+def get_Jobs(count):
+    """count current_er jobs, every tenth one dividing by zero"""
+
+    return [{"calculation": "current_er", "inputValues": [index, index % 10]} for index in range(count)]
+
+
+def check_Batch(answer, count):
+    assert len(answer["results"]) == len(answer["errors"]) == count
+
+    for index, (result, error) in enumerate(zip(answer["results"], answer["errors"])):
+        if index % 10:
+            assert result == index / (index % 10) and error == ""
+        else:
+            assert result is None and error == "Resistance cannot be 0"
+
+
+def test_singleJob(server):
+    [(status, answer)] = post(server, CURRENT_JOB)
+
+    assert status == 200 and answer == {"result": 2.5}
+
+
+def test_inlineBatch(server):
+    [(status, answer)] = post(server, {"jobs": get_Jobs(INLINE_BATCH_SIZE)})
+
+    assert status == 200
+    check_Batch(answer, INLINE_BATCH_SIZE)
+
+
+def test_workerBatch(workerServer):
+    """A batch above INLINE_BATCH_SIZE is split into chunks for the worker processes and answered in job order"""
+
+    count = INLINE_BATCH_SIZE * 3 + 7
+    [(status, answer)] = post(workerServer, {"jobs": get_Jobs(count) + [OVERFLOW_JOB]})
+
+    assert status == 200
+    check_Batch({"results": answer["results"][:-1], "errors": answer["errors"][:-1]}, count)
+    assert answer["results"][-1] is None and answer["errors"][-1] == NOT_FINITE_ERROR
+
+
+def test_invalidJobs(server):
+    """Invalid jobs and non-finite results are answered with status 400, and with null and an error in a batch"""
+
+    answers = post(server, OVERFLOW_JOB, {"calculation": "current_er", "inputValues": [5]},
+                   {"jobs": [OVERFLOW_JOB, CURRENT_JOB, "not a job"]})
+
+    assert answers[0] == (400, {"error": NOT_FINITE_ERROR})
+    assert answers[1] == (400, {"error": "parameter_2 is missing"})
+    assert answers[2] == (200, {"results": [None, 2.5, None],
+                                "errors": [NOT_FINITE_ERROR, "", "A job must be a JSON object"]})
+
+
+def test_internalError(server, monkeypatch, capsys):
+    """A fault in an endpoint is logged with its traceback and answered with a fixed message"""
+
+    def calculate_Job(job):
+        raise RuntimeError("internal detail")
+
+    monkeypatch.setattr(server, "calculate_Job", calculate_Job)
+    [(status, answer)] = post(server, CURRENT_JOB)
+
+    assert status == 500 and answer == {"error": "Internal error"}
+    assert "RuntimeError: internal detail" in capsys.readouterr().err
@@ -0,0 +1,96 @@
+"""Checks of the reverse solver: roots of known formulas, failures, bracket ends and the warm start paths."""
+
+import math
+
+import numpy as np
+import pytest
+
+from ElectricalEngineeringCalculator.engine import CalculationEngine
+from ElectricalEngineeringCalculator.solver import COLD_STEP, Solver
+
+
+@pytest.fixture
+def solver():
+    return Solver(CalculationEngine(cacheSize=0))
+
+
+def assert_Solved(solutions, expected):
+    assert np.allclose(solutions, expected, rtol=1e-9, atol=0)
+
+
+def test_powerForCurrent(solver):
+    """P = I^2 R solved for I"""
+
+    solutions, errors, stats = solver.solve("power_ir", 0, [100.0, 2.0, 1e-12], [0, 4.0])
+
+    assert not errors and stats.solved == 3
+    assert_Solved(solutions, [5.0, math.sqrt(0.5), 5e-7])
+
+
+def test_powerForResistance(solver):
+    """P = I^2 R solved for R, in other unit scales, for an array of targets broadcast with an array of currents"""
+
+    targets = np.array([[1.0], [250.0]])  # milliwatts
+    solutions, errors, stats = solver.solve("power_ir", 1, targets, [np.array([1.0, 10.0, 100.0]), 0],
+                                            ["MILLIAMPERES", "KILOHMS"], "MILLIWATTS")
+
+    assert not errors and solutions.shape == (2, 3)
+    assert_Solved(solutions, targets / np.array([1.0, 10.0, 100.0]) ** 2)  # mW / mA^2 is kilohms
+
+
+@pytest.mark.parametrize("unknownIndex, fixedValues, expected", [(0, [0, 10.0], 1.0), (1, [1.0, 0], 10.0)])
+def test_gainForEitherInput(solver, unknownIndex, fixedValues, expected):
+    """20 dB of gain solved for the input and for the output"""
+
+    solutions, errors, stats = solver.solve("gain_db", unknownIndex, [20.0], fixedValues)
+
+    assert not errors
+    assert_Solved(solutions, [expected])
+
+
+def test_noRoot(solver):
+    """No positive resistance dissipates a negative power, nor does any give a NaN target"""
+
+    solutions, errors, stats = solver.solve("power_ir", 1, [-5.0, np.nan, 5.0], [1.0, 0])
+
+    assert np.isnan(solutions[:2]).all() and solutions[2] == pytest.approx(5.0, rel=1e-9)
+    assert errors[0].startswith("No value from") and errors[1] == "The target is not a finite number"
+    assert stats.solved == 1
+
+
+def test_rootAtBracketEnd(solver):
+    """A target given exactly by the end of the first bracket is solved there, without a Brent iteration"""
+
+    current = math.exp(COLD_STEP)
+    target = solver.engine.calculate("power_ir", [current, 1.0])
+    solutions, errors, stats = solver.solve("power_ir", 0, [target], [0, 1.0])
+
+    assert not errors and solutions[0] == current and stats.iterations == 0
+
+
+def test_failureInsideBracket(solver):
+    """Xc = sqrt(Z^2 - R^2) fails for Z < R, inside the first bracket; the search steps to where it holds"""
+
+    solutions, errors, stats = solver.solve("reactance_capacitive_zr", 0, [2.0, 1e-3], [0, 1.0])
+
+    assert not errors
+    assert_Solved(solutions, [math.sqrt(5.0), math.sqrt(1.000001)])
+
+
+def test_warmStarts(solver):
+    """Targets solved before are confirmed from their final bracket; new targets start from the nearest solution"""
+
+    targets = np.linspace(1.0, 10.0, 5)
+    cold = solver.solve("power_ir", 0, targets, [0, 1.0])
+    exact = solver.solve("power_ir", 0, targets, [0, 1.0])
+    warm = solver.solve("power_ir", 0, targets + 0.5, [0, 1.0])
+    other = solver.solve("power_ir", 0, targets, [0, 2.0])  # other fixed inputs share no history
+
+    assert cold[2].warmStarts == 0 and cold[2].bracketHits == 0
+    assert exact[2].bracketHits == 5 and exact[2].iterations == 0 and exact[2].evaluations == 1
+    assert warm[2].warmStarts == 5 and warm[2].evaluations < cold[2].evaluations
+    assert other[2].warmStarts == 0 and other[2].bracketHits == 0
+
+    for solutions, expected in ((cold[0], targets), (exact[0], targets), (warm[0], targets + 0.5),
+                                (other[0], targets / 2)):
+        assert_Solved(solutions, np.sqrt(expected))
@@ -0,0 +1,84 @@
+"""Time to evaluate many series or parallel networks of different sizes, one call per network against calculateNetworks.
+
+Evaluates total_parallel_resistance for --networks networks of 1 to --max-length resistors each, as ragged arrays:
+the resistances of every network end to end in one array, with the offset where each network starts. Then one
+network of --long-length resistors, which the five parameter boxes of the main window could not hold. Every result of
+calculateNetworks is checked against CalculationEngine.calculate for its network.
+
+Usage:
+    python benchmarks/tuple_networks.py [--networks N] [--max-length N] [--long-length N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np  # noqa: E402
+
+from ElectricalEngineeringCalculator.batch import calculateNetworks  # noqa: E402
+from ElectricalEngineeringCalculator.engine import CalculationEngine  # noqa: E402
+
+CALCULATION = "total_parallel_resistance"
+
+
+def get_Networks(generator, count, minLength, maxLength):
+    """Resistances from 1 ohm to 1 megohm, with about one network in a thousand shorted by a zero"""
+
+    lengths = generator.integers(minLength, maxLength + 1, count)
+    values = 10.0 ** generator.uniform(0, 6, int(lengths.sum()))
+    values[generator.random(len(values)) < 0.0002] = 0.0
+
+    return values, np.concatenate([[0], np.cumsum(lengths)[:-1]])
+
+
+def calculateEach(engine, values, offsets):
+    """One engine.calculate call per network, as the main window evaluates its five boxes"""
+
+    results = []
+    ends = list(offsets[1:]) + [len(values)]
+
+    for start, end in zip(offsets.tolist(), ends):
+        try:
+            results.append(engine.calculate(CALCULATION, values[start:end].tolist()))
+        except Exception as e:
+            results.append(str(e))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--networks", type=int, default=100000, help="networks evaluated (default 100000)")
+    parser.add_argument("--max-length", type=int, default=20, help="most resistors in a network (default 20)")
+    parser.add_argument("--long-length", type=int, default=1000000, help="resistors in the long network (default 1M)")
+    args = parser.parse_args()
+
+    engine = CalculationEngine(cacheSize=0)
+    generator = np.random.default_rng(0)
+
+    for label, (values, offsets) in (
+            ("%d networks of 1 to %d" % (args.networks, args.max_length),
+             get_Networks(generator, args.networks, 1, args.max_length)),
+            ("1 network of %d" % args.long_length, get_Networks(generator, 1, args.long_length, args.long_length))):
+        calculateNetworks(engine, CALCULATION, values[:1000], offsets[offsets < 1000])  # warm-up
+
+        start = time.perf_counter()
+        results, errors = calculateNetworks(engine, CALCULATION, values, offsets)
+        networkSeconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = calculateEach(engine, values, offsets)
+        eachSeconds = time.perf_counter() - start
+
+        mismatches = sum(errors.get(index, results[index]) != value for index, value in enumerate(expected))
+        print("%s resistors, %d values, %d failed" % (label, len(values), len(errors)))
+        print("  one call per network %9.1f ms" % (eachSeconds * 1000))
+        print("  calculateNetworks    %9.1f ms  %5.1fx, %d results differ" % (networkSeconds * 1000,
+                                                                           eachSeconds / networkSeconds, mismatches))
+
+
+if __name__ == "__main__":
+    main()
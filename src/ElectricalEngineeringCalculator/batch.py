@@ -0,0 +1,241 @@
+"""Vectorized evaluation of a catalog calculation over NumPy arrays of inputs.
+
+When the engine's useKernels is set, a function with an array kernel in kernels.py is evaluated by the kernel, and
+only the elements it cannot vouch for (NaN or infinite results) are passed to the function one at a time. Otherwise
+the function itself is called with whole arrays, which works for plain arithmetic; functions that branch on their
+inputs or call the math module cannot take arrays, and are evaluated one element at a time instead. Either way the
+results match CalculationEngine.calculate for every element. When the engine has a
+PersistentCache, a call whose base unit inputs have been evaluated before reads the results from it instead.
+"""
+
+import numpy as np
+
+from .kernels import KERNELS, callKernel
+from .resultcache import MISSING
+
+LOOP_NETWORKS = 32  # Networks of one length below this are evaluated one at a time rather than as arrays
+
+_scalarOnlyMethods = set()  # Methods that have shown they cannot take arrays, so later batches skip straight to a loop
+
+
+def calculateBatch(engine, name, inputValues, inputUnitScales=None, outputUnitScale=None):
+    """
+    Evaluates one calculation for every element of the broadcast input arrays.
+
+    Inputs:
+        engine [CalculationEngine] - Engine holding the precompiled call plans
+
+        name [str] - displayName of the calculation, or the methodName of its electronics_calculator function
+
+        inputValues [sequence] - One array (or scalar) per input, in catalog order. Tuple calculations take one
+                                 array per value in the tuple, e.g. three arrays for three parallel resistors; see
+                                 calculateNetworks for tuples of different lengths.
+
+        inputUnitScales [sequence] - Unit scale of each input, e.g. "KILOHMS". Defaults to the catalog scales.
+
+        outputUnitScale [str] - Unit scale of the results. Defaults to the catalog scale.
+
+    Output:
+        results [ndarray] - float64 results in the output unit scale, NaN where an element failed
+
+        errors [dict] - Error message for each failed element, keyed by its flat index into results
+    """
+
+    plan = engine.get_Plan(name)
+    engine.check_InputCount(plan, len(inputValues))
+
+    if not inputValues:
+        raise ValueError("At least one input is required")
+
+    inputFactors = engine.get_InputFactors(plan, inputUnitScales, len(inputValues))
+    outputFactor = engine.get_OutputFactor(plan, outputUnitScale)
+
+    arrays = np.broadcast_arrays(*[np.asarray(value, dtype=np.float64) for value in inputValues])
+    shape = arrays[0].shape
+
+    # One array multiply per input converts every value to its base unit
+    scaledArrays = [array * factor if factor != 1 else array for array, factor in zip(arrays, inputFactors)]
+
+    persistentCache = engine.persistentCache
+    entry = MISSING
+
+    if persistentCache is not None:
+        key = persistentCache.get_Key(plan.methodName, scaledArrays)
+        entry = persistentCache.get(key, shape)
+
+    if entry is MISSING:
+        results, errors = _calculate(engine, plan, scaledArrays, shape)
+
+        if persistentCache is not None:
+            persistentCache.put(key, results, errors)  # written by the next flush()
+    else:
+        results, errors = entry
+
+    if outputFactor != 1:
+        results = results / outputFactor
+
+    return results, errors
+
+
+def calculateNetworks(engine, name, values, offsets, inputUnitScale=None, outputUnitScale=None):
+    """
+    Evaluates a tuple calculation, such as total_parallel_resistance, for many networks of any number of values.
+
+    The networks are ragged: their values lie end to end in one array, and offsets gives where each one starts, as
+    for np.add.reduceat. Networks with the same number of values are evaluated together by one calculateBatch call,
+    with one array per position in the tuple, so every network gets exactly the result the function gives it.
+
+    Inputs:
+        engine [CalculationEngine] - Engine holding the precompiled call plans
+
+        name [str] - displayName of the calculation, or the methodName of its electronics_calculator function
+
+        values [array_like] - The values of every network, network after network
+
+        offsets [array_like] - Index in values of the first value of each network, in increasing order, starting at
+                               0. A network whose offset equals the next one has no values.
+
+        inputUnitScale [str] - Unit scale of every value. Defaults to the catalog scale.
+
+        outputUnitScale [str] - Unit scale of the results. Defaults to the catalog scale.
+
+    Output:
+        results [ndarray] - float64 result of each network in the output unit scale, NaN where a network failed
+
+        errors [dict] - Error message of each failed network, keyed by its index
+    """
+
+    plan = engine.get_Plan(name)
+
+    if not plan.tupleMode:
+        raise ValueError("%s takes a fixed number of inputs, not a network of values" % plan.methodName)
+
+    values = np.asarray(values, dtype=np.float64).reshape(-1)
+    offsets = np.asarray(offsets, dtype=np.intp).reshape(-1)
+
+    if len(offsets) and (offsets[0] != 0 or np.any(np.diff(offsets) < 0) or offsets[-1] > len(values)):
+        raise ValueError("Offsets must increase from 0 and stay within the values")
+
+    lengths = np.diff(offsets, append=len(values))
+    results = np.full(len(offsets), np.nan)
+    errors = {}
+    scale = inputUnitScale or plan.inputUnitScales[-1]
+    outputFactor = engine.get_OutputFactor(plan, outputUnitScale)
+
+    for length in np.unique(lengths).tolist():
+        networks = np.flatnonzero(lengths == length)
+
+        if length == 0 or len(networks) < LOOP_NETWORKS:
+            # A few long networks: the function's loop over plain floats beats stepping through the tuple in arrays
+            factor = engine.get_InputFactors(plan, [scale], 1)[0]
+
+            for network in networks.tolist():
+                start = offsets[network]
+                scaledValues = [value * factor for value in values[start:start + length].tolist()]
+
+                try:
+                    results[network] = engine.scaleOutput(engine.callFunction(plan, scaledValues), outputFactor)
+                except Exception as e:
+                    errors[network] = str(e)
+
+            continue
+
+        # One column per position in the tuple, each holding that value of every network of this length
+        matrix = values[offsets[networks, np.newaxis] + np.arange(length)]
+        groupResults, groupErrors = calculateBatch(engine, plan.displayName, list(matrix.T), [scale] * length,
+                                                   outputUnitScale)
+        results[networks] = groupResults
+
+        for position, error in groupErrors.items():
+            errors[int(networks[position])] = error
+
+    return results, dict(sorted(errors.items()))
+
+
+def _calculate(engine, plan, scaledArrays, shape):
+    """Evaluates base unit inputs, returning the base unit results and the errors"""
+
+    results = None
+    errors = {}
+
+    if plan.function is not None and engine.useKernels and plan.methodName in KERNELS:
+        return _calculateKernel(engine, plan, scaledArrays, shape)
+
+    if plan.function is not None and plan.methodName not in _scalarOnlyMethods:
+        results = _calculateVectorized(plan, scaledArrays, shape)
+
+    if results is None:
+        results, errors = _calculateElementwise(engine, plan, scaledArrays, shape)
+
+    return results, errors
+
+
+def _calculateKernel(engine, plan, scaledArrays, shape):
+    """Evaluates the kernel of the function, then calls the function for each element left NaN or infinite"""
+
+    with np.errstate(all="ignore"):
+        results = np.asarray(callKernel(plan.methodName, scaledArrays), dtype=np.float64)
+
+    if results.shape != shape:
+        results = np.broadcast_to(results, shape).copy()
+
+    flatResults = results.reshape(-1)
+    finite = np.isfinite(flatResults)
+    errors = {}
+
+    if not finite.all():
+        errors = _callElements(engine, plan, [array.reshape(-1) for array in scaledArrays], flatResults,
+                               np.flatnonzero(~finite))
+
+    return results, errors
+
+
+def _calculateVectorized(plan, scaledArrays, shape):
+    """Calls the function once with whole arrays, returning None when it cannot handle them"""
+
+    try:
+        with np.errstate(all="raise", under="ignore"):
+            if plan.tupleMode:
+                retval = plan.function(tuple(scaledArrays))
+            else:
+                retval = plan.function(*scaledArrays)
+    except FloatingPointError:
+        return None  # e.g. a zero divisor somewhere in this batch; the elementwise pass reports which element
+    except Exception:
+        _scalarOnlyMethods.add(plan.methodName)
+        return None
+
+    retval = np.asarray(retval, dtype=np.float64)
+
+    if retval.shape != shape:
+        retval = np.broadcast_to(retval, shape).copy()
+
+    return retval
+
+
+def _calculateElementwise(engine, plan, scaledArrays, shape):
+    """
+    Calls the function once per element with plain Python floats, recording the error of each failed element. The
+    engine's result cache is bypassed: looking a result up costs as much as computing it with these functions.
+    """
+
+    results = np.empty(shape, dtype=np.float64)
+    errors = _callElements(engine, plan, [array.reshape(-1) for array in scaledArrays], results.reshape(-1),
+                           np.arange(results.size))
+
+    return results, errors
+
+
+def _callElements(engine, plan, columns, flatResults, indexes):
+    """Calls the function for the elements at the flat indexes, writing their results and returning their errors"""
+
+    errors = {}
+
+    for index, values in zip(indexes.tolist(), zip(*[column[indexes].tolist() for column in columns])):
+        try:
+            flatResults[index] = engine.callFunction(plan, values)
+        except Exception as e:
+            flatResults[index] = np.nan
+            errors[index] = str(e)
+
+    return errors
@@ -0,0 +1,119 @@
+"""Runs calculations on a background thread so a slow one cannot freeze the window.
+
+The GUI reads its inputs on the GUI thread and submits them to a CalculationRunner, which evaluates them with the
+shared CalculationEngine on a QThreadPool and reports back through Qt signals, delivered on the GUI thread. Every
+submission gets a request id. A newer submission, or cancel(), takes any job that has not started back out of the
+pool queue and makes the results of jobs already running stale; stale results are dropped, so only the latest
+request ever reaches the display.
+"""
+
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from .profiling import record, stage
+
+MAX_THREADS = 2  # A stale job still running must not hold up the latest one
+
+
+class _CalculationSignals(QObject):
+    finished = pyqtSignal(int, bool, object)  # requestId, succeeded, result or error message
+
+
+class _CalculationJob(QRunnable):
+    """One CalculationEngine.calculate call, reporting through its own signals object"""
+
+    def __init__(self, engine, requestId, arguments):
+        super().__init__()
+        self.setAutoDelete(False)  # the runner keeps the job until it reports, so it can be taken back first
+        self.signals = _CalculationSignals()
+        self.engine = engine
+        self.requestId = requestId
+        self.arguments = arguments
+
+    def run(self):
+        try:
+            with stage("engine calculate"):
+                outcome = (True, self.engine.calculate(*self.arguments))
+        except Exception as e:  # Handles exceptions that the electronics_module throws
+            outcome = (False, str(e))
+
+        try:
+            self.signals.finished.emit(self.requestId, *outcome)
+        except RuntimeError:
+            pass  # PyQt deleted the signals object at interpreter exit; an exception escaping run() would abort
+
+
+class CalculationRunner(QObject):
+    """Evaluates the latest calculation request off the GUI thread. Use from the GUI thread."""
+
+    calculationFinished = pyqtSignal(object)  # Result of the latest request, in its output unit scale
+    calculationFailed = pyqtSignal(str)  # Error message of the latest request
+
+    def __init__(self, engine, parent=None):
+        """
+        Inputs:
+            engine [CalculationEngine] - Engine that evaluates the calculations. It is used from the pool threads.
+
+            parent [QObject] - Owner of the runner, normally the main window
+        """
+
+        super().__init__(parent)
+        self.engine = engine
+        self.requestId = 0  # Id of the latest request; results of any other request are stale
+        self.jobs = {}  # requestId -> _CalculationJob, for every job that has not reported yet
+        self.submittedNs = 0  # perf_counter_ns of the latest submission, for the "calculation" profiling stage
+        self.threadPool = QThreadPool(self)
+        self.threadPool.setMaxThreadCount(MAX_THREADS)
+
+    def submit(self, name, inputValues, inputUnitScales=None, outputUnitScale=None):
+        """
+        Queues a calculation, superseding every earlier request. The arguments are those of
+        CalculationEngine.calculate. The result arrives through calculationFinished or calculationFailed.
+
+        Output:
+            requestId [int] - Id of the new request
+        """
+
+        self.cancel()
+        self.submittedNs = time.perf_counter_ns()
+        job = _CalculationJob(self.engine, self.requestId, (name, list(inputValues), inputUnitScales, outputUnitScale))
+        job.signals.finished.connect(self.job_Finished)
+        self.jobs[self.requestId] = job
+        self.threadPool.start(job)
+
+        return self.requestId
+
+    def cancel(self):
+        """Makes every earlier request stale, taking back the jobs that have not started yet"""
+
+        self.requestId += 1
+
+        for requestId, job in list(self.jobs.items()):
+            if self.threadPool.tryTake(job):
+                del self.jobs[requestId]
+
+    def isPending(self):
+        """Returns True while the latest request has not reported"""
+
+        return self.requestId in self.jobs
+
+    def waitForDone(self, msecs=-1):
+        """Blocks until every job has run. Their results are delivered once the event loop runs."""
+
+        return self.threadPool.waitForDone(msecs)
+
+    def job_Finished(self, requestId, succeeded, outcome):
+        self.jobs.pop(requestId, None)
+
+        if requestId != self.requestId:
+            return  # superseded while it ran
+
+        record("calculation", self.submittedNs)
+
+        if succeeded:
+            self.calculationFinished.emit(outcome)
+        else:
+            self.calculationFailed.emit(outcome)
+
+        return
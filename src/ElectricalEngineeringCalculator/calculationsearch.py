@@ -0,0 +1,148 @@
+"""Type-to-search box for the calculation selector.
+
+Typing in the box queries a SearchIndex of the catalog and lists the best matches in a QCompleter popup; choosing
+one, or pressing Enter for the best, selects that calculation in the selector. The index is built on the first
+keystroke rather than at startup. The completer shows a SearchResultModel of the matches unfiltered, and each
+keystroke updates only the rows of the model whose match changed, inserting or removing rows at the end, so the popup
+does not reset and redraw every row as a QStringListModel would.
+"""
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtWidgets import QCompleter, QLineEdit
+
+from .searchindex import SearchIndex
+
+MAX_MATCHES = 100  # Most matches listed in the popup
+VISIBLE_MATCHES = 12  # Rows of the popup before it scrolls
+
+
+class SearchResultModel(QAbstractListModel):
+    """The displayNames of the current matches, best first"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.matches = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.matches)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role in (Qt.DisplayRole, Qt.EditRole) and 0 <= index.row() < len(self.matches):
+            return self.matches[index.row()]
+
+        return None
+
+    def set_Matches(self, matches):
+        """
+        Replaces the matches, signalling only the rows that change. Rows the old and new matches share at the start
+        or the end are left alone, changed rows between them are updated in place, and the difference in length is
+        inserted or removed after them.
+
+        Input:
+            matches [list] - displayNames, best first
+        """
+
+        old = self.matches
+        shared = min(len(old), len(matches))
+        first = 0
+
+        while first < shared and old[first] == matches[first]:
+            first += 1
+
+        last = 0  # Rows shared at the end, after the first changed row
+
+        while last < shared - first and old[-1 - last] == matches[-1 - last]:
+            last += 1
+
+        oldEnd = len(old) - last
+        newEnd = len(matches) - last
+        replaced = min(oldEnd, newEnd) - first
+
+        if replaced > 0:
+            old[first:first + replaced] = matches[first:first + replaced]
+            self.dataChanged.emit(self.index(first), self.index(first + replaced - 1), [Qt.DisplayRole])
+
+        if oldEnd > newEnd:
+            self.beginRemoveRows(QModelIndex(), first + replaced, oldEnd - 1)
+            del old[first + replaced:oldEnd]
+            self.endRemoveRows()
+        elif newEnd > oldEnd:
+            self.beginInsertRows(QModelIndex(), first + replaced, newEnd - 1)
+            old[first + replaced:first + replaced] = matches[first + replaced:newEnd]
+            self.endInsertRows()
+
+
+class CalculationSearchBox(QLineEdit):
+    """Search box listing the calculations that match what is typed"""
+
+    calculationChosen = pyqtSignal(int)  # Position of the chosen calculation in catalog.displayNames
+
+    def __init__(self, catalog, parent=None):
+        """
+        Inputs:
+            catalog [Catalog] - The calculations to search
+
+            parent [QWidget] - The main window
+        """
+
+        super().__init__(parent)
+        self.catalog = catalog
+        self.searchIndex = None  # SearchIndex of the catalog, built on the first keystroke
+        self.resultModel = SearchResultModel(self)
+
+        self.completer = QCompleter(self.resultModel, self)
+        self.completer.setWidget(self)  # not setCompleter, which would also prefix filter the matches
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completer.setMaxVisibleItems(VISIBLE_MATCHES)
+        self.completer.activated[str].connect(self.completer_Activated)
+
+        self.textEdited.connect(self.txtSearch_Edited)
+        self.returnPressed.connect(self.txtSearch_ReturnPressed)
+
+    def get_SearchIndex(self):
+        if self.searchIndex is None:
+            self.searchIndex = SearchIndex(self.catalog)
+
+        return self.searchIndex
+
+    def txtSearch_Edited(self, text):
+        matches = self.get_SearchIndex().search(text, MAX_MATCHES) if text.strip() else []
+        self.resultModel.set_Matches(matches)
+
+        if matches:
+            self.completer.complete()
+        else:
+            self.completer.popup().hide()
+
+        return
+
+    def txtSearch_ReturnPressed(self):
+        # Return reaches the box before the completer sees it, so choose the highlighted match here, or the best
+        if not (self.resultModel.matches and self.text().strip()):
+            return
+
+        popup = self.completer.popup()
+        row = popup.currentIndex().row() if popup.isVisible() and popup.currentIndex().isValid() else 0
+        self.choose(self.resultModel.matches[row])
+
+        return
+
+    def completer_Activated(self, displayName):
+        self.choose(displayName)
+
+        return
+
+    def choose(self, displayName):
+        """Clears the search and reports the chosen calculation"""
+
+        self.clear_Search()
+        self.calculationChosen.emit(self.get_SearchIndex().get_Position(displayName))
+
+        return
+
+    def clear_Search(self):
+        self.clear()
+        self.resultModel.set_Matches([])
+        self.completer.popup().hide()
+
+        return
@@ -0,0 +1,260 @@
+"""Loads the calculation catalog (calculations.xml) into plain data structures that need no GUI.
+
+Parsing the XML is a noticeable share of cold start, so the parsed catalog is also kept as compact JSON in the user's
+cache directory. The cache is keyed by the XML file's modification time, size and SHA-256 hash, and is rebuilt
+automatically whenever the XML changes.
+"""
+
+import json
+import os
+import zlib
+
+CALCULATIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "calculations.xml")
+CACHE_FORMAT = 1  # Increase whenever the structure of the calculation records changes
+
+
+def iterCalculations(path=CALCULATIONS_PATH):
+    """
+    Streams the calculation catalog XML file, yielding each calculation as soon as its element has been read and
+    discarding the element afterwards, so memory use does not grow with the size of the catalog.
+
+    Input:
+        path [str] - Location of the calculations XML file
+
+    Output:
+        dictMethod [dict] - One record per calculation with the keys methodName, displayName, formulaImage,
+                            description, parameters, outputName and outputUnitScale
+
+    Raises:
+        ValueError - The file is not a valid calculation catalog, e.g. a required attribute is missing
+    """
+
+    from xml.etree import ElementTree  # Only needed when the cache is stale, so keep it off the startup path
+
+    count = 0
+    root = None
+
+    for event, element in ElementTree.iterparse(path, events=("start", "end")):
+        if root is None:
+            root = element
+
+            if root.tag != "calculations":
+                raise ValueError("%s: expected a <calculations> root element, found <%s>" % (path, root.tag))
+
+        if event != "end" or element.tag != "calculation":
+            continue
+
+        count += 1
+        yield _readCalculation(element, "%s: calculation %d" % (path, count))
+
+        root.clear()  # drop the finished calculation element
+
+    return
+
+
+def loadCalculations(path=CALCULATIONS_PATH):
+    """
+    Reads the calculation catalog XML file.
+
+    Input:
+        path [str] - Location of the calculations XML file
+
+    Output:
+        listMethods [list] - One dictionary per calculation, as yielded by iterCalculations
+    """
+
+    return list(iterCalculations(path))
+
+
+def _readCalculation(calculation, location):
+    """Converts one <calculation> element into a calculation record, validating it on the way"""
+
+    methodName = _get_Attribute(calculation, "methodName", location)
+    location = "%s (%s)" % (location, methodName)
+    displayName = _get_Attribute(calculation, "displayName", location)
+    formulaImage = _get_Attribute(calculation, "formulaImage", location)
+    description = _get_Child(calculation, "description", location).text or ""
+    output = _get_Child(calculation, "output", location)
+    outputName = _get_Attribute(output, "outputName", location)
+    outputUnitScale = _get_Attribute(output, "outputUnitScale", location)
+    parameters = _get_Child(calculation, "input_parameters", location).findall("parameter")
+
+    if not parameters:
+        raise ValueError("%s: <input_parameters> has no <parameter> elements" % location)
+
+    dictParameter = {}
+
+    for count, parameter in enumerate(parameters, 1):
+        dictParameter["parameter_%d" % count] = _get_Attribute(parameter, "paramName", location)
+        dictParameter["inputUnitScale_%d" % count] = _get_Attribute(parameter, "inputUnitScale", location)
+
+    dictMethod = {
+        "methodName": methodName,
+        "displayName": displayName,
+        "formulaImage": formulaImage,
+        "description": description,
+        "parameters": dictParameter,
+        "outputName": outputName,
+        "outputUnitScale": outputUnitScale
+    }
+
+    return dictMethod
+
+
+def _get_Attribute(element, attributeName, location):
+    value = element.get(attributeName)
+
+    if value is None:
+        raise ValueError("%s: <%s> is missing the %s attribute" % (location, element.tag, attributeName))
+
+    return value
+
+
+def _get_Child(element, tag, location):
+    child = element.find(tag)
+
+    if child is None:
+        raise ValueError("%s: <%s> has no <%s> element" % (location, element.tag, tag))
+
+    return child
+
+
+class Catalog:
+    """The calculation records indexed for constant-time lookup by displayName and methodName"""
+
+    def __init__(self, calculations):
+        """
+        Input:
+            calculations [list] - Calculation records, as returned by loadCalculations
+
+        Raises:
+            ValueError - Two calculations share a displayName, so they could not be told apart in the GUI
+        """
+
+        self.calculations = calculations
+        self.byDisplayName = {}
+        self.byMethodName = {}  # Several calculations can share a method (e.g. gain); this maps to the first
+
+        for calculation in calculations:
+            displayName = calculation["displayName"]
+
+            if displayName in self.byDisplayName:
+                raise ValueError("Duplicate calculation displayName: %s" % displayName)
+
+            self.byDisplayName[displayName] = calculation
+            self.byMethodName.setdefault(calculation["methodName"], calculation)
+
+        self.displayNames = sorted(self.byDisplayName)  # Order of the calculations in the GUI selector
+
+    def __iter__(self):
+        return iter(self.calculations)
+
+    def __len__(self):
+        return len(self.calculations)
+
+    def get_Calculation(self, name):
+        """Finds a calculation by its displayName or, failing that, its methodName"""
+
+        calculation = self.byDisplayName.get(name)
+
+        if calculation is None:
+            calculation = self.byMethodName.get(name)
+
+            if calculation is None:
+                raise KeyError("Unknown calculation: %s" % name)
+
+        return calculation
+
+
+def get_CacheDirectory():
+    """Per-user cache directory, honouring XDG_CACHE_HOME"""
+
+    cacheHome = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+
+    return os.path.join(cacheHome, "ElectricalEngineeringCalculator")
+
+
+def get_CachePath(path=CALCULATIONS_PATH, cacheDirectory=None):
+    """Cache file for a given XML file; each XML location gets its own cache file"""
+
+    if cacheDirectory is None:
+        cacheDirectory = get_CacheDirectory()
+
+    pathHash = zlib.crc32(os.path.abspath(path).encode("utf-8"))
+
+    return os.path.join(cacheDirectory, "calculations-%08x.json" % pathHash)
+
+
+def loadCalculationsCached(path=CALCULATIONS_PATH, cacheDirectory=None):
+    """
+    Returns the same records as loadCalculations, skipping the XML parse when the cache is fresh.
+
+    Inputs:
+        path [str] - Location of the calculations XML file
+
+        cacheDirectory [str] - Where the cache file is kept. Defaults to get_CacheDirectory().
+
+    Output:
+        calculations [list] - Calculation records, as returned by loadCalculations
+    """
+
+    cachePath = get_CachePath(path, cacheDirectory)
+    stat = os.stat(path)
+    cache = _readCache(cachePath)
+
+    if cache is not None and cache["mtime_ns"] == stat.st_mtime_ns and cache["size"] == stat.st_size:
+        return cache["calculations"]
+
+    import hashlib  # Only needed when the cache is stale, so keep it off the startup path
+
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+
+    if cache is not None and cache["sha256"] == digest:
+        calculations = cache["calculations"]  # touched but unchanged, e.g. after a fresh checkout
+    else:
+        calculations = loadCalculations(path)
+
+    _writeCache(cachePath, {
+        "format": CACHE_FORMAT,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+        "calculations": calculations
+    })
+
+    return calculations
+
+
+def _readCache(cachePath):
+    try:
+        with open(cachePath, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cache, dict) or cache.get("format") != CACHE_FORMAT:
+        return None
+
+    return cache
+
+
+def _writeCache(cachePath, cache):
+    """Writes the cache atomically; a read-only or missing cache directory just means no caching"""
+
+    tempPath = "%s.%d.tmp" % (cachePath, os.getpid())
+
+    try:
+        os.makedirs(os.path.dirname(cachePath), exist_ok=True)
+
+        with open(tempPath, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False, separators=(",", ":"))
+
+        os.replace(tempPath, cachePath)
+    except OSError:
+        try:
+            os.remove(tempPath)
+        except OSError:
+            pass
+
+    return
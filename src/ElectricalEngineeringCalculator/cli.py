@@ -0,0 +1,108 @@
+"""Command-line entry point: python -m ElectricalEngineeringCalculator [--profile] [gui | batch ... | serve ...]"""
+
+import argparse
+import os
+import sys
+
+DEFAULT_CHUNK_SIZE = 10000  # runner.DEFAULT_CHUNK_SIZE; runner imports numpy, which the window does not need to start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ElectricalEngineeringCalculator",
+                                     description="Electrical Engineering Calculator")
+    parser.add_argument("--profile", action="store_true",
+                        help="time the window's stages and print their latency histograms on exit")
+    parser.add_argument("--profile-output", metavar="FILE",
+                        help="with --profile, also write a Chrome trace (.json) or cProfile stats (.pstats)")
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+
+    subparsers.add_parser("gui", help="open the calculator window (the default)")
+
+    batchParser = subparsers.add_parser("batch", help="evaluate a CSV, Parquet or Arrow file of calculation jobs",
+                                        description="Evaluates a file of calculation jobs. See runner.py for the "
+                                                    "column layout.")
+    batchParser.add_argument("input", help="file of jobs (.csv, .parquet, .arrow or .feather)")
+    batchParser.add_argument("-o", "--output", help="results file; defaults to <input>_results.<ext>")
+    batchParser.add_argument("--chunk-size", type=positiveInt, default=DEFAULT_CHUNK_SIZE,
+                             help="rows per chunk (default %d)" % DEFAULT_CHUNK_SIZE)
+    batchParser.add_argument("-j", "--workers", type=int, default=1,
+                             help="worker processes evaluating chunks in parallel (default 1, 0 for one per core)")
+    batchParser.add_argument("--cache", action="store_true",
+                             help="reuse results from earlier runs, kept in an SQLite file shared by every run")
+    batchParser.add_argument("--cache-path", help="SQLite file of the result cache (default in the user cache "
+                                                  "directory)")
+    batchParser.add_argument("--cache-size", type=positiveInt, default=256,
+                             help="MB of results the cache keeps (default 256)")
+
+    serveParser = subparsers.add_parser("serve", help="serve the calculations over HTTP/JSON",
+                                        description="Serves the calculations over HTTP/JSON. See server.py for the "
+                                                    "endpoints.")
+    serveParser.add_argument("--host", default="127.0.0.1", help="address to listen on (default 127.0.0.1)")
+    serveParser.add_argument("--port", type=int, default=8765, help="port to listen on (default 8765)")
+    serveParser.add_argument("-j", "--workers", type=int, default=0,
+                             help="worker processes evaluating batches (default 0: one per core)")
+
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        # Read by the profiling module when the GUI modules import it
+        os.environ["EECALC_PROFILE"] = args.profile_output or "1"
+
+    if args.command == "batch":
+        return runBatch(args)
+
+    if args.command == "serve":
+        from .server import serve
+
+        return serve(args.host, args.port, args.workers if args.workers > 0 else os.cpu_count() or 1)
+
+    from .eecalc import main as guiMain
+
+    guiMain()
+
+
+def positiveInt(text):
+    """argparse type of the options counting things that there must be at least one of"""
+
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError("%r is not a whole number" % text) from None
+
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be at least 1, not %d" % value)
+
+    return value
+
+
+def runBatch(args):
+    from .engine import CalculationEngine
+    from .runner import runBatchFile
+
+    outputPath = args.output
+
+    if outputPath is None:
+        stem, extension = os.path.splitext(args.input)
+        outputPath = "%s_results%s" % (stem, extension)
+
+    workers = args.workers if args.workers > 0 else os.cpu_count() or 1
+    persistentCache = None
+
+    if args.cache:
+        from .persistentcache import PersistentCache
+
+        persistentCache = PersistentCache(args.cache_path, args.cache_size * 1024 * 1024)
+        statsBefore = persistentCache.get_Stats()
+
+    try:
+        summary = runBatchFile(CalculationEngine(persistentCache=persistentCache), args.input, outputPath,
+                               args.chunk_size, workers)
+        print("%s -> %s" % (summary, outputPath), file=sys.stderr)
+
+        if persistentCache is not None:
+            print("Result cache: %s" % (persistentCache.get_Stats().since(statsBefore),), file=sys.stderr)
+    finally:
+        if persistentCache is not None:
+            persistentCache.close()
+
+    return 0
@@ -2,14 +2,25 @@ import os
 import sys
 
 from PyQt5 import QtCore
-from bs4 import BeautifulSoup
-from PyQt5.QtCore import Qt, QRect
-from PyQt5.QtGui import QFont, QPixmap, QIcon
+from PyQt5.QtCore import Qt, QRect, QTimer
+from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtWidgets import (QDesktopWidget, QMainWindow, QLabel, QStatusBar, QApplication, QLCDNumber, QComboBox,
-                             QPushButton, QLineEdit, QAction, QMessageBox)
-import ElectronicsCalculator.electronics_calculator as ec
-import ElectronicsCalculator.scale_factors as sf
-from inspect import signature
+                             QPushButton, QAction, QMessageBox)
+
+if __package__ in (None, ""):
+    # Running as a script (python eecalc.py), so make the package importable for its sibling modules
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ElectricalEngineeringCalculator.calculationrunner import CalculationRunner
+from ElectricalEngineeringCalculator.calculationsearch import CalculationSearchBox
+from ElectricalEngineeringCalculator.catalog import Catalog, loadCalculationsCached
+from ElectricalEngineeringCalculator.engine import CalculationEngine
+from ElectricalEngineeringCalculator.formulaimages import FormulaImageCache
+from ElectricalEngineeringCalculator.parameterpanel import ParameterPanel
+from ElectricalEngineeringCalculator import profiling
+from ElectricalEngineeringCalculator.units import UNIT_SCALES, get_SiblingScales, get_UnitScale
+
+LIVE_CALCULATION_DELAY = 150  # ms without typing before live calculation evaluates the inputs
 
 # GLOSSARY =========================================================================================================== #
 # Unit Type     - Any of the following: Capacitance, Inductance, Resistance, Frequency, Current, Power, Voltage,
@@ -27,8 +38,10 @@ from inspect import signature
 #               1000000, respectively. This helps to avoid long numbers needing to be entered for calculations.
 # ==================================================================================================================== #
 
+PREFETCH_DISTANCE = 2  # Formula images decoded ahead on each side of the selected calculation
+
 StyleSheet = '''
-QMainWindow {
+QMainWindow, QDialog#dlgSweep, QDialog#dlgSolve, QDialog#dlgNetworks {
     background-color: #303030; 
     color: #FFFFFF;
     border-radius: 5px;
@@ -77,6 +90,10 @@ QAbstractItemView {
     selection-color: yellow;
 }
 
+QCheckBox {
+    color: #14BC57;
+}
+
 QComboBox#cmbChangeOutputUnit {
     padding: 2px 0px 2px 5px;
 }
@@ -95,6 +112,17 @@ QLineEdit {
     border: 1px solid #212121;
     border-radius: 5px;
 }
+
+QPlainTextEdit#txtSolutions, QPlainTextEdit#txtValues, QPlainTextEdit#txtResults {
+    background-color: #3D3D3D; 
+    color: orange; 
+    border: 1px solid #212121;
+    border-radius: 5px;
+}
+
+QLineEdit[invalid="true"] {
+    background-color: #5C2B2B;
+}
                                               
 QMenuBar::item:selected {
     background-color: #212121;
@@ -121,6 +149,10 @@ QLCDNumber, QLabel#lblOutputUnitValue, QLabel#lblOutputUnit, QLabel#lblOutput {
     color: #000000;
 }
 
+QScrollArea#scrParameters, QWidget#wdgParameters {
+    background: transparent;
+}
+
 QLabel#lblImg, QLabel#lblFormulaDescription {
     border: 1px solid #212121; 
     background-color: #3D3D3D;
@@ -173,443 +205,99 @@ QPushButton:focus, QLineEdit:focus, QComboBox:focus {
 class App(QMainWindow):
     """GUI class that interacts with the ElectronicsCalculator package"""
 
-    def scaleParameter(self, parameterValue, inputUnitType, inputUnitScale):
+    def get_ParameterValue(self, parameterValue):
+        """Converts the text of an input parameter to a number, reporting non-numeric input"""
         retval = 0.0
 
         if parameterValue != "":
             try:
-                parameterValue = float(parameterValue)
-                scaleInput = self.mapUnitToEnum(inputUnitType)
-                factorInput = scaleInput[inputUnitScale]
-                retval = sf.scale_in(parameterValue, factorInput)
+                retval = float(parameterValue)
             except ValueError:
                 self.set_lblErrorDisplay("All inputs must be numeric")
 
         return retval
 
+    @profiling.timed
     def calculate(self):
-        """Directly interfaces with the electronics_calculator module to perform the calculations"""
+        """
+        Reads the inputs of the selected calculation and submits them to the CalculationRunner, which evaluates them
+        on a background thread. The result, or the error, arrives in calculationRunner_Finished or
+        calculationRunner_Failed.
+        """
 
         self.lblErrorDisplay.clear()
         self.lblErrorDisplay.hide()
-        tupleVersion = None
-        retval = 0.0
-        inputValue_1 = self.txtParameter_1.text().strip()
-        inputValue_2 = self.txtParameter_2.text().strip()
-        inputValue_3 = self.txtParameter_3.text().strip()
-        inputValue_4 = self.txtParameter_4.text().strip()
-        inputValue_5 = self.txtParameter_5.text().strip()
-
-        parameter_1 = self.scaleParameter(inputValue_1, self.inputUnitType_1, self.cmbUnitOptions_1.currentText())
-        parameter_2 = self.scaleParameter(inputValue_2, self.inputUnitType_2, self.cmbUnitOptions_2.currentText())
-        parameter_3 = self.scaleParameter(inputValue_3, self.inputUnitType_3, self.cmbUnitOptions_3.currentText())
-        parameter_4 = self.scaleParameter(inputValue_4, self.inputUnitType_4, self.cmbUnitOptions_4.currentText())
-        parameter_5 = self.scaleParameter(inputValue_5, self.inputUnitType_5, self.cmbUnitOptions_5.currentText())
-
-        # Execute appropriate function in electronics_calculator module
-        try:
-            func = getattr(ec, self.methodName)
-            sig = signature(func)
-            parameterCount = len(sig.parameters)
-
-            if parameterCount == 5:
-                retval = func(parameter_1, parameter_2, parameter_3, parameter_4, parameter_5)
-            elif parameterCount == 4:
-                retval = func(parameter_1, parameter_2, parameter_3, parameter_4)
-            elif parameterCount == 3:
-                retval = func(parameter_1, parameter_2, parameter_3)
-            elif parameterCount == 2:
-                retval = func(parameter_1, parameter_2)
-            elif parameterCount == 1:
-                if inputValue_5 != "":
-                    tupleVersion = (parameter_1, parameter_2, parameter_3, parameter_4, parameter_5)
-                elif inputValue_4 != "":
-                    tupleVersion = (parameter_1, parameter_2, parameter_3, parameter_4)
-                elif inputValue_3 != "":
-                    tupleVersion = (parameter_1, parameter_2, parameter_3)
-                elif inputValue_2 != "":
-                    tupleVersion = (parameter_1, parameter_2)
-                elif inputValue_1 != "":
-                    tupleVersion = (parameter_1,)
-
-                if str(sig).find("tuple") > 0:
-                    retval = func(tupleVersion)
-                else:
-                    retval = func(parameter_1)
-        except Exception as e:  # Handles exceptions that the electronics_module throws
-            self.set_lblErrorDisplay(e)
-
-        # Get enum for scale_factor
-        scaleOutput = self.mapUnitToEnum(self.outputUnitType)
-        factorOutput = scaleOutput[self.outputUnitScale]  # extract value of the scale for use as the factor
-        retval = sf.scale_out(retval, factorOutput)  # apply scale factor to the calculation output
-
-        return retval
-
-    def mapUnitToEnum(self, unitType):
-        """Get Enum for scale factor"""
-        scale = None
-
-        for moduleItem in dir(sf):  # search through all classes in module
-            if unitType == moduleItem:  # find the class that matches outputUnitType
-                scale = getattr(sf, moduleItem)  # apply this Enum as the scale
-                break
-
-        return scale
-
-    def set_lblErrorDisplay(self, message):
-        message = "ERROR: %s" % message
-        self.lblErrorDisplay.setText(message)
-        self.lblErrorDisplay.show()
-
-        return
-
-    def set_UnitAbbreviations_Combined(self):
-        """Gets a combined dictionary of all scales of all unit types. This is used for doing lookups."""
-
-        capacitance = self.set_UnitAbbreviations_Capacitance()
-        inductance = self.set_UnitAbbreviations_Inductance()
-        resistance = self.set_UnitAbbreviations_Resistance()
-        frequency = self.set_UnitAbbreviations_Frequency()
-        current = self.set_UnitAbbreviations_Current()
-        power = self.set_UnitAbbreviations_Power()
-        voltage = self.set_UnitAbbreviations_Voltage()
-        distance = self.set_UnitAbbreviations_Distance()
-        time = self.set_UnitAbbreviations_Time()
-        angle = self.set_UnitAbbreviations_Angle()
-        gainDB = self.set_UnitAbbreviations_GainDB()
-        gainA = self.set_UnitAbbreviations_GainA()
-
-        # Merge all individual scale dictionaries into one
-        combinedFactorAbbreviations = {
-            **capacitance,
-            **inductance,
-            **resistance,
-            **frequency,
-            **current,
-            **power,
-            **voltage,
-            **distance,
-            **time,
-            **angle,
-            **gainDB,
-            **gainA,
-        }
-
-        return combinedFactorAbbreviations
-
-    def set_UnitAbbreviations_Capacitance(self):
-        """Maps all scales for capacitance units to their equivalent abbreviations."""
-
-        capacitance = {
-            "FARADS": "F",
-            "MILLIFARADS": "mF",
-            "MICROFARADS": "µF",
-            "NANOFARADS": "nF",
-            "PICOFARADS": "pF"
-        }
-
-        return capacitance
-
-    def set_UnitAbbreviations_Inductance(self):
-        """Maps all scales for inductance units to their equivalent abbreviations."""
-
-        inductance = {
-            "HENRIES": "H",
-            "MILLIHENRIES": "mH",
-            "MICROHENRIES": "µH"
-        }
-
-        return inductance
-
-    def set_UnitAbbreviations_Resistance(self):
-        """Maps all scales for resistance units to their equivalent abbreviations."""
-
-        resistance = {
-            "OHMS": "Ω",
-            "KILOHMS": "KΩ",
-            "MEGAOHMS": "MΩ"
-        }
-
-        return resistance
-
-    def set_UnitAbbreviations_Frequency(self):
-        """Maps all scales for frequency units to their equivalent abbreviations."""
-
-        frequency = {
-            "HERTZ": "Hz",
-            "KILOHERTZ": "KHz",
-            "MEGAHERTZ": "MHz",
-            "GIGAHERTZ": "GHz"
-        }
-
-        return frequency
-
-    def set_UnitAbbreviations_Current(self):
-        """Maps all scales for current units to their equivalent abbreviations."""
 
-        current = {
-            "AMPERES": "A",
-            "MILLIAMPERES": "mA",
-            "MICROAMPERES": "µA"
-        }
+        if self.displayName is None:
+            self.set_lblErrorDisplay("Select a calculation to perform")
+            return
 
-        return current
+        plan = self.engine.get_Plan(self.displayName)
 
-    def set_UnitAbbreviations_Power(self):
-        """Maps all scales for power units to their equivalent abbreviations."""
+        inputTexts = self.parameterPanel.get_InputTexts()
+        inputValues = [self.get_ParameterValue(inputText) for inputText in inputTexts]
+        inputUnitScales = self.parameterPanel.get_InputUnitScales()
 
-        power = {
-            "WATTS": "W",
-            "MEGAWATTS": "MW",
-            "MILLIWATTS": "mW",
-            "MICROWATTS": "µW"
-        }
-
-        return power
-
-    def set_UnitAbbreviations_Voltage(self):
-        """Maps all scales for voltage units to their equivalent abbreviations."""
-
-        voltage = {
-            "VOLTS": "V",
-            "KILOVOLTS": "KV",
-            "MILLIVOLTS": "mV",
-            "MICROVOLTS": "µV"
-        }
+        if plan.tupleMode:
+            # Only pass the values up to the last parameter that was filled in
+            while inputTexts and inputTexts[-1] == "":
+                inputTexts.pop()
 
-        return voltage
+            inputValues = inputValues[:len(inputTexts)]
+            inputUnitScales = inputUnitScales[:len(inputTexts)]
 
-    def set_UnitAbbreviations_Distance(self):
-        """Maps all scales for distance units to their equivalent abbreviations."""
-
-        distance = {
-            "METERS": "m",
-            "CENTIMETERS": "cm",
-            "MILLIMETERS": "mm",
-            "KILOMETERS": "Km"
-        }
-
-        return distance
-
-    def set_UnitAbbreviations_Time(self):
-        """Maps all scales for time units to their equivalent abbreviations."""
-
-        time = {
-            "SECONDS": "s",
-            "MILLISECONDS": "ms",
-            "MICROSECONDS": "µs"
-        }
+            if not inputValues:
+                self.set_lblErrorDisplay("Enter at least one value")
+                return
+        else:
+            inputValues = inputValues[:plan.arity]
+            inputUnitScales = inputUnitScales[:plan.arity]
 
-        return time
+        # Execute appropriate function in electronics_calculator module
+        self.calculationRunner.submit(self.displayName, inputValues, inputUnitScales, self.outputUnitScale)
 
-    def set_UnitAbbreviations_Angle(self):
-        """Maps all scales for angle units to their equivalent abbreviations."""
+        return
 
-        angle = {
-            "DEGREES": "°"
-        }
+    def is_ReadyForLiveCalculation(self):
+        """
+        Returns True when the inputs of the selected calculation can be evaluated as they stand: every input is numeric
+        and every required input is filled in. Validity is kept up to date per keystroke by the parameter panel, so
+        nothing is parsed here.
+        """
 
-        return angle
+        if self.displayName is None or not self.parameterPanel.is_InputValid():
+            return False
 
-    def set_UnitAbbreviations_GainA(self):
-        """Maps all scales for Gain (ratio) units to their equivalent abbreviations."""
+        plan = self.engine.get_Plan(self.displayName)
+        inputTexts = self.parameterPanel.get_InputTexts()
 
-        gaindb = {
-            "RATIO": "A"
-        }
+        if plan.tupleMode:
+            # Every box up to the last one filled in; a blank among them would be passed as 0
+            filled = [count for count, inputText in enumerate(inputTexts, 1) if inputText]
 
-        return gaindb
+            return bool(filled) and all(inputTexts[:filled[-1]])
 
-    def set_UnitAbbreviations_GainDB(self):
-        """Maps all scales for gain (dB) units to their equivalent abbreviations."""
+        return all(inputTexts[:plan.arity])
 
-        gaina = {
-            "DECIBELS": "dB"
-        }
+    def set_lblErrorDisplay(self, message):
+        message = "ERROR: %s" % message
+        self.lblErrorDisplay.setText(message)
+        self.lblErrorDisplay.show()
 
-        return gaina
+        return
 
     def set_Parameters(self, selectedIndex):
-        """Controls the appearance of the input parameters for the calculations"""
+        """Shows one input row per parameter of the selected calculation, reusing the rows that are already built"""
+
+        parameters = {}
 
         if selectedIndex != -1:
             displayName = self.get_DisplayName(selectedIndex)
 
             # Get dictionary of all parameters for this calculation, along with their default unit types
             parameters = self.get_Data("parameters", displayName)
-            parameterCount = len(parameters) / 2
-
-            if parameterCount == 5:
-                self.lblParameter_5.show()
-                self.txtParameter_5.show()
-                self.cmbUnitOptions_5.show()
-                self.inputUnitOptions_5 = self.get_UnitDictionary(parameters["inputUnitScale_5"], "parameter_5")
-                self.cmbUnitOptions_5.addItems(self.inputUnitOptions_5)
-                self.lblParameter_5.setText(parameters["parameter_5"] + ":")
-
-                self.lblParameter_4.show()
-                self.txtParameter_4.show()
-                self.cmbUnitOptions_4.show()
-                self.inputUnitOptions_4 = self.get_UnitDictionary(parameters["inputUnitScale_4"], "parameter_4")
-                self.cmbUnitOptions_4.addItems(self.inputUnitOptions_4)
-                self.lblParameter_4.setText(parameters["parameter_4"] + ":")
-
-                self.lblParameter_3.show()
-                self.txtParameter_3.show()
-                self.cmbUnitOptions_3.show()
-                self.inputUnitOptions_3 = self.get_UnitDictionary(parameters["inputUnitScale_3"], "parameter_3")
-                self.cmbUnitOptions_3.addItems(self.inputUnitOptions_3)
-                self.lblParameter_3.setText(parameters["parameter_3"] + ":")
-
-                self.lblParameter_2.show()
-                self.txtParameter_2.show()
-                self.cmbUnitOptions_2.show()
-                self.inputUnitOptions_2 = self.get_UnitDictionary(parameters["inputUnitScale_2"], "parameter_2")
-                self.cmbUnitOptions_2.addItems(self.inputUnitOptions_2)
-                self.lblParameter_2.setText(parameters["parameter_2"] + ":")
-
-                self.lblParameter_1.show()
-                self.txtParameter_1.show()
-                self.cmbUnitOptions_1.show()
-                self.inputUnitOptions_1 = self.get_UnitDictionary(parameters["inputUnitScale_1"], "parameter_1")
-                self.cmbUnitOptions_1.addItems(self.inputUnitOptions_1)
-                self.lblParameter_1.setText(parameters["parameter_1"] + ":")
-
-            elif parameterCount == 4:
-                self.lblParameter_5.hide()
-                self.txtParameter_5.hide()
-                self.cmbUnitOptions_5.hide()
-
-                self.lblParameter_4.show()
-                self.txtParameter_4.show()
-                self.cmbUnitOptions_4.show()
-                self.inputUnitOptions_4 = self.get_UnitDictionary(parameters["inputUnitScale_4"], "parameter_4")
-                self.cmbUnitOptions_4.addItems(self.inputUnitOptions_4)
-                self.lblParameter_4.setText(parameters["parameter_4"] + ":")
-
-                self.lblParameter_3.show()
-                self.txtParameter_3.show()
-                self.cmbUnitOptions_3.show()
-                self.inputUnitOptions_3 = self.get_UnitDictionary(parameters["inputUnitScale_3"], "parameter_3")
-                self.cmbUnitOptions_3.addItems(self.inputUnitOptions_3)
-                self.lblParameter_3.setText(parameters["parameter_3"] + ":")
-
-                self.lblParameter_2.show()
-                self.txtParameter_2.show()
-                self.cmbUnitOptions_2.show()
-                self.inputUnitOptions_2 = self.get_UnitDictionary(parameters["inputUnitScale_2"], "parameter_2")
-                self.cmbUnitOptions_2.addItems(self.inputUnitOptions_2)
-                self.lblParameter_2.setText(parameters["parameter_2"] + ":")
-
-                self.lblParameter_1.show()
-                self.txtParameter_1.show()
-                self.cmbUnitOptions_1.show()
-                self.inputUnitOptions_1 = self.get_UnitDictionary(parameters["inputUnitScale_1"], "parameter_1")
-                self.cmbUnitOptions_1.addItems(self.inputUnitOptions_1)
-                self.lblParameter_1.setText(parameters["parameter_1"] + ":")
-
-            elif parameterCount == 3:
-                self.lblParameter_5.hide()
-                self.txtParameter_5.hide()
-                self.cmbUnitOptions_5.hide()
-
-                self.lblParameter_4.hide()
-                self.txtParameter_4.hide()
-                self.cmbUnitOptions_4.hide()
-
-                self.lblParameter_3.show()
-                self.txtParameter_3.show()
-                self.cmbUnitOptions_3.show()
-                self.inputUnitOptions_3 = self.get_UnitDictionary(parameters["inputUnitScale_3"], "parameter_3")
-                self.cmbUnitOptions_3.addItems(self.inputUnitOptions_3)
-                self.lblParameter_3.setText(parameters["parameter_3"] + ":")
-
-                self.lblParameter_2.show()
-                self.txtParameter_2.show()
-                self.cmbUnitOptions_2.show()
-                self.inputUnitOptions_2 = self.get_UnitDictionary(parameters["inputUnitScale_2"], "parameter_2")
-                self.cmbUnitOptions_2.addItems(self.inputUnitOptions_2)
-                self.lblParameter_2.setText(parameters["parameter_2"] + ":")
-
-                self.lblParameter_1.show()
-                self.txtParameter_1.show()
-                self.cmbUnitOptions_1.show()
-                self.inputUnitOptions_1 = self.get_UnitDictionary(parameters["inputUnitScale_1"], "parameter_1")
-                self.cmbUnitOptions_1.addItems(self.inputUnitOptions_1)
-                self.lblParameter_1.setText(parameters["parameter_1"] + ":")
-
-            elif parameterCount == 2:
-                self.lblParameter_5.hide()
-                self.txtParameter_5.hide()
-                self.cmbUnitOptions_5.hide()
-
-                self.lblParameter_4.hide()
-                self.txtParameter_4.hide()
-                self.cmbUnitOptions_4.hide()
-
-                self.lblParameter_3.hide()
-                self.txtParameter_3.hide()
-                self.cmbUnitOptions_3.hide()
-
-                self.lblParameter_2.show()
-                self.txtParameter_2.show()
-                self.cmbUnitOptions_2.show()
-                self.inputUnitOptions_2 = self.get_UnitDictionary(parameters["inputUnitScale_2"], "parameter_2")
-                self.cmbUnitOptions_2.addItems(self.inputUnitOptions_2)
-                self.lblParameter_2.setText(parameters["parameter_2"] + ":")
-
-                self.lblParameter_1.show()
-                self.txtParameter_1.show()
-                self.cmbUnitOptions_1.show()
-                self.inputUnitOptions_1 = self.get_UnitDictionary(parameters["inputUnitScale_1"], "parameter_1")
-                self.cmbUnitOptions_1.addItems(self.inputUnitOptions_1)
-                self.lblParameter_1.setText(parameters["parameter_1"] + ":")
-
-            elif parameterCount == 1:
-                self.lblParameter_5.hide()
-                self.txtParameter_5.hide()
-                self.cmbUnitOptions_5.hide()
-
-                self.lblParameter_4.hide()
-                self.txtParameter_4.hide()
-                self.cmbUnitOptions_4.hide()
-
-                self.lblParameter_3.hide()
-                self.txtParameter_3.hide()
-                self.cmbUnitOptions_3.hide()
-
-                self.lblParameter_2.hide()
-                self.txtParameter_2.hide()
-                self.cmbUnitOptions_2.hide()
-
-                self.lblParameter_1.show()
-                self.txtParameter_1.show()
-                self.cmbUnitOptions_1.show()
-                self.inputUnitOptions_1 = self.get_UnitDictionary(parameters["inputUnitScale_1"], "parameter_1")
-                self.cmbUnitOptions_1.addItems(self.inputUnitOptions_1)
-                self.lblParameter_1.setText(parameters["parameter_1"] + ":")
-
-        else:
-            self.lblParameter_5.hide()
-            self.txtParameter_5.hide()
-            self.cmbUnitOptions_5.hide()
-
-            self.lblParameter_4.hide()
-            self.txtParameter_4.hide()
-            self.cmbUnitOptions_4.hide()
-
-            self.lblParameter_3.hide()
-            self.txtParameter_3.hide()
-            self.cmbUnitOptions_3.hide()
-
-            self.lblParameter_2.hide()
-            self.txtParameter_2.hide()
-            self.cmbUnitOptions_2.hide()
 
-            self.lblParameter_1.hide()
-            self.txtParameter_1.hide()
-            self.cmbUnitOptions_1.hide()
+        self.parameterPanel.set_Parameters(parameters)
 
         return
 
@@ -628,33 +316,23 @@ class App(QMainWindow):
     def set_lblOutputUnitValue(self, selectedIndex):
         """Sets the lblOutputUnitValue control with the abbreviation of the currently selected output unit"""
 
-        displayName = self.get_DisplayName(selectedIndex)
-        self.outputUnitScale = str(self.get_Data("outputUnitScale", displayName))
-        unitAbbreviation = self.get_UnitAbbreviation_Combined(self.outputUnitScale)
-        self.lblOutputUnitValue.setText(unitAbbreviation)
-        self.lblOutputUnitValue.show()
-
-        return
-
-    def set_inputUnitValues(self, selectedIndex):
-        displayName = self.get_DisplayName(selectedIndex)
-        self.inputUnitOptions_1 = str(self.get_Data("inputUnitScale_1", displayName))
-        self.inputUnitOptions_2 = str(self.get_Data("inputUnitScale_2", displayName))
-        self.inputUnitOptions_3 = str(self.get_Data("inputUnitScale_3", displayName))
-        self.inputUnitOptions_4 = str(self.get_Data("inputUnitScale_4", displayName))
-        self.inputUnitOptions_5 = str(self.get_Data("inputUnitScale_5", displayName))
+        if selectedIndex > -1:
+            displayName = self.get_DisplayName(selectedIndex)
+            self.outputUnitScale = str(self.get_Data("outputUnitScale", displayName))
+            unitAbbreviation = self.get_UnitAbbreviation_Combined(self.outputUnitScale)
+            self.lblOutputUnitValue.setText(unitAbbreviation)
+            self.lblOutputUnitValue.show()
 
         return
 
     def get_Data(self, dataItem, displayName):
-        """Extracts data from self.calculations list of dictionaries"""
+        """Extracts data for one calculation using the catalog's displayName index"""
 
         retval = object
+        calculation = self.catalog.byDisplayName.get(displayName)
 
-        for calculation in self.calculations:
-            if calculation["displayName"] == displayName:
-                retval = calculation[dataItem]
-                break
+        if calculation is not None:
+            retval = calculation[dataItem]
 
         return retval
 
@@ -669,13 +347,12 @@ class App(QMainWindow):
             unit [str] - The unit whose abbreviation we are seeking
 
         Output:
-            unitAbbreviations[unit] [str] - The abbreviation
+            abbreviation [str] - The abbreviation
         """
         retval = ""
 
         if unit != "-- Change Unit --":
-            unitAbbreviations = self.set_UnitAbbreviations_Combined()
-            retval = unitAbbreviations[unit]
+            retval = get_UnitScale(unit).abbreviation
 
         return retval
 
@@ -696,94 +373,23 @@ class App(QMainWindow):
         unitType = ""
         unitDictionary = {}
 
-        capacitance = self.set_UnitAbbreviations_Capacitance()
-        inductance = self.set_UnitAbbreviations_Inductance()
-        resistance = self.set_UnitAbbreviations_Resistance()
-        frequency = self.set_UnitAbbreviations_Frequency()
-        current = self.set_UnitAbbreviations_Current()
-        power = self.set_UnitAbbreviations_Power()
-        voltage = self.set_UnitAbbreviations_Voltage()
-        distance = self.set_UnitAbbreviations_Distance()
-        time = self.set_UnitAbbreviations_Time()
-        angle = self.set_UnitAbbreviations_Angle()
-        gainDB = self.set_UnitAbbreviations_GainDB()
-        gainA = self.set_UnitAbbreviations_GainA()
-
         # Check which unit type contains the default scale passed in
-        if unit in capacitance:
-            unitDictionary = capacitance
-            unitType = "Capacitance"
-
-        elif unit in inductance:
-            unitDictionary = inductance
-            unitType = "Inductance"
-
-        elif unit in resistance:
-            unitDictionary = resistance
-            unitType = "Resistance"
-
-        elif unit in frequency:
-            unitDictionary = frequency
-            unitType = "Frequency"
-
-        elif unit in current:
-            unitDictionary = current
-            unitType = "Current"
-
-        elif unit in power:
-            unitDictionary = power
-            unitType = "Power"
-
-        elif unit in voltage:
-            unitDictionary = voltage
-            unitType = "Voltage"
-
-        elif unit in distance:
-            unitDictionary = distance
-            unitType = "Distance"
-
-        elif unit in time:
-            unitDictionary = time
-            unitType = "Time"
-
-        elif unit in angle:
-            unitDictionary = angle
-            unitType = "Angle"
-
-        elif unit in gainDB:
-            unitDictionary = gainDB
-            unitType = "GainDB"
-
-        elif unit in gainA:
-            unitDictionary = gainA
-            unitType = "GainA"
+        if unit in UNIT_SCALES:
+            unitType = UNIT_SCALES[unit].unitType
+            unitDictionary = get_SiblingScales(unit)
 
         if purpose == "output":
             self.outputUnitType = unitType
 
-        elif purpose == "parameter_1":
-            self.inputUnitType_1 = unitType
-
-        elif purpose == "parameter_2":
-            self.inputUnitType_2 = unitType
-
-        elif purpose == "parameter_3":
-            self.inputUnitType_3 = unitType
-
-        elif purpose == "parameter_4":
-            self.inputUnitType_4 = unitType
-
-        elif purpose == "parameter_5":
-            self.inputUnitType_5 = unitType
-
         return unitDictionary
 
     # ==============
     # EVENT HANDLERS
     # ==============
     def cmdClear_Click(self):
-        # Clear calculation selector
+        # Clear calculation selector and search
         self.cmbCalculationSelect.setCurrentIndex(0)
+        self.txtCalculationSearch.clear_Search()
 
         # Clear lcd value
         self.lcdOutput.display(0)
@@ -795,19 +401,8 @@ class App(QMainWindow):
         self.cmbChangeOutputUnit.setCurrentIndex(0)
         self.cmbChangeOutputUnit.hide()
 
-        # Clear input unit selectors
-        self.cmbUnitOptions_1.setCurrentIndex(0)
-        self.cmbUnitOptions_2.setCurrentIndex(0)
-        self.cmbUnitOptions_3.setCurrentIndex(0)
-        self.cmbUnitOptions_4.setCurrentIndex(0)
-        self.cmbUnitOptions_5.setCurrentIndex(0)
-
-        # Clear input parameters
-        self.txtParameter_1.setText("")
-        self.txtParameter_2.setText("")
-        self.txtParameter_3.setText("")
-        self.txtParameter_4.setText("")
-        self.txtParameter_5.setText("")
+        # Clear input parameters and their unit selectors
+        self.parameterPanel.clear_Inputs()
 
         # Clear Calculation Description
         self.lblFormulaDescription.setText("")
@@ -818,16 +413,56 @@ class App(QMainWindow):
 
     def cmdCalculate_Click(self):
         self.lcdOutput.display(0)
-        result = self.calculate()
+        self.calculate()
+
+        return
+
+    def parameterPanel_InputChanged(self):
+        if self.liveCalculation:
+            self.tmrLiveCalculation.start()  # restarts the delay, so a burst of typing is evaluated once
+
+        return
+
+    def tmrLiveCalculation_Timeout(self):
+        if self.is_ReadyForLiveCalculation():
+            self.calculate()
+        else:
+            # Incomplete or non-numeric input has no result; show none rather than the error of a calculation
+            self.calculationRunner.cancel()
+            self.lcdOutput.display(0)
+            self.lblErrorDisplay.clear()
+            self.lblErrorDisplay.hide()
+
+        return
+
+    def menuLiveCalculation_Toggled(self, checked):
+        self.liveCalculation = checked
+
+        if checked:
+            self.tmrLiveCalculation.start()
+        else:
+            self.tmrLiveCalculation.stop()
+
+        return
+
+    def calculationRunner_Finished(self, result):
         self.lcdOutput.display(result)
 
+        if self.lblLatency is not None:
+            self.lblLatency.setText("Last calculation: %.2f ms" % profiling.profiler.get_Last("calculation"))
+
+        return
+
+    def calculationRunner_Failed(self, message):
+        self.set_lblErrorDisplay(message)
+
         return
 
     def cmbUnitOptions_Change(self, index):
         if index != -1:  # we only care if a unit has been physically selected for change
 
-            # re-calculate if we are changing the scale of a value that has already been calculated
-            if self.lcdOutput.value() != 0:
+            # re-calculate if we are changing the scale of a value that has already been calculated, or is being
+            if self.lcdOutput.value() != 0 or self.calculationRunner.isPending():
                 self.cmdCalculate_Click()
 
     def cmbChangeOutputUnit_Change(self, index):
@@ -836,31 +471,36 @@ class App(QMainWindow):
             unitAbbreviation = self.get_UnitAbbreviation_Combined(self.outputUnitScale)
             self.lblOutputUnitValue.setText(unitAbbreviation)
 
-            # re-calculate if we are changing the scale of a value that has already been calculated
-            if self.lcdOutput.value() != 0:
+            # re-calculate if we are changing the scale of a value that has already been calculated, or is being
+            if self.lcdOutput.value() != 0 or self.calculationRunner.isPending():
                 self.cmdCalculate_Click()
 
+    def txtCalculationSearch_Chosen(self, position):
+        self.cmbCalculationSelect.setCurrentIndex(position + 1)  # add one for the placeholder
+
+        # The search is done; go on to entering the inputs
+        txtParameters = self.parameterPanel.txtParameters
+
+        if txtParameters:
+            txtParameters[0].setFocus()
+
+        return
+
+    @profiling.timed
     def cmbCalculationSelect_Change(self, index):
         selectedIndex = int(index - 1)  # subtract one to accommodate for the injected placeholder
         self.statusBar.showMessage("")
-        # Reset control values
+        self.calculationRunner.cancel()  # a result still on its way belongs to the previous calculation
+        # Reset control values. Controls that the new calculation shows again are not hidden in between, since hiding
+        # a control makes the whole window repaint.
         self.lblOutput.clear()
         self.lblOutputUnitValue.clear()
-        self.lblOutputUnitValue.hide()
+        self.lblOutputUnitValue.setVisible(selectedIndex > -1)
         self.lcdOutput.display(0)
-        self.txtParameter_1.setText("")
-        self.txtParameter_2.setText("")
-        self.txtParameter_3.setText("")
-        self.txtParameter_4.setText("")
-        self.txtParameter_5.setText("")
+        self.parameterPanel.clear_Inputs()
         self.lblImg.clear()
-        self.cmbUnitOptions_1.clear()
-        self.cmbUnitOptions_2.clear()
-        self.cmbUnitOptions_3.clear()
-        self.cmbUnitOptions_4.clear()
-        self.cmbUnitOptions_5.clear()
         self.cmbChangeOutputUnit.clear()
-        self.cmbChangeOutputUnit.hide()
+        self.cmbChangeOutputUnit.setVisible(selectedIndex > -1)
         self.lblFormulaDescription.clear()
         self.lblErrorDisplay.clear()
         self.lblErrorDisplay.hide()
@@ -869,21 +509,27 @@ class App(QMainWindow):
         # Set control values for new calculation #
         # ====================================== #
 
-        if selectedIndex > -1:
-            displayName = self.get_DisplayName(selectedIndex)
-            description = str(self.get_Data("description", displayName)).split("\n")
-            formulaImageName = str(self.get_Data("formulaImage", displayName))
-            self.methodName = str(self.get_Data("methodName", displayName))
-            self.outputUnitScale = str(self.get_Data("outputUnitScale", displayName))
+        for action in self.calculationActions:
+            action.setEnabled(selectedIndex > -1)
 
+        if selectedIndex == -1:
+            # The placeholder: nothing is selected, so nothing is left to calculate, sweep, solve or evaluate
+            self.displayName = None
+            self.methodName = None
+            self.outputUnitScale = None
+        else:
+            self.displayName = self.get_DisplayName(selectedIndex)
+            calculation = self.catalog.byDisplayName[self.displayName]
+            description = calculation["description"].split("\n")
+            formulaImageName = calculation["formulaImage"]
+            self.methodName = calculation["methodName"]
+            self.outputUnitScale = calculation["outputUnitScale"]
 
-            # Change formula image
-            imagePath = os.path.join("images", formulaImageName)
-            image = QPixmap(imagePath)
-            self.lblImg.setPixmap(image)
+            # Change formula image, and start decoding the images of the calculations around it
+            self.set_lblImg(formulaImageName)
+            self.prefetch_FormulaImages(selectedIndex)
 
             self.outputUnitOptions = self.get_UnitDictionary(self.outputUnitScale, "output")
-            self.cmbChangeOutputUnit.show()
             self.cmbChangeOutputUnit.addItems(self.outputUnitOptions)
 
             newDescription = ""
@@ -905,6 +551,85 @@ class App(QMainWindow):
 
         return
 
+    def set_lblImg(self, formulaImageName):
+        """Shows a formula image from the image cache, or a note when the image file is missing or unreadable"""
+
+        pixmap = self.formulaImages.get_Pixmap(formulaImageName)
+
+        if pixmap is None:
+            self.lblImg.setText("Formula image not available")
+        else:
+            self.lblImg.setPixmap(pixmap)
+
+        return
+
+    def prefetch_FormulaImages(self, selectedIndex):
+        """Decodes the formula images of the calculations within PREFETCH_DISTANCE of selectedIndex in the background"""
+
+        first = max(selectedIndex - PREFETCH_DISTANCE, 0)
+        displayNames = self.listDisplayNames[first:selectedIndex + PREFETCH_DISTANCE + 1]
+        self.formulaImages.prefetch([self.catalog.byDisplayName[displayName]["formulaImage"]
+                                     for displayName in displayNames])
+
+        return
+
+    def menuSweep_Triggered(self):
+        if self.displayName is None:
+            self.set_lblErrorDisplay("Select a calculation to sweep")
+            return
+
+        # Imported here, so NumPy is only loaded once a sweep is wanted
+        from ElectricalEngineeringCalculator.sweep import SweepDialog
+
+        sweepDialog = SweepDialog(self.engine, self.catalog.byDisplayName[self.displayName], self.fontLabel,
+                                  self.fontCombo, self)
+        sweepDialog.set_Inputs(self.parameterPanel.get_InputTexts(),
+                               [cmbUnitOptions.currentIndex() for cmbUnitOptions in self.parameterPanel.cmbUnitOptions],
+                               self.outputUnitScale)
+        sweepDialog.show()
+
+        return
+
+    def menuSolve_Triggered(self):
+        if self.displayName is None:
+            self.set_lblErrorDisplay("Select a calculation to solve")
+            return
+
+        # Imported here, so NumPy is only loaded once a solve is wanted
+        from ElectricalEngineeringCalculator.solvedialog import SolveDialog
+        from ElectricalEngineeringCalculator.solver import Solver
+
+        if self.solver is None:
+            self.solver = Solver(self.engine)
+
+        solveDialog = SolveDialog(self.solver, self.catalog.byDisplayName[self.displayName], self.fontLabel,
+                                  self.fontCombo, self)
+        solveDialog.set_Inputs(self.parameterPanel.get_InputTexts(),
+                               [cmbUnitOptions.currentIndex() for cmbUnitOptions in self.parameterPanel.cmbUnitOptions],
+                               self.outputUnitScale)
+        solveDialog.show()
+
+        return
+
+    def menuNetworks_Triggered(self):
+        if self.displayName is None:
+            self.set_lblErrorDisplay("Select a series or parallel calculation")
+            return
+
+        if not self.engine.get_Plan(self.displayName).tupleMode:
+            self.set_lblErrorDisplay("Networks of values are taken by the series and parallel calculations only")
+            return
+
+        # Imported here, so NumPy is only loaded once networks are wanted
+        from ElectricalEngineeringCalculator.networkdialog import NetworkDialog
+
+        networkDialog = NetworkDialog(self.engine, self.catalog.byDisplayName[self.displayName], self.fontLabel, self)
+        unitIndexes = [cmbUnitOptions.currentIndex() for cmbUnitOptions in self.parameterPanel.cmbUnitOptions]
+        networkDialog.set_Inputs(self.parameterPanel.get_InputTexts(), unitIndexes, self.outputUnitScale)
+        networkDialog.show()
+
+        return
+
     def menuAbout_Triggered(self):
         msgAbout = QMessageBox()
         msgAbout.setObjectName("msgAbout")
@@ -927,28 +652,29 @@ class App(QMainWindow):
     def __init__(self):
         super().__init__()
         self.fontLabel = None  # Font control for lblCalcOptions, lblFormulaDescriptionTitle, lblFormula,
-        # lblParameter_1 to lblParameter_5, txtParameter_1 to txtParameter_5
+        # and the label and text box of every parameter row
 
-        self.fontCombo = None  # Font control for cmbUnitOptions_1 through cmbUnitOptions_5
+        self.fontCombo = None  # Font control for the unit combo of every parameter row
         self.fontCombo2 = None  # Font control for cmbCalculationSelect
         self.fontButton = None  # Font control for cmdCalculate and cmdClear
         self.fontDescription = None  # Font control for lblFormulaDescription
-        self.inputUnitType_5 = None  # Used for scaling the input of parameter 5 for calculation
-        self.inputUnitType_4 = None  # Used for scaling the input of parameter 4 for calculation
-        self.inputUnitType_3 = None  # Used for scaling the input of parameter 3 for calculation
-        self.inputUnitType_2 = None  # Used for scaling the input of parameter 2 for calculation
-        self.inputUnitType_1 = None  # Used for scaling the input of parameter 1 for calculation
         self.outputUnitType = None  # Used for scaling the output of calculation
         self.listDisplayNames = None  # List of displayNames for all calculations
+        self.displayName = None  # Holds the displayName of the currently selected calculation
         self.methodName = None  # Holds the name of the currently selected calculation method
         self.outputUnitScale = None  # Holds the default value of the currently selected output unit
-        self.inputUnitOptions_5 = None  # Dictionary of scale items for a given input unit type of parameter 5
-        self.inputUnitOptions_4 = None  # Dictionary of scale items for a given input unit type of parameter 4
-        self.inputUnitOptions_3 = None  # Dictionary of scale items for a given input unit type of parameter 3
-        self.inputUnitOptions_2 = None  # Dictionary of scale items for a given input unit type of parameter 2
-        self.inputUnitOptions_1 = None  # Dictionary of scale items for a given input unit type of parameter 1
         self.outputUnitOptions = None  # Dictionary of scale items for a given output unit type
+        self.catalog = None  # Catalog of all calculations, indexed by displayName and methodName
         self.calculations = None  # List of dictionaries for all XML data for all calculations
+        self.engine = None  # CalculationEngine holding the precompiled call plan of every calculation
+        self.solver = None  # Solver shared by every Solve For dialog, made on first use so its history carries over
+        self.calculationRunner = None  # CalculationRunner evaluating calculations off the GUI thread
+        self.formulaImages = None  # FormulaImageCache of the decoded formula images
+        self.parameterPanel = None  # ParameterPanel holding one input row per parameter of the selected calculation
+        self.liveCalculation = False  # Recalculate as the inputs change, rather than on Calculate only
+        self.tmrLiveCalculation = None  # Single shot QTimer delaying live calculation until typing pauses
+        self.lblLatency = None  # Status bar readout of the latest calculation's latency, made only when profiling
+        self.calculationActions = None  # Menu actions that open a dialog for the selected calculation
 
         self.title = 'Electrical Engineering Calculator'
         self.width = 800
@@ -957,6 +683,7 @@ class App(QMainWindow):
         self.top = 15
         self.init_UI()
 
+    @profiling.timed
     def init_UI(self):
         """Initialize all application objects"""
 
@@ -964,59 +691,16 @@ class App(QMainWindow):
         self.setGeometry(self.left, self.top, self.width, self.height)
 
         # Populate various lists from XML file
-        with open("calculations.xml", "r") as f:
-            data = f.read()
-            doc = BeautifulSoup(data, "xml")
-
-            listMethods = []
-            listCalculation = []
-
-        for node in doc.contents[0].contents:
-            if node != '\n':
-                listCalculation.append(node)
-
-        for calculation in listCalculation:
-            methodName = calculation.attrs.get("methodName")
-            displayName = calculation.attrs.get("displayName")
-            formulaImage = calculation.attrs.get("formulaImage")
-            description = calculation.description.get_text()
-            outputName = calculation.output.attrs.get("outputName")
-            outputUnitScale = calculation.output.attrs.get("outputUnitScale")
-            parameters = calculation.input_parameters
-
-            count = 1
-            dictParameter = {}
-
-            for parameter in parameters:
-                if parameter != '\n':
-                    paramName = parameter.attrs.get("paramName")
-                    dictParameter["parameter_%d" % count] = paramName
-                    inputUnitScale = parameter.attrs.get("inputUnitScale")
-                    dictParameter["inputUnitScale_%d" % count] = inputUnitScale
-                    count += 1
-
-            dictMethod = {
-                "methodName": methodName,
-                "displayName": displayName,
-                "formulaImage": formulaImage,
-                "description": description,
-                "parameters": dictParameter,
-                "outputName": outputName,
-                "outputUnitScale": outputUnitScale
-            }
-
-            listMethods.append(dictMethod)
-
-        self.calculations = listMethods
+        with profiling.stage("catalog load"):
+            self.catalog = Catalog(loadCalculationsCached())
 
-        self.listDisplayNames = []
+        self.calculations = self.catalog.calculations
+        self.listDisplayNames = self.catalog.displayNames
 
-        for calculation in self.calculations:
-            self.listDisplayNames.append(calculation["displayName"])
+        with profiling.stage("engine build"):
+            self.engine = CalculationEngine(self.catalog)
 
-        self.listDisplayNames.sort()
-
-        self.unitAbbreviations_Combined = self.set_UnitAbbreviations_Combined()
+        self.init_calculationRunner()
 
         # Initialize all child controls
         self.init_fonts()
@@ -1040,6 +724,15 @@ class App(QMainWindow):
 
         return
 
+    @profiling.timed
+    def init_calculationRunner(self):
+        self.calculationRunner = CalculationRunner(self.engine, self)
+        self.calculationRunner.calculationFinished.connect(self.calculationRunner_Finished)
+        self.calculationRunner.calculationFailed.connect(self.calculationRunner_Failed)
+
+        return
+
+    @profiling.timed
     def init_fonts(self):
         self.fontLabel = QFont()
         self.fontLabel.setPointSize(12)
@@ -1058,6 +751,7 @@ class App(QMainWindow):
 
         return
 
+    @profiling.timed
     def init_menuBar(self):
         mainMenu = self.menuBar()
 
@@ -1069,7 +763,43 @@ class App(QMainWindow):
         fileMenu_Exit.triggered.connect(self.close)
         fileMenu.addAction(fileMenu_Exit)
 
-        # calculationsMenu = mainMenu.addMenu('&Calculations')
+        calculationsMenu = mainMenu.addMenu('&Calculations')
+        calculationsMenu_Live = QAction('&Live Calculation', self)
+        calculationsMenu_Live.setObjectName("calculationsMenu_Live")
+        calculationsMenu_Live.setCheckable(True)
+        calculationsMenu_Live.setShortcut('Ctrl+L')
+        calculationsMenu_Live.setStatusTip('Recalculate as the inputs are typed')
+        calculationsMenu_Live.toggled.connect(self.menuLiveCalculation_Toggled)
+        calculationsMenu.addAction(calculationsMenu_Live)
+
+        calculationsMenu_Sweep = QAction('&Sweep...', self)
+        calculationsMenu_Sweep.setObjectName("calculationsMenu_Sweep")
+        calculationsMenu_Sweep.setShortcut('Ctrl+Shift+S')
+        calculationsMenu_Sweep.setStatusTip('Sweep one input of the selected calculation over a range and plot it')
+        calculationsMenu_Sweep.triggered.connect(self.menuSweep_Triggered)
+        calculationsMenu.addAction(calculationsMenu_Sweep)
+
+        calculationsMenu_Solve = QAction('Solve &For...', self)
+        calculationsMenu_Solve.setObjectName("calculationsMenu_Solve")
+        calculationsMenu_Solve.setShortcut('Ctrl+Shift+F')
+        calculationsMenu_Solve.setStatusTip('Find the value of one input of the selected calculation that gives a '
+                                            'target output')
+        calculationsMenu_Solve.triggered.connect(self.menuSolve_Triggered)
+        calculationsMenu.addAction(calculationsMenu_Solve)
+
+        calculationsMenu_Networks = QAction('&Networks...', self)
+        calculationsMenu_Networks.setObjectName("calculationsMenu_Networks")
+        calculationsMenu_Networks.setShortcut('Ctrl+Shift+N')
+        calculationsMenu_Networks.setStatusTip('Evaluate the selected series or parallel calculation for lists of any '
+                                               'number of values')
+        calculationsMenu_Networks.triggered.connect(self.menuNetworks_Triggered)
+        calculationsMenu.addAction(calculationsMenu_Networks)
+
+        # Enabled once a calculation is selected
+        self.calculationActions = [calculationsMenu_Sweep, calculationsMenu_Solve, calculationsMenu_Networks]
+
+        for action in self.calculationActions:
+            action.setEnabled(False)
 
         helpMenu = mainMenu.addMenu('&Help')
 
@@ -1087,6 +817,7 @@ class App(QMainWindow):
 
         return
 
+    @profiling.timed
     def init_calculationSelectControls(self):
         self.lblCalcOptions = QLabel("Solving for:")
         self.lblCalcOptions.setParent(self)
@@ -1106,8 +837,16 @@ class App(QMainWindow):
 
         self.cmbCalculationSelect.currentIndexChanged.connect(self.cmbCalculationSelect_Change)
 
+        self.txtCalculationSearch = CalculationSearchBox(self.catalog, self)
+        self.txtCalculationSearch.setGeometry(460, 30, 330, 25)
+        self.txtCalculationSearch.setFont(self.fontCombo2)
+        self.txtCalculationSearch.setPlaceholderText("Search calculations")
+        self.txtCalculationSearch.setToolTip("Type part of a calculation's name, parameters or description")
+        self.txtCalculationSearch.calculationChosen.connect(self.txtCalculationSearch_Chosen)
+
         return
 
+    @profiling.timed
     def init_lcdOutputControls(self):
         self.lcdOutput = QLCDNumber()
         self.lcdOutput.setParent(self)
@@ -1125,6 +864,7 @@ class App(QMainWindow):
 
         return
 
+    @profiling.timed
     def init_outputUnitControls(self):
         self.lblOutputUnitValue = QLabel()
         self.lblOutputUnitValue.setObjectName("lblOutputUnitValue")
@@ -1138,6 +878,7 @@ class App(QMainWindow):
 
         return
 
+    @profiling.timed
     def init_cmbChangeOutputUnit(self):
         self.cmbChangeOutputUnit = QComboBox()
         self.cmbChangeOutputUnit.setObjectName("cmbChangeOutputUnit")
@@ -1148,107 +889,23 @@ class App(QMainWindow):
 
         return
 
+    @profiling.timed
     def init_inputParameterControls(self):
-        self.lblParameter_1 = QLabel("Parameter_1:")
-        self.lblParameter_1.setParent(self)
-        self.lblParameter_1.setGeometry(13, 130, 290, 25)
-        self.lblParameter_1.setFont(self.fontLabel)
-
-        self.txtParameter_1 = QLineEdit()
-        self.txtParameter_1.setParent(self)
-        self.txtParameter_1.setGeometry(10, 155, 290, 25)
-        self.txtParameter_1.setFont(self.fontLabel)
-        self.txtParameter_1.setAlignment(Qt.AlignRight)
-        self.txtParameter_1.setMaxLength(27)
-        self.txtParameter_1.setToolTip("Enter a number for this parameter")
-
-        self.cmbUnitOptions_1 = QComboBox()
-        self.cmbUnitOptions_1.setParent(self)
-        self.cmbUnitOptions_1.setGeometry(305, 155, 150, 25)
-        self.cmbUnitOptions_1.setFont(self.fontCombo)
-        self.cmbUnitOptions_1.currentIndexChanged.connect(self.cmbUnitOptions_Change)
-        self.cmbUnitOptions_1.setToolTip("Select the applicable unit scale for this input")
-
-        self.lblParameter_2 = QLabel("Parameter_2:")
-        self.lblParameter_2.setParent(self)
-        self.lblParameter_2.setGeometry(13, 200, 290, 25)
-        self.lblParameter_2.setFont(self.fontLabel)
-
-        self.txtParameter_2 = QLineEdit()
-        self.txtParameter_2.setParent(self)
-        self.txtParameter_2.setGeometry(10, 225, 290, 25)
-        self.txtParameter_2.setFont(self.fontLabel)
-        self.txtParameter_2.setAlignment(Qt.AlignRight)
-        self.txtParameter_2.setMaxLength(27)
-        self.txtParameter_2.setToolTip("Enter a number for this parameter")
-
-        self.cmbUnitOptions_2 = QComboBox()
-        self.cmbUnitOptions_2.setParent(self)
-        self.cmbUnitOptions_2.setGeometry(305, 225, 150, 25)
-        self.cmbUnitOptions_2.setFont(self.fontCombo)
-        self.cmbUnitOptions_2.currentIndexChanged.connect(self.cmbUnitOptions_Change)
-        self.cmbUnitOptions_2.setToolTip("Select the applicable unit scale for this input")
-
-        self.lblParameter_3 = QLabel("Parameter_3:")
-        self.lblParameter_3.setParent(self)
-        self.lblParameter_3.setGeometry(13, 270, 290, 25)
-        self.lblParameter_3.setFont(self.fontLabel)
-
-        self.txtParameter_3 = QLineEdit()
-        self.txtParameter_3.setParent(self)
-        self.txtParameter_3.setGeometry(10, 295, 290, 25)
-        self.txtParameter_3.setFont(self.fontLabel)
-        self.txtParameter_3.setAlignment(Qt.AlignRight)
-        self.txtParameter_3.setMaxLength(27)
-        self.txtParameter_3.setToolTip("Enter a number for this parameter")
-
-        self.cmbUnitOptions_3 = QComboBox()
-        self.cmbUnitOptions_3.setParent(self)
-        self.cmbUnitOptions_3.setGeometry(305, 295, 150, 25)
-        self.cmbUnitOptions_3.setFont(self.fontCombo)
-        self.cmbUnitOptions_3.currentIndexChanged.connect(self.cmbUnitOptions_Change)
-        self.cmbUnitOptions_3.setToolTip("Select the applicable unit scale for this input")
-
-        self.lblParameter_4 = QLabel("Parameter_4:")
-        self.lblParameter_4.setParent(self)
-        self.lblParameter_4.setGeometry(13, 340, 290, 25)
-        self.lblParameter_4.setFont(self.fontLabel)
-
-        self.txtParameter_4 = QLineEdit()
-        self.txtParameter_4.setParent(self)
-        self.txtParameter_4.setGeometry(10, 365, 290, 25)
-        self.txtParameter_4.setFont(self.fontLabel)
-        self.txtParameter_4.setAlignment(Qt.AlignRight)
-        self.txtParameter_4.setMaxLength(27)
-        self.txtParameter_4.setToolTip("Enter a number for this parameter")
-
-        self.cmbUnitOptions_4 = QComboBox()
-        self.cmbUnitOptions_4.setParent(self)
-        self.cmbUnitOptions_4.setGeometry(305, 365, 150, 25)
-        self.cmbUnitOptions_4.setFont(self.fontCombo)
-        self.cmbUnitOptions_4.currentIndexChanged.connect(self.cmbUnitOptions_Change)
-        self.cmbUnitOptions_4.setToolTip("Select the applicable unit scale for this input")
-
-        self.lblParameter_5 = QLabel("Parameter_5:")
-        self.lblParameter_5.setParent(self)
-        self.lblParameter_5.setGeometry(13, 410, 290, 25)
-        self.lblParameter_5.setFont(self.fontLabel)
-
-        self.txtParameter_5 = QLineEdit()
-        self.txtParameter_5.setParent(self)
-        self.txtParameter_5.setGeometry(10, 435, 290, 25)
-        self.txtParameter_5.setFont(self.fontLabel)
-        self.txtParameter_5.setAlignment(Qt.AlignRight)
-        self.txtParameter_5.setMaxLength(27)
-        self.txtParameter_5.setToolTip("Enter a number for this parameter")
-
-        self.cmbUnitOptions_5 = QComboBox()
-        self.cmbUnitOptions_5.setParent(self)
-        self.cmbUnitOptions_5.setGeometry(305, 435, 150, 25)
-        self.cmbUnitOptions_5.setFont(self.fontCombo)
-        self.cmbUnitOptions_5.currentIndexChanged.connect(self.cmbUnitOptions_Change)
-        self.cmbUnitOptions_5.setToolTip("Select the applicable unit scale for this input")
+        self.parameterPanel = ParameterPanel(self.fontLabel, self.fontCombo, self)
+        self.parameterPanel.setGeometry(10, 130, 445, 350)
+        self.parameterPanel.unitOptionChanged.connect(self.cmbUnitOptions_Change)
+        self.parameterPanel.inputTextChanged.connect(self.parameterPanel_InputChanged)
+        # No rows are shown until a calculation is selected, so build them once the window is up rather than before
+        QTimer.singleShot(0, self.parameterPanel.add_InitialRows)
+
+        self.tmrLiveCalculation = QTimer(self)
+        self.tmrLiveCalculation.setSingleShot(True)
+        self.tmrLiveCalculation.setInterval(LIVE_CALCULATION_DELAY)
+        self.tmrLiveCalculation.timeout.connect(self.tmrLiveCalculation_Timeout)
 
+        return
+
+    @profiling.timed
     def init_lblErrorDisplay(self):
         self.lblErrorDisplay = QLabel()
         self.lblErrorDisplay.setObjectName("lblErrorDisplay")
@@ -1261,7 +918,11 @@ class App(QMainWindow):
 
         return
 
+    @profiling.timed
     def init_formulaDisplayControls(self):
+        self.formulaImages = FormulaImageCache(parent=self)
+        self.prefetch_FormulaImages(0)
+
         self.lblImg = QLabel()
         self.lblImg.setObjectName("lblImg")
         self.lblImg.setParent(self)
@@ -1276,6 +937,7 @@ class App(QMainWindow):
 
         return
 
+    @profiling.timed
     def init_formulaDescription(self):
         self.lblFormulaDescription = QLabel()
         self.lblFormulaDescription.setObjectName("lblFormulaDescription")
@@ -1292,6 +954,7 @@ class App(QMainWindow):
         lblFormulaDescriptionTitle.setAlignment(Qt.AlignLeft)
         # lblFormulaDescriptionTitle.setFont(self.fontLabel)
 
+    @profiling.timed
     def init_cmdCalculate(self):
         self.cmdCalculate = QPushButton("Calculate")
         self.cmdCalculate.setParent(self)
@@ -1301,6 +964,7 @@ class App(QMainWindow):
 
         return
 
+    @profiling.timed
     def init_cmdClear(self):
         self.cmdClear = QPushButton("Clear")
         self.cmdClear.setParent(self)
@@ -1310,11 +974,16 @@ class App(QMainWindow):
 
         return
 
+    @profiling.timed
     def init_statusBar(self):
         self.statusBar = QStatusBar()
         self.statusBar.showMessage('Start by selecting a calculation type to perform.')
         self.setStatusBar(self.statusBar)
 
+        if profiling.ENABLED:
+            self.lblLatency = QLabel("Last calculation: -")
+            self.statusBar.addPermanentWidget(self.lblLatency)
+
         return
 
 
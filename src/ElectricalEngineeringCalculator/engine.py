@@ -0,0 +1,194 @@
+"""GUI-free calculation engine shared by the desktop application and any batch or server callers.
+
+Every calculation in the catalog is compiled once into a CalculationPlan holding the bound
+electronics_calculator function, its arity, whether it takes a tuple of values, and the scale factors of its default
+input and output units. Evaluating a calculation is then a couple of multiplies and a direct call, with no reflection.
+Results are memoized in a bounded ResultCache in front of the call, so repeating a calculation, or asking for it in
+another output unit, does not call electronics_calculator again.
+"""
+
+import ElectronicsCalculator.electronics_calculator as ec
+
+from .catalog import Catalog, loadCalculationsCached
+from .resultcache import DEFAULT_CACHE_SIZE, MISSING, ResultCache
+from .units import get_ScaleFactor
+
+VARARGS = 0x04  # co_flags bits of a code object taking *args and **kwargs (inspect.CO_VARARGS, CO_VARKEYWORDS)
+VARKEYWORDS = 0x08
+
+
+class CalculationPlan:
+    """Everything needed to evaluate one calculation, resolved once when the catalog is loaded"""
+
+    __slots__ = ("displayName", "methodName", "function", "arity", "tupleMode", "inputUnitScales", "inputFactors",
+                 "outputUnitScale", "outputFactor")
+
+    def __init__(self, calculation):
+        parameters = calculation["parameters"]
+        self.displayName = calculation["displayName"]
+        self.methodName = calculation["methodName"]
+        self.function = getattr(ec, self.methodName, None)
+
+        if self.function is not None:
+            # Read from the code object rather than inspect.signature, which costs 10 ms of imports at startup
+            code = self.function.__code__
+            self.arity = code.co_argcount + code.co_kwonlyargcount + bool(code.co_flags & VARARGS) + bool(
+                code.co_flags & VARKEYWORDS)
+
+            # Functions such as total_parallel_resistance take one tuple holding any number of values
+            self.tupleMode = self.arity == 1 and any(
+                "tuple" in str(annotation) for annotation in self.function.__annotations__.values())
+        else:
+            # The installed ElectronicsCalculator predates this calculation; calling it reports the error
+            self.arity = len(parameters) // 2
+            self.tupleMode = False
+
+        self.inputUnitScales = tuple(parameters["inputUnitScale_%d" % count]
+                                     for count in range(1, len(parameters) // 2 + 1))
+        self.inputFactors = tuple(get_ScaleFactor(unitScale) for unitScale in self.inputUnitScales)
+        self.outputUnitScale = calculation["outputUnitScale"]
+        self.outputFactor = get_ScaleFactor(self.outputUnitScale)
+
+
+class CalculationEngine:
+    """Evaluates catalog calculations by displayName or methodName without requiring a QApplication"""
+
+    def __init__(self, catalog=None, cacheSize=DEFAULT_CACHE_SIZE, persistentCache=None, useKernels=True):
+        """
+        Inputs:
+            catalog [Catalog] - The calculation catalog. The bundled calculations.xml is loaded when omitted.
+
+            cacheSize [int] - Number of results kept in the result cache. 0 disables the cache.
+
+            persistentCache [PersistentCache] - On-disk cache that calculateBatch consults, if any
+
+            useKernels [bool] - Whether calculateBatch evaluates functions with their array kernels in kernels.py
+        """
+
+        if catalog is None:
+            catalog = Catalog(loadCalculationsCached())
+
+        self.catalog = catalog
+        self.plans = {}  # displayName -> CalculationPlan
+        self.resultCache = ResultCache(cacheSize) if cacheSize > 0 else None
+        self.persistentCache = persistentCache
+        self.useKernels = useKernels
+
+        for calculation in catalog:
+            self.plans[calculation["displayName"]] = CalculationPlan(calculation)
+
+    def get_Plan(self, name):
+        """Finds the plan of a calculation by its displayName or, failing that, its methodName"""
+
+        try:
+            return self.plans[name]
+        except KeyError:
+            return self.plans[self.catalog.get_Calculation(name)["displayName"]]
+
+    def calculate(self, name, inputValues, inputUnitScales=None, outputUnitScale=None):
+        """
+        Scales the inputs to base units, runs the calculation and scales the result to the output unit.
+
+        Inputs:
+            name [str] - displayName of the calculation, or the methodName of its electronics_calculator function
+
+            inputValues [sequence] - Numeric inputs in catalog order. Tuple calculations accept any number of values;
+                                     those past the catalog's parameters take the unit scale of its last one.
+
+            inputUnitScales [sequence] - Unit scale of each input, e.g. "KILOHMS". Defaults to the catalog scales. The
+                                         values of a tuple past the last scale given take that scale.
+
+            outputUnitScale [str] - Unit scale of the result. Defaults to the catalog scale.
+
+        Output:
+            retval [float] - The calculation result in the output unit scale
+        """
+
+        plan = self.get_Plan(name)
+        self.check_InputCount(plan, len(inputValues))
+        inputFactors = self.get_InputFactors(plan, inputUnitScales, len(inputValues))
+
+        retval = self.call(plan, tuple([value * factor for value, factor in zip(inputValues, inputFactors)]))
+
+        return self.scaleOutput(retval, self.get_OutputFactor(plan, outputUnitScale))
+
+    def call(self, plan, scaledValues):
+        """Calls the calculation function with values that are already in base units, or reuses a cached result"""
+
+        if self.resultCache is None:
+            return self.callFunction(plan, scaledValues)
+
+        if type(scaledValues) is not tuple:
+            scaledValues = tuple(scaledValues)
+
+        key = (plan.methodName, scaledValues)
+        retval = self.resultCache.get(key)
+
+        if retval is MISSING:
+            retval = self.callFunction(plan, scaledValues)
+            self.resultCache.put(key, retval)  # errors are raised before this, so they are never cached
+
+        return retval
+
+    def get_CacheStats(self):
+        """Returns the result cache counters as a CacheStats, or None when the cache is disabled"""
+
+        if self.resultCache is None:
+            return None
+
+        return self.resultCache.stats
+
+    @staticmethod
+    def callFunction(plan, scaledValues):
+        """Calls the electronics_calculator function directly, bypassing the result cache"""
+
+        if plan.function is None:
+            getattr(ec, plan.methodName)  # raises the AttributeError for a calculation missing from the library
+
+        if plan.tupleMode:
+            return plan.function(tuple(scaledValues))
+
+        return plan.function(*scaledValues)
+
+    @staticmethod
+    def check_InputCount(plan, inputCount):
+        # A tuple calculation takes any number of values, so only a fixed arity is checked
+        if not plan.tupleMode and inputCount != plan.arity:
+            raise ValueError("%s expects %d inputs" % (plan.methodName, plan.arity))
+
+    @staticmethod
+    def get_InputFactors(plan, inputUnitScales=None, inputCount=0):
+        """Scale factors of the inputs; the values of a tuple past the given or catalog scales share the last one's"""
+
+        if inputUnitScales is not None:
+            inputFactors = [get_ScaleFactor(unitScale) for unitScale in inputUnitScales]
+
+            if plan.tupleMode and 0 < len(inputFactors) < inputCount:
+                return inputFactors + inputFactors[-1:] * (inputCount - len(inputFactors))
+
+            if len(inputFactors) != inputCount:
+                raise ValueError("%s got %d inputs but %d unit scales" % (plan.methodName, inputCount,
+                                                                          len(inputFactors)))
+
+            return inputFactors
+
+        if inputCount > len(plan.inputFactors) and plan.tupleMode:
+            return plan.inputFactors + plan.inputFactors[-1:] * (inputCount - len(plan.inputFactors))
+
+        return plan.inputFactors
+
+    @staticmethod
+    def get_OutputFactor(plan, outputUnitScale=None):
+        if outputUnitScale is None:
+            return plan.outputFactor
+
+        return get_ScaleFactor(outputUnitScale)
+
+    @staticmethod
+    def scaleOutput(value, outputFactor):
+        """Converts a base unit value to the output unit, dividing like sf.scale_out to keep identical results"""
+
+        if outputFactor != 1:
+            value = value / outputFactor
+
+        return value
@@ -0,0 +1,147 @@
+"""In-memory cache of the formula images shown beside each calculation.
+
+Each image is read from disk and decoded once. Decoding a PNG into a QImage is safe outside the GUI thread, so the
+images of the calculations next to the current selection are decoded in the background before they are needed.
+QPixmaps can only be made on the GUI thread, so the decoded QImages are converted there when they arrive. The cache
+keeps at most maxImages pixmaps, least recently used first out, and remembers missing images so they are not looked
+for again.
+"""
+
+import os
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+
+from .profiling import stage, timed
+
+IMAGES_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+DEFAULT_MAX_IMAGES = 64
+
+
+class _ImageLoaderSignals(QObject):
+    imageLoaded = pyqtSignal(str, QImage)
+
+
+class _ImageLoader(QRunnable):
+    """
+    Decodes one image on a pool thread and hands the QImage back through its own signals object. The loader does not
+    reference the cache, so Qt drops the delivery if the cache is deleted first.
+    """
+
+    def __init__(self, imageName, imagePath):
+        super().__init__()
+        self.signals = _ImageLoaderSignals()
+        self.imageName = imageName
+        self.imagePath = imagePath
+
+    def run(self):
+        with stage("formula image prefetch"):
+            image = QImage(self.imagePath)
+
+        try:
+            self.signals.imageLoaded.emit(self.imageName, image)
+        except RuntimeError:
+            pass  # PyQt deleted the signals object at interpreter exit; an exception escaping run() would abort
+
+
+class FormulaImageCache(QObject):
+    """Bounded cache of formula pixmaps keyed by the formulaImage file name. Use from the GUI thread."""
+
+    def __init__(self, directory=IMAGES_DIRECTORY, maxImages=DEFAULT_MAX_IMAGES, parent=None):
+        """
+        Inputs:
+            directory [str] - Folder holding the images. Defaults to the images folder next to this module.
+
+            maxImages [int] - Most pixmaps kept in memory at once
+
+            parent [QObject] - Owner of the cache, whose lifetime the background loaders are tied to
+        """
+
+        super().__init__(parent)
+        self.directory = directory
+        self.maxImages = maxImages
+        self.pixmaps = OrderedDict()  # imageName -> QPixmap, least recently used first
+        self.missing = set()  # Image names that could not be read
+        self.pending = set()  # Image names being decoded in the background
+        self.diskReads = 0  # Images read from disk, in the background or not
+        self.hits = 0
+        self.misses = 0
+
+        # One thread is enough: each image takes well under a millisecond, and the GUI thread keeps the other core
+        self.threadPool = QThreadPool(self)
+        self.threadPool.setMaxThreadCount(1)
+
+    @timed(stage="formula image")
+    def get_Pixmap(self, imageName):
+        """
+        Gets the pixmap of a formula image, reading it from disk only if it has not been loaded before.
+
+        Input:
+            imageName [str] - File name of the image within the images folder, e.g. "current_er.png"
+
+        Output:
+            pixmap [QPixmap] - The image, or None when it is missing or cannot be decoded
+        """
+
+        pixmap = self.pixmaps.get(imageName)
+
+        if pixmap is not None:
+            self.pixmaps.move_to_end(imageName)
+            self.hits += 1
+            return pixmap
+
+        if imageName in self.missing:
+            return None
+
+        # Not prefetched yet (or still decoding in the background): decode it here rather than wait for the loader
+        self.misses += 1
+        self.diskReads += 1
+
+        return self.set_Pixmap(imageName, QImage(self.get_ImagePath(imageName)))
+
+    def prefetch(self, imageNames):
+        """Starts decoding, in the background, each of the images that is not cached or already being decoded"""
+
+        for imageName in imageNames:
+            if imageName in self.pixmaps or imageName in self.missing or imageName in self.pending:
+                continue
+
+            self.pending.add(imageName)
+            self.diskReads += 1
+            loader = _ImageLoader(imageName, self.get_ImagePath(imageName))
+            loader.signals.imageLoaded.connect(self.imageLoaded_Received)  # delivered on the GUI thread
+            self.threadPool.start(loader)
+
+    def get_ImagePath(self, imageName):
+        return os.path.join(self.directory, imageName)
+
+    def set_Pixmap(self, imageName, image):
+        """Converts a decoded image to a pixmap and stores it, evicting the least recently used pixmap if full"""
+
+        if image.isNull():
+            self.missing.add(imageName)
+            return None
+
+        pixmap = QPixmap.fromImage(image)
+        self.pixmaps[imageName] = pixmap
+        self.pixmaps.move_to_end(imageName)
+
+        while len(self.pixmaps) > self.maxImages:
+            self.pixmaps.popitem(last=False)
+
+        return pixmap
+
+    def imageLoaded_Received(self, imageName, image):
+        self.pending.discard(imageName)
+
+        # The GUI may already have needed the image and decoded it itself
+        if imageName not in self.pixmaps and imageName not in self.missing:
+            self.set_Pixmap(imageName, image)
+
+        return
+
+    def waitForPrefetch(self, msecs=-1):
+        """Blocks until the background loaders finish. Their results are delivered once the event loop runs."""
+
+        return self.threadPool.waitForDone(msecs)
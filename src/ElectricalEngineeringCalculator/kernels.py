@@ -0,0 +1,439 @@
+"""Array kernels of the electronics_calculator formulas, keyed by methodName, for calculateBatch.
+
+Each kernel takes one float64 array per base unit input (one per value for tuple calculations) and repeats its
+function's arithmetic in the same order, so a finite result is the function's result, bar the last bit or two where
+x * x and np.log10 round differently from pow(x, 2) and math.log10 (benchmarks/test_kernels.py checks both against
+each other). Wherever the function could raise instead, the kernel returns NaN or an infinity, and calculateBatch
+calls the function for just those elements to get its exact value or error message:
+
+    division by zero      ZeroDivisionError     x / 0 is an infinity, 0 / 0 is NaN; _inverse_sums keeps 1 / inf = 0
+                                                from hiding one
+    math.sqrt, log10      ValueError            the square root or logarithm of a negative is NaN, log10(0) is -inf
+    pow(x, 2)             OverflowError         _square returns NaN where the square overflows
+    unequal tuple values  ValueError            _identical returns NaN where a value differs from the running mean
+
+When numba is installed, get_Kernel compiles a kernel with numba.njit the first time it is used. A kernel numba
+cannot compile falls back to NumPy for good. Set EECALC_NUMBA=0 to keep every kernel on NumPy, e.g. for a short run
+that would not pay back the compile time.
+"""
+
+import math
+import os
+
+import numpy as np
+
+SPEED_OF_LIGHT = 300000000  # electronics_calculator.SPEED_OF_LIGHT, in meters per second
+PI = math.pi
+NUMBA_VARIABLE = "EECALC_NUMBA"
+
+KERNELS = {}  # methodName -> NumPy kernel
+_jitted = {}  # methodName -> numba kernel, or None where numba is missing, disabled or failed
+_numba = None
+
+
+def kernel(function):
+    """Registers a kernel under the name of the electronics_calculator function it stands in for"""
+
+    KERNELS[function.__name__] = function
+
+    return function
+
+
+def get_Kernel(methodName):
+    """
+    Finds the fastest kernel of a function.
+
+    Input:
+        methodName [str] - Name of the electronics_calculator function
+
+    Output:
+        kernel [function] - The numba kernel when numba can compile it, else the NumPy kernel. None when the
+                            function has no kernel.
+    """
+
+    if methodName not in KERNELS:
+        return None
+
+    if methodName not in _jitted:
+        numba = get_Numba()
+        _jitted[methodName] = None if numba is None else numba.njit(KERNELS[methodName])
+
+    return _jitted[methodName] or KERNELS[methodName]
+
+
+def get_Numba():
+    """Imports numba the first time a kernel is used, returning None when it is missing or disabled"""
+
+    global _numba
+
+    if _numba is None:
+        _numba = False
+
+        if os.environ.get(NUMBA_VARIABLE, "1") != "0":
+            try:
+                import numba
+                from numba.extending import register_jitable
+            except ImportError:
+                pass
+            else:
+                # The helpers stay plain Python for the NumPy kernels, and are compiled inline into the numba ones
+                for helper in (_square, _sums, _inverse_sums, _identical, _tau):
+                    register_jitable(helper)
+
+                _numba = numba
+
+    return _numba or None
+
+
+def callKernel(methodName, scaledArrays):
+    """
+    Evaluates a function's kernel over base unit arrays. Call with NumPy floating point errors ignored.
+
+    Inputs:
+        methodName [str] - Name of the electronics_calculator function; it must have a kernel
+
+        scaledArrays [sequence] - One float64 array per input, broadcast to the same shape
+
+    Output:
+        results [ndarray] - The function's results, NaN or an infinity wherever the function must be called instead
+    """
+
+    function = get_Kernel(methodName)
+
+    if function is not KERNELS[methodName]:
+        try:
+            return function(*scaledArrays)
+        except Exception:
+            _jitted[methodName] = None  # numba could not compile it for these arrays; NumPy stands in from now on
+
+    return KERNELS[methodName](*scaledArrays)
+
+
+def _square(x):
+    """pow(x, 2), NaN where it is infinite: pow raises OverflowError where the square of a finite value overflows"""
+
+    square = x * x
+
+    return np.where(np.isinf(square), np.nan, square)
+
+
+def _sums(items):
+    total = np.zeros(items[0].shape)
+
+    for item in items:
+        total += item
+
+    return total
+
+
+def _inverse_sums(items):
+    """1 / the sum of 1 / each value, NaN where the sum is infinite: 1 / inf = 0 would hide a ZeroDivisionError"""
+
+    total = np.zeros(items[0].shape)
+
+    for item in items:
+        total += 1 / item
+
+    return np.where(np.isinf(total), np.nan, 1 / total)
+
+
+def _identical(items):
+    """The first value, NaN wherever the function raises ValueError because a value differs from the running mean"""
+
+    total = np.zeros(items[0].shape)
+    mismatch = np.zeros(items[0].shape, dtype=np.bool_)
+    count = 1
+
+    for item in items:
+        total += item
+        mismatch |= item != total / count
+        count += 1
+
+    return np.where(mismatch, np.nan, items[0])
+
+
+def _tau(a, b):
+    return 2 * PI * a * b
+
+
+# ==========
+# OHM'S LAW
+# ==========
+@kernel
+def power_er(voltage, resistance):
+    return _square(voltage) / resistance
+
+
+@kernel
+def power_ie(current, voltage):
+    return current * voltage
+
+
+@kernel
+def power_ir(current, resistance):
+    return _square(current) * resistance
+
+
+@kernel
+def current_pe(power, voltage):
+    return power / voltage
+
+
+@kernel
+def current_pr(power, resistance):
+    return np.sqrt(power / resistance)
+
+
+@kernel
+def current_er(voltage, resistance):
+    return voltage / resistance
+
+
+@kernel
+def voltage_pi(power, current):
+    return power / current
+
+
+@kernel
+def voltage_pr(power, resistance):
+    return np.sqrt(power * resistance)
+
+
+@kernel
+def voltage_ir(current, resistance):
+    return current * resistance
+
+
+@kernel
+def resistance_pe(power, voltage):
+    return _square(voltage) / power
+
+
+@kernel
+def resistance_pi(power, current):
+    return power / _square(current)
+
+
+@kernel
+def resistance_ie(current, voltage):
+    return voltage / current
+
+
+@kernel
+def voltage_divider_r(voltage_in, resistance_1, resistance_2):
+    return voltage_in * (resistance_2 / (resistance_1 + resistance_2))
+
+
+# ===================
+# SERIES AND PARALLEL
+# ===================
+@kernel
+def total_series_current(*currents):
+    return _identical(currents)
+
+
+@kernel
+def total_series_resistance(*resistances):
+    return _sums(resistances)
+
+
+@kernel
+def total_series_voltage(*voltages):
+    return _sums(voltages)
+
+
+@kernel
+def total_series_capacitance(*capacitances):
+    return _inverse_sums(capacitances)
+
+
+@kernel
+def total_series_inductance(*inductances):
+    return _sums(inductances)
+
+
+@kernel
+def total_parallel_current(*currents):
+    return _sums(currents)
+
+
+@kernel
+def total_parallel_resistance(*resistances):
+    return _inverse_sums(resistances)
+
+
+@kernel
+def total_parallel_voltage(*voltages):
+    return _identical(voltages)
+
+
+@kernel
+def total_parallel_capacitance(*capacitances):
+    return _sums(capacitances)
+
+
+@kernel
+def total_parallel_inductance(*inductances):
+    return _inverse_sums(inductances)
+
+
+# ===========
+# AC CIRCUITS
+# ===========
+@kernel
+def frequency_cxc(capacitance, capacitive_reactance):
+    return 1 / _tau(capacitance, capacitive_reactance)
+
+
+@kernel
+def frequency_lxl(inductance, inductive_reactance):
+    return inductive_reactance / (2 * PI * inductance)
+
+
+@kernel
+def frequency_wl(wavelength):
+    return SPEED_OF_LIGHT / wavelength
+
+
+@kernel
+def wavelength(frequency):
+    return SPEED_OF_LIGHT / frequency
+
+
+@kernel
+def antenna_length_qw(frequency):
+    return SPEED_OF_LIGHT / frequency / 4.0
+
+
+@kernel
+def capacitance_fxc(frequency, capacitive_reactance):
+    return 1 / _tau(frequency, capacitive_reactance)
+
+
+@kernel
+def inductance_fxl(frequency, inductive_reactance):
+    return inductive_reactance / (2 * PI * frequency)
+
+
+@kernel
+def back_emf(inductance, current_t1, current_t2, time):
+    return -inductance * ((current_t2 - current_t1) / time)
+
+
+@kernel
+def reactance_inductive_fl(frequency, inductance):
+    return _tau(frequency, inductance)
+
+
+@kernel
+def reactance_capacitive_fc(frequency, capacitance):
+    return 1 / _tau(frequency, capacitance)
+
+
+@kernel
+def reactance_capacitive_zr(impedance, resistance):
+    return np.sqrt(_square(impedance) - _square(resistance))
+
+
+@kernel
+def voltage_divider_c(voltage_in, impedance, capacitive_reactance):
+    return voltage_in * (capacitive_reactance / impedance)
+
+
+@kernel
+def impedance_rc(resistance, capacitive_reactance):
+    return np.sqrt(_square(resistance) + _square(capacitive_reactance))
+
+
+@kernel
+def impedance_rcl(resistance, capacitive_reactance, inductive_reactance):
+    return np.sqrt(_square(resistance) + _square(inductive_reactance - capacitive_reactance))
+
+
+@kernel
+def impedance_rcl_phase_angle(resistance, capacitive_reactance, inductive_reactance):
+    ratio = (inductive_reactance - capacitive_reactance) / resistance
+
+    # atan turns the infinity of a zero resistance into a finite 90 degrees, so keep it for the function to report
+    return np.where(np.isfinite(ratio), np.degrees(np.arctan(ratio)), np.nan)
+
+
+# ================
+# AC SINE VOLTAGES
+# ================
+@kernel
+def voltage_rms_from_peak(peak_voltage):
+    return (1 / math.sqrt(2)) * peak_voltage
+
+
+@kernel
+def voltage_rms_from_peak_to_peak(peak_to_peak_voltage):
+    return (1 / (2 * math.sqrt(2))) * peak_to_peak_voltage
+
+
+@kernel
+def voltage_rms_from_average(average_voltage):
+    return (PI / (2 * math.sqrt(2))) * average_voltage
+
+
+@kernel
+def voltage_average_from_peak(peak_voltage):
+    return (2 * peak_voltage) / PI
+
+
+@kernel
+def voltage_average_from_peak_to_peak(peak_to_peak_voltage):
+    return peak_to_peak_voltage / PI
+
+
+@kernel
+def voltage_average_from_rms(rms_voltage):
+    return rms_voltage * ((2 * math.sqrt(2)) / PI)
+
+
+@kernel
+def voltage_peak_from_peak_to_peak(peak_to_peak_voltage):
+    return peak_to_peak_voltage * 0.5
+
+
+@kernel
+def voltage_peak_from_rms(rms_voltage):
+    return rms_voltage * math.sqrt(2)
+
+
+@kernel
+def voltage_peak_from_average(average_voltage):
+    return average_voltage * (PI / 2)
+
+
+@kernel
+def voltage_peak_to_peak_from_average(average_voltage):
+    return average_voltage * PI
+
+
+@kernel
+def voltage_peak_to_peak_from_rms(rms_voltage):
+    return rms_voltage * (2 * math.sqrt(2))
+
+
+@kernel
+def voltage_peak_to_peak_from_peak(peak_voltage):
+    return peak_voltage * 2
+
+
+# ====
+# GAIN
+# ====
+@kernel
+def gain(input_value, output_value):
+    return output_value / input_value
+
+
+@kernel
+def gain_db(input_value, output_value):
+    return 20 * np.log10(output_value / input_value)
+
+
+@kernel
+def gain_db_power(input_power, output_power):
+    return 20 * np.log10(output_power / input_power) / 2
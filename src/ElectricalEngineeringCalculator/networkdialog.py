@@ -0,0 +1,275 @@
+"""Dialog evaluating a series or parallel calculation for lists of any number of values.
+
+The main window has five boxes for the values of a tuple calculation, such as total_parallel_resistance. Here the
+values are typed, pasted from the clipboard or loaded from a text or CSV file instead, as many as there are. All the
+numbers make one network, or with "One network per line" each line is a network of its own, and every network is
+evaluated together with one calculateNetworks call.
+"""
+
+import re
+import time
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (QApplication, QCheckBox, QComboBox, QDialog, QFileDialog, QLabel, QPlainTextEdit,
+                             QPushButton)
+
+from .batch import calculateNetworks
+from .units import get_ScaleFactor, get_SiblingScales, get_UnitScale
+
+VALUE_SEPARATORS = re.compile(r"[\s,;]+")
+MAX_RESULT_LINES = 10000  # Networks listed in the results box; the summary counts them all
+
+
+def get_Networks(text, perLine=False):
+    """
+    Reads the networks of values in the list editor.
+
+    Inputs:
+        text [str] - Numbers separated by commas, semicolons, tabs, spaces or line breaks
+
+        perLine [bool] - Each line holding numbers is a network of its own. Otherwise all the numbers make one network.
+
+    Output:
+        values [list] - The numbers of every network, network after network
+
+        offsets [list] - Index in values of the first number of each network
+    """
+
+    values = []
+    offsets = []
+
+    for number, line in enumerate(text.splitlines() if perLine else [text], 1):
+        words = [word for word in VALUE_SEPARATORS.split(line) if word]
+
+        if not words:
+            continue
+
+        offsets.append(len(values))
+
+        try:
+            values.extend(map(float, words))
+        except ValueError:
+            word = next(word for word in words if not is_Number(word))
+            raise ValueError("%s%s is not a number" % ("Line %d: " % number if perLine else "", word)) from None
+
+    if not values:
+        raise ValueError("Enter at least one value")
+
+    return values, offsets
+
+
+def is_Number(word):
+    try:
+        float(word)
+    except ValueError:
+        return False
+
+    return True
+
+
+class NetworkDialog(QDialog):
+    """Evaluates a tuple calculation for networks of values typed, pasted or loaded from a file"""
+
+    def __init__(self, engine, calculation, fontLabel, parent=None):
+        """
+        Inputs:
+            engine [CalculationEngine] - Engine holding the precompiled call plans
+
+            calculation [dict] - Catalog record of a tuple calculation
+
+            fontLabel [QFont] - Font of the calculation name
+
+            parent [QWidget] - The main window
+        """
+
+        super().__init__(parent)
+        self.engine = engine
+        self.calculation = calculation
+        self.plan = engine.get_Plan(calculation["displayName"])
+        self.fontLabel = fontLabel
+
+        self.setObjectName("dlgNetworks")
+        self.setWindowTitle("Networks: %s" % calculation["displayName"])
+        self.setFixedSize(800, 560)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.init_ValueControls()
+        self.init_OutputControls()
+        self.init_lblErrorDisplay()
+
+    def set_Inputs(self, inputTexts, unitIndexes, outputUnitScale):
+        """Starts from the values filled in on the main window, in the unit of the first of them"""
+
+        filled = [(inputText.strip(), unitIndex) for inputText, unitIndex in zip(inputTexts, unitIndexes)
+                  if inputText.strip()]
+
+        if filled:
+            unitIndex = filled[0][1]
+            self.cmbInputUnit.setCurrentIndex(unitIndex)
+            lines = []
+
+            for inputText, rowUnitIndex in filled:
+                if rowUnitIndex != unitIndex and is_Number(inputText):
+                    # Rewritten in the unit of the list, which all its values share
+                    inputText = "%.10g" % (float(inputText) * get_ScaleFactor(self.cmbInputUnit.itemText(
+                        rowUnitIndex)) / get_ScaleFactor(self.cmbInputUnit.itemText(unitIndex)))
+
+                lines.append(inputText)
+
+            self.txtValues.setPlainText("\n".join(lines))
+
+        self.cmbOutputUnit.setCurrentText(outputUnitScale)
+
+        return
+
+    def run_Calculation(self):
+        self.lblErrorDisplay.hide()
+
+        try:
+            values, offsets = get_Networks(self.txtValues.toPlainText(), self.chkPerLine.isChecked())
+            start = time.perf_counter()
+            results, errors = calculateNetworks(self.engine, self.plan.displayName, values, offsets,
+                                                self.cmbInputUnit.currentText(), self.cmbOutputUnit.currentText())
+        except (ValueError, KeyError) as e:
+            self.set_lblErrorDisplay(str(e).strip("'\""))
+            return
+
+        seconds = time.perf_counter() - start
+        ends = offsets[1:] + [len(values)]
+        lines = ["Network\tValues\t%s (%s)" % (self.calculation["outputName"],
+                                                get_UnitScale(self.cmbOutputUnit.currentText()).abbreviation)]
+
+        for network, result in enumerate(results[:MAX_RESULT_LINES].tolist()):
+            lines.append("%d\t%d\t%s" % (network + 1, ends[network] - offsets[network],
+                                         errors[network] if network in errors else "%.10g" % result))
+
+        if len(results) > MAX_RESULT_LINES:
+            lines.append("... %d more networks" % (len(results) - MAX_RESULT_LINES))
+
+        self.txtResults.setPlainText("\n".join(lines))
+        self.lblSummary.setText("%d networks, %d values, %.1f ms\n%d networks failed" % (
+            len(offsets), len(values), seconds * 1000, len(errors)))
+
+        if errors:
+            self.set_lblErrorDisplay("%s (first failed network)" % errors[min(errors)])
+
+        return
+
+    def set_lblErrorDisplay(self, message):
+        self.lblErrorDisplay.setText("ERROR: %s" % message)
+        self.lblErrorDisplay.show()
+
+        return
+
+    # ==============
+    # EVENT HANDLERS
+    # ==============
+    def cmdPaste_Click(self):
+        self.txtValues.setPlainText(QApplication.clipboard().text())
+
+        return
+
+    def cmdOpen_Click(self):
+        path = QFileDialog.getOpenFileName(self, "Open Values", "",
+                                           "Text and CSV files (*.txt *.csv);;All files (*)")[0]
+
+        if path:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.txtValues.setPlainText(f.read())
+            except (OSError, UnicodeDecodeError) as e:
+                self.set_lblErrorDisplay(str(e))
+
+        return
+
+    def cmdCalculate_Click(self):
+        self.run_Calculation()
+
+        return
+
+    # ======================
+    # INITIALIZATION METHODS
+    # ======================
+    def init_ValueControls(self):
+        lblCalculation = QLabel(self.calculation["displayName"])
+        lblCalculation.setParent(self)
+        lblCalculation.setGeometry(10, 10, 780, 25)
+        lblCalculation.setFont(self.fontLabel)
+
+        lblValues = QLabel("%s values:" % self.calculation["parameters"]["parameter_1"].rstrip(" 0123456789"))
+        lblValues.setParent(self)
+        lblValues.setGeometry(10, 45, 245, 25)
+
+        self.chkPerLine = QCheckBox("One network per line")
+        self.chkPerLine.setParent(self)
+        self.chkPerLine.setGeometry(255, 45, 200, 25)
+        self.chkPerLine.setToolTip("Evaluate each line as a network of its own, rather than all values as one")
+
+        self.txtValues = QPlainTextEdit()
+        self.txtValues.setObjectName("txtValues")
+        self.txtValues.setParent(self)
+        self.txtValues.setGeometry(10, 80, 445, 420)
+        self.txtValues.setPlaceholderText("Values separated by commas, spaces or new lines")
+
+        lblInputUnit = QLabel("Unit:")
+        lblInputUnit.setParent(self)
+        lblInputUnit.setGeometry(470, 45, 90, 25)
+
+        self.cmbInputUnit = QComboBox()
+        self.cmbInputUnit.setParent(self)
+        self.cmbInputUnit.setGeometry(560, 45, 230, 25)
+        self.cmbInputUnit.addItems(get_SiblingScales(self.plan.inputUnitScales[0]))
+        self.cmbInputUnit.setCurrentText(self.plan.inputUnitScales[0])
+        self.cmbInputUnit.setToolTip("Select the unit scale of the values")
+
+        return
+
+    def init_OutputControls(self):
+        lblOutputUnit = QLabel("Output:")
+        lblOutputUnit.setParent(self)
+        lblOutputUnit.setGeometry(470, 80, 90, 25)
+
+        self.cmbOutputUnit = QComboBox()
+        self.cmbOutputUnit.setParent(self)
+        self.cmbOutputUnit.setGeometry(560, 80, 230, 25)
+        self.cmbOutputUnit.addItems(get_SiblingScales(self.calculation["outputUnitScale"]))
+        self.cmbOutputUnit.setCurrentText(self.calculation["outputUnitScale"])
+        self.cmbOutputUnit.setToolTip("Select the unit scale of the results")
+
+        buttons = (("cmdPaste", "Paste", self.cmdPaste_Click), ("cmdOpen", "Open...", self.cmdOpen_Click),
+                   ("cmdCalculate", "Calculate", self.cmdCalculate_Click))
+
+        for left, (name, text, handler) in zip((470, 580, 690), buttons):
+            button = QPushButton(text)
+            button.setParent(self)
+            button.setGeometry(left, 120, 100, 40)
+            button.clicked.connect(handler)
+            setattr(self, name, button)
+
+        self.cmdPaste.setToolTip("Replace the values with the text on the clipboard")
+        self.cmdOpen.setToolTip("Load the values from a text or CSV file")
+
+        self.lblSummary = QLabel()
+        self.lblSummary.setParent(self)
+        self.lblSummary.setGeometry(470, 170, 320, 50)
+        self.lblSummary.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.lblSummary.setWordWrap(True)
+
+        self.txtResults = QPlainTextEdit()
+        self.txtResults.setObjectName("txtResults")
+        self.txtResults.setParent(self)
+        self.txtResults.setGeometry(470, 225, 320, 275)
+        self.txtResults.setReadOnly(True)
+        self.txtResults.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.txtResults.setTabStopDistance(90)
+
+        return
+
+    def init_lblErrorDisplay(self):
+        self.lblErrorDisplay = QLabel()
+        self.lblErrorDisplay.setObjectName("lblErrorDisplay")
+        self.lblErrorDisplay.setParent(self)
+        self.lblErrorDisplay.setGeometry(10, 512, 780, 40)
+        self.lblErrorDisplay.setWordWrap(True)
+        self.lblErrorDisplay.hide()
+
+        return
@@ -0,0 +1,150 @@
+"""Multi-process batch evaluation across CPU cores.
+
+A ParallelEvaluator owns a pool of worker processes. Each worker builds its own CalculationEngine once, when it
+starts, with its own connection to the engine's PersistentCache if it has one; the unit registry is built when the
+worker imports the package. Work is sent in chunks so the cost of
+passing data between processes is spread over many evaluations, and results are returned in input order.
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .batch import calculateBatch
+from .catalog import Catalog
+from .engine import CalculationEngine
+from .runner import evaluateChunk
+
+DEFAULT_CHUNK_SIZE = 50000
+
+_workerEngine = None  # The CalculationEngine of a worker process
+
+
+def _initWorker(calculations, persistentCacheSettings, useKernels):
+    global _workerEngine
+    persistentCache = None
+
+    if persistentCacheSettings is not None:
+        from .persistentcache import PersistentCache
+
+        persistentCache = PersistentCache(*persistentCacheSettings)
+
+    _workerEngine = CalculationEngine(Catalog(calculations), persistentCache=persistentCache, useKernels=useKernels)
+
+
+def _calculateChunk(name, inputValues, inputUnitScales, outputUnitScale):
+    retval = calculateBatch(_workerEngine, name, inputValues, inputUnitScales, outputUnitScale)
+
+    if _workerEngine.persistentCache is not None:
+        _workerEngine.persistentCache.flush()
+
+    return retval
+
+
+def _evaluateRows(rows):
+    return evaluateChunk(_workerEngine, rows)
+
+
+class ParallelEvaluator:
+    """Pool of worker processes sharing the engine's calculation catalog. Use as a context manager."""
+
+    def __init__(self, engine, workers=None, chunkSize=DEFAULT_CHUNK_SIZE, startMethod=None):
+        """
+        Inputs:
+            engine [CalculationEngine] - Engine whose catalog the workers load
+
+            workers [int] - Number of worker processes. Defaults to the number of CPU cores.
+
+            chunkSize [int] - Elements per chunk sent to a worker by calculateBatch
+
+            startMethod [str] - multiprocessing start method of the workers, e.g. "spawn". Defaults to the platform's.
+        """
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunkSize = chunkSize
+        persistentCache = engine.persistentCache
+
+        # Each worker opens its own connection to the engine's persistent cache file
+        persistentCacheSettings = None if persistentCache is None else (
+            persistentCache.path, persistentCache.maxBytes, persistentCache.libraryVersion)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                            mp_context=startMethod and multiprocessing.get_context(startMethod),
+                                            initializer=_initWorker,
+                                            initargs=(engine.catalog.calculations, persistentCacheSettings,
+                                                      engine.useKernels))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown()
+
+    def calculateBatch(self, name, inputValues, inputUnitScales=None, outputUnitScale=None):
+        """
+        Same as batch.calculateBatch, with the broadcast inputs split into chunks evaluated by the workers.
+
+        Output:
+            results [ndarray] - float64 results in the output unit scale, NaN where an element failed
+
+            errors [dict] - Error message for each failed element, keyed by its flat index into results
+        """
+
+        if not inputValues:
+            raise ValueError("At least one input is required")
+
+        arrays = np.broadcast_arrays(*[np.asarray(value, dtype=np.float64) for value in inputValues])
+        shape = arrays[0].shape
+        columns = [array.reshape(-1) for array in arrays]
+        size = columns[0].size
+
+        if size <= self.chunkSize:
+            return self.executor.submit(_calculateChunk, name, inputValues, inputUnitScales, outputUnitScale).result()
+
+        offsets = range(0, size, self.chunkSize)
+        futures = [self.executor.submit(_calculateChunk, name, [column[offset:offset + self.chunkSize]
+                                                                for column in columns],
+                                        inputUnitScales, outputUnitScale)
+                   for offset in offsets]
+
+        results = np.empty(size, dtype=np.float64)
+        errors = {}
+
+        for offset, future in zip(offsets, futures):
+            chunkResults, chunkErrors = future.result()
+            results[offset:offset + chunkResults.size] = chunkResults
+
+            for index, error in chunkErrors.items():
+                errors[offset + index] = error
+
+        return results.reshape(shape), errors
+
+    def submitRows(self, rows):
+        """Starts evaluating one chunk of job rows (see runner.evaluateChunk) in a worker, returning its Future"""
+
+        return self.executor.submit(_evaluateRows, rows)
+
+    def evaluateChunks(self, chunks):
+        """
+        Evaluates chunks of job rows (see runner.evaluateChunk) in the workers, yielding (rows, results, errors) for
+        each chunk in input order. Only a few chunks per worker are in flight at once, so memory stays bounded
+        however many chunks there are.
+        """
+
+        pending = deque()
+
+        for rows in chunks:
+            pending.append((rows, self.submitRows(rows)))
+
+            if len(pending) >= self.workers * 2:
+                rows, future = pending.popleft()
+                yield (rows,) + future.result()
+
+        while pending:
+            rows, future = pending.popleft()
+            yield (rows,) + future.result()
@@ -0,0 +1,244 @@
+"""Input parameter panel of the main window, generated from the parameters of the selected calculation.
+
+Each parameter gets a row of three widgets: a label with its name, a text box for its value and a combo of the unit
+scales of its unit type. Rows are pooled. They are built the first time a calculation needs that many and reused
+after that, hidden when a calculation has fewer parameters. No calculation is selected at startup, so the first
+INITIAL_ROWS are built only after the window has painted. A reused row only updates the widgets whose content
+changes: the label when the parameter name differs, the combo when the unit type differs. Calculations with more rows
+than fit scroll.
+
+Each text box is validated as it changes, one box per keystroke, and a box holding something that is not a number is
+marked invalid, so callers can tell whether the inputs can be evaluated without parsing them all again.
+"""
+
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QComboBox, QFrame, QLabel, QLineEdit, QScrollArea, QWidget
+
+from .units import UNIT_SCALES, get_SiblingScales
+
+ROW_HEIGHT = 70  # Vertical distance between the tops of two parameter rows
+INITIAL_ROWS = 5  # Rows built right after the window shows, enough for every calculation in the bundled catalog
+TEXT_WIDTH = 290
+COMBO_WIDTH = 150
+
+
+class ParameterRow:
+    """The label, text box and unit combo of one input parameter"""
+
+    def __init__(self, parent, rowIndex, fontLabel, fontCombo):
+        top = rowIndex * ROW_HEIGHT
+
+        self.lblParameter = QLabel("Parameter_%d:" % (rowIndex + 1))
+        self.lblParameter.setParent(parent)
+        self.lblParameter.setGeometry(3, top, TEXT_WIDTH, 25)
+        self.lblParameter.setFont(fontLabel)
+
+        self.txtParameter = QLineEdit()
+        self.txtParameter.setParent(parent)
+        self.txtParameter.setGeometry(0, top + 25, TEXT_WIDTH, 25)
+        self.txtParameter.setFont(fontLabel)
+        self.txtParameter.setAlignment(Qt.AlignRight)
+        self.txtParameter.setMaxLength(27)
+        self.txtParameter.setToolTip("Enter a number for this parameter")
+
+        self.cmbUnitOptions = QComboBox()
+        self.cmbUnitOptions.setParent(parent)
+        self.cmbUnitOptions.setGeometry(TEXT_WIDTH + 5, top + 25, COMBO_WIDTH, 25)
+        self.cmbUnitOptions.setFont(fontCombo)
+        self.cmbUnitOptions.setToolTip("Select the applicable unit scale for this input")
+        self.txtParameter.textChanged.connect(self.txtParameter_Changed)
+
+        self.valid = True  # False while txtParameter holds text that is not a number
+        self.parameterName = None  # Parameter whose name lblParameter shows
+        self.unitType = None  # Unit type whose scales cmbUnitOptions lists
+        self.visible = True
+        self.set_Visible(False)  # until a calculation uses the row
+
+    def set_Parameter(self, parameterName, unitScale):
+        """
+        Shows a parameter in this row, touching only the widgets whose content changes. The text box is left alone;
+        the panel clears it.
+
+        Inputs:
+            parameterName [str] - Name shown in the label, e.g. "Resistance 1"
+
+            unitScale [str] - Catalog scale of the parameter. The combo lists every scale of its unit type and
+                              selects the first.
+        """
+
+        if parameterName != self.parameterName:
+            self.lblParameter.setText(parameterName + ":")
+            self.parameterName = parameterName
+
+        unitType = UNIT_SCALES[unitScale].unitType if unitScale in UNIT_SCALES else ""
+
+        if unitType != self.unitType:
+            self.cmbUnitOptions.clear()
+
+            if unitType:
+                self.cmbUnitOptions.addItems(get_SiblingScales(unitScale))
+
+            self.unitType = unitType
+        elif self.cmbUnitOptions.currentIndex() != 0:
+            self.cmbUnitOptions.setCurrentIndex(0)
+
+        self.set_Visible(True)
+
+    def txtParameter_Changed(self, text):
+        self.set_Valid(isNumeric(text.strip()))
+
+        return
+
+    def set_Valid(self, valid):
+        """Marks the text box invalid, which the style sheet shows, only when its validity changes"""
+
+        if valid != self.valid:
+            self.txtParameter.setProperty("invalid", not valid)
+            self.txtParameter.style().unpolish(self.txtParameter)
+            self.txtParameter.style().polish(self.txtParameter)
+            self.valid = valid
+
+    def set_Visible(self, visible):
+        if visible != self.visible:
+            self.lblParameter.setVisible(visible)
+            self.txtParameter.setVisible(visible)
+            self.cmbUnitOptions.setVisible(visible)
+            self.visible = visible
+
+
+class ParameterPanel(QScrollArea):
+    """Scrollable column of ParameterRows, one per parameter of the selected calculation"""
+
+    unitOptionChanged = pyqtSignal(int)  # currentIndexChanged of any row's unit combo
+    inputTextChanged = pyqtSignal()  # textChanged of any row's text box, after the row has validated it
+
+    def __init__(self, fontLabel, fontCombo, parent=None):
+        """
+        Inputs:
+            fontLabel [QFont] - Font of the labels and text boxes
+
+            fontCombo [QFont] - Font of the unit combos
+
+            parent [QWidget] - The main window
+        """
+
+        super().__init__(parent)
+        self.setObjectName("scrParameters")
+        self.setFrameShape(QFrame.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.viewport().setAutoFillBackground(False)
+
+        self.fontLabel = fontLabel
+        self.fontCombo = fontCombo
+        self.wdgParameters = QWidget()
+        self.wdgParameters.setObjectName("wdgParameters")
+        self.wdgParameters.setAutoFillBackground(False)
+        self.setWidget(self.wdgParameters)
+
+        self.rows = []  # Every row built so far; the first parameterCount are in use
+        self.parameterCount = 0
+        self.comboWidth = COMBO_WIDTH
+
+    def add_InitialRows(self):
+        """Builds the rows the first selection needs ahead of it, e.g. once the window has first painted"""
+
+        while len(self.rows) < INITIAL_ROWS:
+            self.add_Row()
+
+    def add_Row(self):
+        # A widget made after the window joins the end of its tab order, so put the row back after the one above it
+        previous = self.rows[-1].cmbUnitOptions if self.rows else self
+        row = ParameterRow(self.wdgParameters, len(self.rows), self.fontLabel, self.fontCombo)
+        QWidget.setTabOrder(previous, row.txtParameter)
+        QWidget.setTabOrder(row.txtParameter, row.cmbUnitOptions)
+        row.cmbUnitOptions.currentIndexChanged.connect(self.unitOptionChanged)
+        row.txtParameter.textChanged.connect(self.inputTextChanged)
+        self.rows.append(row)
+
+        return row
+
+    def set_Parameters(self, parameters):
+        """
+        Shows one row per parameter, building rows only when there are more parameters than ever before.
+
+        Input:
+            parameters [dict] - The calculation's parameters as stored in the catalog: parameter_N and
+                                inputUnitScale_N for N from 1. An empty dictionary hides every row.
+        """
+
+        parameterCount = len(parameters) // 2
+
+        while len(self.rows) < parameterCount:
+            self.add_Row()
+
+        for count, row in enumerate(self.rows[:parameterCount], 1):
+            row.set_Parameter(parameters["parameter_%d" % count], parameters["inputUnitScale_%d" % count])
+
+        for row in self.rows[parameterCount:self.parameterCount]:
+            row.set_Visible(False)
+
+        self.verticalScrollBar().setValue(0)
+
+        if parameterCount != self.parameterCount:
+            self.parameterCount = parameterCount
+            self.wdgParameters.resize(self.width(), max(parameterCount * ROW_HEIGHT, 1))
+            self.set_ComboWidth(parameterCount * ROW_HEIGHT > self.height())
+
+    def set_ComboWidth(self, scrolling):
+        """Narrows the combos while the scroll bar is shown, so it does not cover them"""
+
+        comboWidth = COMBO_WIDTH - self.verticalScrollBar().sizeHint().width() if scrolling else COMBO_WIDTH
+
+        if comboWidth != self.comboWidth:
+            for row in self.rows:
+                geometry = row.cmbUnitOptions.geometry()
+                row.cmbUnitOptions.resize(comboWidth, geometry.height())
+
+            self.comboWidth = comboWidth
+
+    def clear_Inputs(self):
+        """Empties every text box and selects the first unit scale of every combo"""
+
+        for row in self.rows:
+            if row.txtParameter.text():
+                row.txtParameter.setText("")
+
+            if row.cmbUnitOptions.currentIndex() > 0:
+                row.cmbUnitOptions.setCurrentIndex(0)
+
+    def get_InputTexts(self):
+        """Returns the stripped text of each parameter of the selected calculation, in catalog order"""
+
+        return [row.txtParameter.text().strip() for row in self.rows[:self.parameterCount]]
+
+    def is_InputValid(self):
+        """Returns True when no text box of the selected calculation holds text that is not a number"""
+
+        return all(row.valid for row in self.rows[:self.parameterCount])
+
+    def get_InputUnitScales(self):
+        """Returns the selected unit scale of each parameter of the selected calculation, in catalog order"""
+
+        return [row.cmbUnitOptions.currentText() for row in self.rows[:self.parameterCount]]
+
+    @property
+    def txtParameters(self):
+        return [row.txtParameter for row in self.rows[:self.parameterCount]]
+
+    @property
+    def cmbUnitOptions(self):
+        return [row.cmbUnitOptions for row in self.rows[:self.parameterCount]]
+
+
+def isNumeric(text):
+    """Returns True for text that float() accepts, and for empty text, which is a missing value and not a wrong one"""
+
+    if text == "":
+        return True
+
+    try:
+        float(text)
+    except ValueError:
+        return False
+
+    return True
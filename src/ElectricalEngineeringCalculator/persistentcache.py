@@ -0,0 +1,297 @@
+"""Result cache kept on disk in SQLite, shared by every batch run and worker process on the machine.
+
+calculateBatch consults it before evaluating a group of jobs and fills it afterwards. Each entry holds the base unit
+results of one calculateBatch call, keyed on a hash of the ElectronicsCalculator version, the methodName and the
+inputs after conversion to base units, so the same design table asked for in other units is still a hit. Entries
+are whole arrays rather than single jobs: a lookup per job would cost more than most electronics_calculator calls.
+
+New entries and the recency of hits are buffered and written in one transaction by flush(). When the file grows
+past maxBytes, the least recently used entries are evicted down to EVICTION_TARGET of it. The database is in WAL
+mode, so any number of processes can read while one writes, and a writer waits up to BUSY_TIMEOUT for another.
+Opening the cache with a different ElectronicsCalculator version empties it; its keys include the version anyway,
+so a result is never served to another version.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .catalog import get_CacheDirectory
+from .resultcache import MISSING
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+EVICTION_TARGET = 0.9  # Eviction stops once the entries fit in this share of maxBytes
+BUSY_TIMEOUT = 30.0  # Seconds a writer waits for another process's transaction
+MAX_PENDING_BYTES = 64 * 1024 * 1024  # put() flushes on its own past this much unwritten data
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key BLOB PRIMARY KEY,
+    results BLOB NOT NULL,
+    errors TEXT,
+    size INTEGER NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_used ON results (used);
+CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS settings (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+INSERT OR IGNORE INTO counters VALUES ('hits', 0), ('misses', 0), ('evictions', 0);
+"""
+
+
+class PersistentCacheStats(namedtuple("PersistentCacheStats", ["hits", "misses", "evictions", "entries", "bytes",
+                                                               "maxBytes"])):
+    """Counters of every process that has used a PersistentCache file, and its current contents"""
+
+    __slots__ = ()
+
+    @property
+    def hitRate(self):
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def since(self, earlier):
+        """Returns the counters accumulated since the earlier stats were taken, with the current contents"""
+
+        return self._replace(hits=self.hits - earlier.hits, misses=self.misses - earlier.misses,
+                             evictions=self.evictions - earlier.evictions)
+
+    def __str__(self):
+        return "%d hits, %d misses (%.1f%% hit rate), %d evictions, %d entries, %.1f/%.1f MB" % (
+            self.hits, self.misses, self.hitRate * 100, self.evictions, self.entries, self.bytes / 1048576,
+            self.maxBytes / 1048576)
+
+
+def get_LibraryVersion():
+    """
+    Identifies the installed ElectronicsCalculator: its package version, plus the size and modification time of its
+    module, so an edited development install also counts as a new version.
+    """
+
+    import ElectronicsCalculator.electronics_calculator as ec
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        packageVersion = version("ElectronicsCalculator")
+    except PackageNotFoundError:
+        packageVersion = "unknown"
+
+    stat = os.stat(ec.__file__)
+
+    return "%s:%d:%d" % (packageVersion, stat.st_size, stat.st_mtime_ns)
+
+
+def get_DefaultPath():
+    return os.path.join(get_CacheDirectory(), "results.sqlite")
+
+
+class PersistentCache:
+    """SQLite file of calculateBatch results. Each process opens its own; do not share one between threads."""
+
+    def __init__(self, path=None, maxBytes=DEFAULT_MAX_BYTES, libraryVersion=None):
+        """
+        Inputs:
+            path [str] - The SQLite file, created if missing. Defaults to results.sqlite in the user's cache directory.
+
+            maxBytes [int] - Size of the stored results past which the least recently used are evicted
+
+            libraryVersion [str] - Version the keys are made for. Defaults to get_LibraryVersion().
+        """
+
+        if maxBytes < 1:
+            raise ValueError("The cache size must be at least 1 byte")
+
+        self.path = path or get_DefaultPath()
+        self.maxBytes = maxBytes
+        self.libraryVersion = libraryVersion or get_LibraryVersion()
+        self.keyPrefix = self.libraryVersion.encode("utf-8") + b"\0"
+        self.pending = {}  # key -> (results, errors, size) of the entries not written yet
+        self.pendingBytes = 0
+        self.used = {}  # key -> time of the latest hit, not written yet
+        self.hits = 0  # Counters not yet added to the database's
+        self.misses = 0
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        # Transactions are begun explicitly, so a writer takes the lock up front instead of upgrading to it
+        self.connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; a power cut loses the last write
+
+        with self.transaction():
+            for statement in SCHEMA.split(";"):
+                if statement.strip():
+                    self.connection.execute(statement)
+
+            row = self.connection.execute("SELECT value FROM settings WHERE name = 'libraryVersion'").fetchone()
+
+            if row is None or row[0] != self.libraryVersion:
+                self.connection.execute("DELETE FROM results")
+                self.connection.execute("INSERT OR REPLACE INTO settings VALUES ('libraryVersion', ?)",
+                                        (self.libraryVersion,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def transaction(self):
+        return _Transaction(self.connection)
+
+    def get_Key(self, methodName, scaledArrays):
+        """
+        Hashes a calculateBatch call's inputs: the library version, the method, the broadcast shape and the base unit
+        values as float64. -0.0 is kept apart from 0.0, since some results keep its sign.
+
+        Output:
+            key [bytes] - 16 byte BLAKE2b digest
+        """
+
+        digest = hashlib.blake2b(self.keyPrefix + methodName.encode("utf-8") + b"\0", digest_size=16)
+        digest.update(repr(scaledArrays[0].shape).encode("ascii"))
+
+        for array in scaledArrays:
+            digest.update(b"\0")
+            digest.update(np.ascontiguousarray(array, dtype=np.float64))
+
+        return digest.digest()
+
+    def get(self, key, shape):
+        """
+        Looks up the base unit results of a calculateBatch call.
+
+        Inputs:
+            key [bytes] - From get_Key
+
+            shape [tuple] - Shape of the broadcast inputs
+
+        Output:
+            entry [tuple] - (results [ndarray], errors [dict]) as calculateBatch returns them, or MISSING
+        """
+
+        entry = self.pending.get(key)
+
+        if entry is not None:
+            self.hits += 1
+            return np.frombuffer(entry[0], dtype=np.float64).reshape(shape).copy(), dict(entry[1])
+
+        row = self.connection.execute("SELECT results, errors FROM results WHERE key = ?", (key,)).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return MISSING
+
+        self.hits += 1
+        self.used[key] = time.time()
+        errors = {int(index): message for index, message in json.loads(row[1]).items()} if row[1] else {}
+
+        return np.frombuffer(row[0], dtype=np.float64).reshape(shape).copy(), errors
+
+    def put(self, key, results, errors):
+        """Buffers the base unit results of a calculateBatch call until the next flush()"""
+
+        data = np.ascontiguousarray(results, dtype=np.float64).tobytes()
+        self.pending[key] = (data, dict(errors), len(data))  # copied, like the results, so the caller may change both
+        self.pendingBytes += len(data)
+
+        if self.pendingBytes > MAX_PENDING_BYTES:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered entries, hit times and counters in one transaction, then evicts if over maxBytes"""
+
+        if not (self.pending or self.used or self.hits or self.misses):
+            return
+
+        now = time.time()
+
+        with self.transaction():
+            self.connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", [
+                (key, data, json.dumps(errors) if errors else None, size, now)
+                for key, (data, errors, size) in self.pending.items()])
+            self.connection.executemany("UPDATE results SET used = ? WHERE key = ?",
+                                        [(used, key) for key, used in self.used.items()])
+            self.connection.executemany("UPDATE counters SET value = value + ? WHERE name = ?",
+                                        [(self.hits, "hits"), (self.misses, "misses")])
+            self.evict()
+
+        self.pending.clear()
+        self.pendingBytes = 0
+        self.used.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def evict(self):
+        """Deletes the least recently used entries down to EVICTION_TARGET of maxBytes. Call within a transaction."""
+
+        total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+        if total <= self.maxBytes:
+            return
+
+        target = self.maxBytes * EVICTION_TARGET
+        keys = []
+
+        for key, size in self.connection.execute("SELECT key, size FROM results ORDER BY used"):
+            if total <= target:
+                break
+
+            keys.append((key,))
+            total -= size
+
+        self.connection.executemany("DELETE FROM results WHERE key = ?", keys)
+        self.connection.execute("UPDATE counters SET value = value + ? WHERE name = 'evictions'", (len(keys),))
+
+    def get_Stats(self):
+        """Flushes, then returns the PersistentCacheStats of the file"""
+
+        self.flush()
+        counters = dict(self.connection.execute("SELECT name, value FROM counters"))
+        entries, size = self.connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+
+        return PersistentCacheStats(counters["hits"], counters["misses"], counters["evictions"], entries, size,
+                                    self.maxBytes)
+
+    def clear(self):
+        """Removes every entry and resets the counters, for every process using the file"""
+
+        self.pending.clear()
+        self.pendingBytes = 0
+        self.used.clear()
+        self.hits = 0
+        self.misses = 0
+
+        with self.transaction():
+            self.connection.execute("DELETE FROM results")
+            self.connection.execute("UPDATE counters SET value = 0")
+
+    def close(self):
+        """Flushes and closes the database"""
+
+        if self.connection is not None:
+            self.flush()
+            self.connection.close()
+            self.connection = None
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, or ROLLBACK when the block raises"""
+
+    __slots__ = ("connection",)
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, excType, excValue, traceback):
+        self.connection.execute("ROLLBACK" if excType is not None else "COMMIT")
@@ -0,0 +1,229 @@
+"""Opt-in timing of the stages users notice: catalog load, widget construction, selection changes, calculations and
+formula image loads.
+
+Profiling is switched on by the EECALC_PROFILE environment variable, or by `--profile` on the command line, which
+sets it, and must be set before the GUI modules are imported:
+
+    EECALC_PROFILE=1             time the stages; print their latency histograms to stderr on exit
+    EECALC_PROFILE=trace.json    also write every timed stage as a Chrome trace (chrome://tracing, Perfetto)
+    EECALC_PROFILE=run.pstats    also run cProfile from the import of this module on and dump its stats (pstats)
+
+Each stage keeps its latest ROLLING_WINDOW durations, measured with perf_counter_ns, from which the histograms and
+percentiles are computed. When profiling is off, timed() returns the function it decorates unchanged and stage()
+returns a shared do-nothing context manager, so the instrumented code runs as if it were not instrumented.
+"""
+
+import atexit
+import os
+import sys
+import time
+from collections import deque, namedtuple
+from contextlib import nullcontext
+from functools import wraps
+
+PROFILE_VARIABLE = "EECALC_PROFILE"
+ROLLING_WINDOW = 1000  # Durations kept per stage
+MAX_TRACE_EVENTS = 100000  # Most recent stage timings kept for the Chrome trace
+PSTATS_EXTENSIONS = (".pstats", ".prof")
+
+StageSummary = namedtuple("StageSummary", ["count", "mean", "p50", "p90", "p99", "max"])
+StageSummary.__doc__ = """Durations of one stage in milliseconds, over its rolling window. count is every call."""
+
+
+class Profiler:
+    """Rolling stage timings, and the optional Chrome trace and cProfile session. Safe to record from any thread."""
+
+    def __init__(self, outputPath=None):
+        """
+        Input:
+            outputPath [str] - Chrome trace (.json) or pstats (.pstats, .prof) file written by finish(), if any
+        """
+
+        self.outputPath = outputPath
+        self.durations = {}  # stage -> deque of the latest ROLLING_WINDOW durations in ns
+        self.counts = {}  # stage -> number of calls since start
+        self.events = deque(maxlen=MAX_TRACE_EVENTS)  # (stage, startNs, durationNs, threadId)
+        self.originNs = time.perf_counter_ns()
+
+        import threading  # Only a profiling session needs it, so keep it off the startup path
+
+        self.lock = threading.Lock()
+        self.get_ThreadId = threading.get_ident
+        self.cProfile = None
+
+        if outputPath is not None and outputPath.endswith(PSTATS_EXTENSIONS):
+            import cProfile
+
+            self.cProfile = cProfile.Profile()
+            self.cProfile.enable()
+
+    def record(self, stage, startNs, endNs):
+        duration = endNs - startNs
+
+        with self.lock:
+            durations = self.durations.get(stage)
+
+            if durations is None:
+                durations = self.durations[stage] = deque(maxlen=ROLLING_WINDOW)
+                self.counts[stage] = 0
+
+            durations.append(duration)
+            self.counts[stage] += 1
+            self.events.append((stage, startNs, duration, self.get_ThreadId()))
+
+    def get_Summary(self, stage):
+        """Returns the StageSummary of a stage, or None if it has not run"""
+
+        with self.lock:
+            if stage not in self.durations:
+                return None
+
+            durations = sorted(self.durations[stage])
+            count = self.counts[stage]
+
+        last = len(durations) - 1
+
+        return StageSummary(count, sum(durations) / len(durations) / 1e6, durations[last // 2] / 1e6,
+                            durations[last * 90 // 100] / 1e6, durations[last * 99 // 100] / 1e6,
+                            durations[-1] / 1e6)
+
+    def get_Last(self, stage):
+        """Returns the duration of the latest call of a stage in milliseconds, or None if it has not run"""
+
+        with self.lock:
+            durations = self.durations.get(stage)
+
+            return durations[-1] / 1e6 if durations else None
+
+    def get_Histogram(self, stage):
+        """
+        Buckets the rolling window of a stage by powers of two of microseconds.
+
+        Output:
+            histogram [list] - (upper bound in µs, count) for each bucket from the fastest to the slowest call
+        """
+
+        with self.lock:
+            durations = list(self.durations.get(stage, ()))
+
+        buckets = {}
+
+        for duration in durations:
+            bound = 1 << max(int(duration // 1000), 1).bit_length()
+            buckets[bound] = buckets.get(bound, 0) + 1
+
+        return sorted(buckets.items())
+
+    def format_Report(self):
+        """Returns a text table of every stage's percentiles and histogram"""
+
+        lines = ["Stage timings (ms, over the latest %d calls of each stage)" % ROLLING_WINDOW,
+                 "  %-34s %7s %9s %9s %9s %9s %9s" % ("stage", "calls", "mean", "p50", "p90", "p99", "max")]
+
+        for stage in sorted(self.durations):
+            summary = self.get_Summary(stage)
+            lines.append("  %-34s %7d %9.3f %9.3f %9.3f %9.3f %9.3f" % ((stage,) + tuple(summary)))
+            lines.append("  %34s %s" % ("", "  ".join("<%dµs:%d" % bucket for bucket in self.get_Histogram(stage))))
+
+        return "\n".join(lines)
+
+    def write_ChromeTrace(self, path):
+        """Writes the recorded stage timings as complete ("X") events of the Chrome trace event format"""
+
+        import json
+
+        with self.lock:
+            events = list(self.events)
+
+        pid = os.getpid()
+        trace = [{"name": stage, "ph": "X", "ts": (startNs - self.originNs) / 1000, "dur": duration / 1000,
+                  "pid": pid, "tid": threadId} for stage, startNs, duration, threadId in events]
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+
+    def finish(self):
+        """Prints the report to stderr and writes the trace or pstats file, if one was asked for"""
+
+        if self.cProfile is not None:
+            self.cProfile.disable()
+            self.cProfile.dump_stats(self.outputPath)
+        elif self.outputPath is not None:
+            self.write_ChromeTrace(self.outputPath)
+
+        print(self.format_Report(), file=sys.stderr)
+
+        if self.outputPath is not None:
+            print("Profile written to %s" % self.outputPath, file=sys.stderr)
+
+
+def get_ProfileSetting():
+    """Returns (enabled, outputPath) from the EECALC_PROFILE environment variable"""
+
+    setting = os.environ.get(PROFILE_VARIABLE, "")
+
+    if setting in ("", "0"):
+        return False, None
+
+    return True, None if setting == "1" else setting
+
+
+ENABLED, _outputPath = get_ProfileSetting()
+profiler = Profiler(_outputPath) if ENABLED else None  # The session's Profiler, None when profiling is off
+
+if ENABLED:
+    atexit.register(profiler.finish)
+
+_nullStage = nullcontext()
+
+
+def timed(function=None, stage=None):
+    """
+    Decorator timing every call of a function as a stage named after the function unless a stage is given. Returns
+    the function itself when profiling is off.
+    """
+
+    if function is None:
+        return lambda function: timed(function, stage)
+
+    if not ENABLED:
+        return function
+
+    stage = stage or function.__name__
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profiler.record(stage, start, time.perf_counter_ns())
+
+    return wrapper
+
+
+class _Stage:
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, excType, excValue, traceback):
+        profiler.record(self.stage, self.start, time.perf_counter_ns())
+
+
+def stage(name):
+    """Context manager timing its block as a stage"""
+
+    return _Stage(name) if ENABLED else _nullStage
+
+
+def record(stage, startNs, endNs=None):
+    """Records a stage timed by the caller, e.g. one that starts and ends in different methods"""
+
+    if ENABLED:
+        profiler.record(stage, startNs, time.perf_counter_ns() if endNs is None else endNs)
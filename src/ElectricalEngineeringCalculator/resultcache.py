@@ -0,0 +1,102 @@
+"""Bounded least-recently-used cache of calculation results.
+
+CalculationEngine keeps one in front of the electronics_calculator calls, keyed on the methodName and the inputs
+after they are converted to base units. The cached value is the base unit result, so asking for the same calculation
+in another output unit only rescales it. Entries beyond the size limit are evicted oldest first.
+"""
+
+from collections import OrderedDict, namedtuple
+
+DEFAULT_CACHE_SIZE = 4096
+
+MISSING = object()  # Returned by ResultCache.get when the key is not cached, since None can be a valid result
+
+
+class CacheStats(namedtuple("CacheStats", ["hits", "misses", "evictions", "size", "maxSize"])):
+    """Counters of a ResultCache since it was created or last cleared"""
+
+    __slots__ = ()
+
+    @property
+    def hitRate(self):
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self):
+        return "%d hits, %d misses (%.1f%% hit rate), %d evictions, %d/%d entries" % (
+            self.hits, self.misses, self.hitRate * 100, self.evictions, self.size, self.maxSize)
+
+
+class ResultCache:
+    """
+    LRU mapping of (methodName, base unit inputs) to the base unit result.
+
+    It can be shared between threads without a lock: every change is a single OrderedDict call, which the GIL makes
+    atomic. A lookup costs about as much as one of the simpler electronics_calculator functions, so a lock would make
+    the cache slower than recalculating. Under contention the counters are approximate, never the results.
+    """
+
+    def __init__(self, maxSize=DEFAULT_CACHE_SIZE):
+        """
+        Input:
+            maxSize [int] - Most results kept before the least recently used is evicted. Must be at least 1.
+        """
+
+        if maxSize < 1:
+            raise ValueError("The cache size must be at least 1")
+
+        self.maxSize = maxSize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """Returns the cached result for key, marking it as recently used, or MISSING"""
+
+        entries = self.entries
+
+        try:
+            retval = entries[key]
+        except KeyError:
+            self.misses += 1
+            return MISSING
+
+        try:
+            entries.move_to_end(key)
+        except KeyError:
+            pass  # evicted by another thread since the lookup; the result is still valid
+
+        self.hits += 1
+
+        return retval
+
+    def put(self, key, value):
+        """Stores a result, evicting the least recently used one when the cache is full"""
+
+        entries = self.entries
+        entries[key] = value
+
+        if len(entries) > self.maxSize:
+            try:
+                entries.popitem(last=False)
+            except KeyError:
+                return  # another thread emptied the cache
+
+            self.evictions += 1
+
+    def clear(self):
+        """Removes every result and resets the counters"""
+
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def stats(self):
+        return CacheStats(self.hits, self.misses, self.evictions, len(self.entries), self.maxSize)
@@ -0,0 +1,384 @@
+"""Columnar store for the points of a sweep or batch: one float64 buffer per column instead of a record per point.
+
+Each column has a name and a unit scale, kept once for the whole column, and its values in a contiguous float64
+buffer. Failed points are NaN, with their error messages kept apart in a dictionary keyed by row, since most points
+have none. get_Column returns read-only NumPy views of the buffers, so the plot and the exports slice the store
+without copying it.
+
+A store is kept in memory, in buffers that double in size as points are appended, or on disk when created with a
+path. A disk store appends each column to a .npy file in its directory and maps the files back into memory to read
+them, so it can hold more points than fit in RAM. save() writes any store to a directory of .npy files, an Arrow IPC
+file (.arrow, .feather, which needs pyarrow) or CSV (.csv), and ResultStore.open maps a saved store back read-only.
+
+Memory per point of a million point sweep of one input, measured with tracemalloc by benchmarks/result_store.py:
+
+    a dict per point, {"Frequency": x, "Reactance": y}      240 bytes
+    a list of Python floats per column                       65 bytes
+    ResultStore in memory                                    20.5 bytes: 16 of values, the rest spare capacity
+    ResultStore on disk                                      0 bytes of RAM, 16 bytes of file mapped on demand
+"""
+
+import csv
+import json
+import os
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+from .units import get_UnitScale
+
+INITIAL_CAPACITY = 1024  # Points an in-memory store has room for before its first growth
+ARROW_EXTENSIONS = (".arrow", ".feather")
+CSV_BLOCK_ROWS = 65536  # Rows converted to Python values at a time when writing CSV
+ERROR_COLUMN = "error"
+METADATA_FILE = "store.json"
+NPY_HEADER_BYTES = 128  # Fixed .npy header size of a disk store's column files, so the row count can be rewritten
+
+ResultColumn = namedtuple("ResultColumn", ["name", "unitScale"])
+ResultColumn.__doc__ = """One column of a ResultStore, e.g. ("Frequency", "KILOHERTZ"). unitScale may be None."""
+
+
+def get_NpyHeader(count):
+    """The NPY_HEADER_BYTES long .npy header of a 1-D float64 array of count values"""
+
+    header = "{'descr': '<f8', 'fortran_order': False, 'shape': (%d,), }" % count
+
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", NPY_HEADER_BYTES - 10) + \
+        header.ljust(NPY_HEADER_BYTES - 11).encode("latin1") + b"\n"
+
+
+def get_ColumnFile(path, index):
+    return os.path.join(path, "column_%d.npy" % index)
+
+
+class ResultStore:
+    """Columns of float64 values sharing one row index, with an error message for each failed row"""
+
+    def __init__(self, columns, path=None, capacity=INITIAL_CAPACITY):
+        """
+        Inputs:
+            columns [sequence] - (name, unitScale) of each column
+
+            path [str] - Directory to keep the columns in, replacing any store saved there. In memory when omitted.
+
+            capacity [int] - Points an in-memory store makes room for up front
+        """
+
+        self.columns = tuple(ResultColumn(*column) for column in columns)
+        self.indexes = {column.name: index for index, column in enumerate(self.columns)}
+        self.count = 0
+        self.errors = {}  # row -> error message of each failed row
+        self.path = path
+        self.readOnly = False
+        self.buffers = None  # float64 buffer of each column, of the store's capacity, in memory
+        self.files = None  # Open .npy file of each column, on disk
+        self.mapped = None  # (count, read-only memmap of each column) of a disk store, as last mapped
+
+        if not self.columns:
+            raise ValueError("A result store needs at least one column")
+
+        if len(self.indexes) != len(self.columns):
+            raise ValueError("The column names of a result store must differ")
+
+        if path is None:
+            self.buffers = [np.empty(max(capacity, 1)) for _ in self.columns]
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.files = [open(get_ColumnFile(path, index), "w+b") for index in range(len(self.columns))]
+            self.flush()
+
+    @classmethod
+    def from_Arrays(cls, columns, arrays, errors=None):
+        """
+        Wraps existing arrays in an in-memory store without copying them, e.g. the results of calculateBatch.
+
+        Inputs:
+            columns [sequence] - (name, unitScale) of each column
+
+            arrays [sequence] - Values of each column, 1-D float64 arrays of the same length
+
+            errors [dict] - Error message of each failed row
+        """
+
+        arrays = [np.asarray(array, dtype=np.float64).reshape(-1) for array in arrays]
+
+        if len({len(array) for array in arrays}) > 1:
+            raise ValueError("The columns of a result store must be the same length")
+
+        store = cls(columns, capacity=1)
+        store.buffers = arrays
+        store.count = len(arrays[0]) if arrays else 0
+        store.errors = dict(errors or {})
+
+        return store
+
+    @classmethod
+    def open(cls, path):
+        """
+        Maps a saved store back into memory read-only, without reading it: a directory of .npy files, or an Arrow IPC
+        file written by save().
+        """
+
+        if os.path.splitext(path)[1].lower() in ARROW_EXTENSIONS:
+            columns, arrays, errors = _readArrow(path)
+        else:
+            with open(os.path.join(path, METADATA_FILE), "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+
+            columns = metadata["columns"]
+            arrays = [np.load(get_ColumnFile(path, index), mmap_mode="r")[:metadata["count"]]
+                      for index in range(len(columns))]
+            errors = {int(row): message for row, message in metadata["errors"].items()}
+
+        store = cls.from_Arrays(columns, arrays, errors)
+        store.readOnly = True
+
+        return store
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    @property
+    def nbytes(self):
+        """Bytes of column values held, whatever the capacity allocated"""
+
+        return self.count * len(self.columns) * 8
+
+    def get_Index(self, column):
+        """Position of a column given by name or position"""
+
+        return self.indexes[column] if isinstance(column, str) else column
+
+    def get_Title(self, column):
+        """Header of a column with its unit, e.g. "Frequency (KHz)\""""
+
+        column = self.columns[self.get_Index(column)]
+
+        if column.unitScale is None:
+            return column.name
+
+        return "%s (%s)" % (column.name, get_UnitScale(column.unitScale).abbreviation)
+
+    def append(self, values, errors=None):
+        """
+        Appends a block of points.
+
+        Inputs:
+            values [sequence] - One array or scalar per column. They are broadcast to a common length.
+
+            errors [dict] - Error message of each failed point, keyed by its index in the block
+        """
+
+        if self.readOnly:
+            raise ValueError("The result store is read only")
+
+        if len(values) != len(self.columns):
+            raise ValueError("Expected %d columns of values, got %d" % (len(self.columns), len(values)))
+
+        arrays = [array.reshape(-1) for array in np.broadcast_arrays(*[np.asarray(value, dtype=np.float64)
+                                                                         for value in values])]
+        count = len(arrays[0])
+
+        if self.files is None:
+            if self.count + count > len(self.buffers[0]):
+                self.grow(self.count + count)
+
+            for buffer, array in zip(self.buffers, arrays):
+                buffer[self.count:self.count + count] = array
+        else:
+            for f, array in zip(self.files, arrays):
+                f.seek(0, os.SEEK_END)
+                f.write(np.ascontiguousarray(array, dtype="<f8").data)
+
+        if errors:
+            self.errors.update((self.count + index, message) for index, message in errors.items())
+
+        self.count += count
+
+    def grow(self, capacity):
+        """Moves the columns of an in-memory store into buffers of at least double the size"""
+
+        capacity = max(capacity, 2 * len(self.buffers[0]))
+        buffers = []
+
+        for buffer in self.buffers:
+            grown = np.empty(capacity)
+            grown[:self.count] = buffer[:self.count]
+            buffers.append(grown)
+
+        self.buffers = buffers
+
+    def get_Column(self, column, start=None, stop=None):
+        """
+        Gets the values of one column, or of a range of its rows, without copying them.
+
+        Inputs:
+            column [str|int] - Name or position of the column
+
+            start, stop [int] - Range of rows, as in a slice. Every row when omitted.
+
+        Output:
+            values [ndarray] - Read-only float64 view. Points appended later are not in it.
+        """
+
+        index = self.get_Index(column)
+
+        if self.files is None:
+            values = self.buffers[index][:self.count][start:stop]
+        else:
+            values = self.get_Mapped()[index][start:stop]
+
+        values.flags.writeable = False
+
+        return values
+
+    def get_Mapped(self):
+        """Read-only memmaps of a disk store's column files, remapped when points have been appended"""
+
+        if self.mapped is None or self.mapped[0] != self.count:
+            self.flush()
+            self.mapped = (self.count, [np.memmap(get_ColumnFile(self.path, index), dtype="<f8", mode="r",
+                                                  offset=NPY_HEADER_BYTES, shape=(self.count,))
+                                        if self.count else np.empty(0)
+                                        for index in range(len(self.columns))])
+
+        return self.mapped[1]
+
+    def flush(self):
+        """Writes the row count and errors of a disk store, so its files can be opened as they are"""
+
+        if self.files is None:
+            return
+
+        for f in self.files:
+            f.seek(0)
+            f.write(get_NpyHeader(self.count))
+            f.flush()
+
+        self.write_Metadata(self.path)
+
+    def close(self):
+        """Flushes a disk store and closes its files. The store can still be read, but no longer appended to."""
+
+        if self.files is not None and not self.readOnly:
+            self.flush()
+
+            for f in self.files:
+                f.close()
+
+        self.readOnly = True
+
+    def write_Metadata(self, path):
+        metadata = {"columns": [list(column) for column in self.columns], "count": self.count,
+                    "errors": {str(row): message for row, message in sorted(self.errors.items())}}
+
+        with open(os.path.join(path, METADATA_FILE), "w", encoding="utf-8") as f:
+            json.dump(metadata, f)
+
+    def save(self, path):
+        """
+        Writes the store, in the format given by the extension of path: Arrow IPC (.arrow, .feather), CSV (.csv) with
+        one row per point and an error column, or otherwise a directory of .npy files that open() maps back.
+        """
+
+        extension = os.path.splitext(path)[1].lower()
+
+        if extension in ARROW_EXTENSIONS:
+            self.write_Arrow(path)
+        elif extension == ".csv":
+            self.write_Csv(path)
+        else:
+            os.makedirs(path, exist_ok=True)
+
+            for index in range(len(self.columns)):
+                np.save(get_ColumnFile(path, index), self.get_Column(index))
+
+            self.write_Metadata(path)
+
+        return
+
+    def write_Csv(self, path):
+        """Writes one row per point, converting a block of rows at a time rather than the whole store"""
+
+        errors = self.errors
+
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([self.get_Title(index) for index in range(len(self.columns))] + [ERROR_COLUMN])
+
+            for start in range(0, self.count, CSV_BLOCK_ROWS):
+                columns = [self.get_Column(index, start, start + CSV_BLOCK_ROWS).tolist()
+                           for index in range(len(self.columns))]
+                writer.writerows([repr(value) if value == value else "" for value in values] +
+                                 [errors.get(row, "")]
+                                 for row, values in enumerate(zip(*columns), start))
+
+        return
+
+    def write_Arrow(self, path):
+        """Writes one record batch, with each column's unit scale in its field metadata and the errors as strings"""
+
+        import pyarrow as pa
+
+        fields = [pa.field(column.name, pa.float64(), nullable=False,
+                           metadata=None if column.unitScale is None else {"unitScale": column.unitScale})
+                  for column in self.columns]
+        fields.append(pa.field(ERROR_COLUMN, pa.string()))
+        arrays = [pa.array(self.get_Column(index)) for index in range(len(self.columns))]
+
+        if self.errors:
+            messages = [None] * self.count
+
+            for row, message in self.errors.items():
+                messages[row] = message
+
+            arrays.append(pa.array(messages, type=pa.string()))
+        else:
+            arrays.append(pa.nulls(self.count, type=pa.string()))
+
+        schema = pa.schema(fields)
+
+        with pa.ipc.new_file(path, schema) as writer:
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+
+        return
+
+
+def _readArrow(path):
+    """Maps an Arrow IPC file written by ResultStore.write_Arrow, returning its columns, arrays and errors"""
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    columns = []
+    arrays = []
+
+    for field in table.schema:
+        if field.name == ERROR_COLUMN:
+            continue
+
+        unitScale = (field.metadata or {}).get(b"unitScale")
+        columns.append((field.name, None if unitScale is None else unitScale.decode("utf-8")))
+        column = table.column(field.name)
+
+        if column.num_chunks == 1:
+            arrays.append(column.chunk(0).to_numpy(zero_copy_only=True))
+        else:
+            arrays.append(column.to_numpy())
+
+    errors = {}
+
+    if ERROR_COLUMN in table.schema.names:
+        messages = table.column(ERROR_COLUMN)
+        rows = np.flatnonzero(pc.is_valid(messages).to_numpy(zero_copy_only=False))
+        errors = dict(zip(rows.tolist(), messages.take(rows).to_pylist()))
+
+    return columns, arrays, errors
@@ -0,0 +1,365 @@
+"""Batch runner that evaluates a file of calculation jobs without opening the GUI.
+
+Each row of the input file is one job. The columns use the same names as the calculation records:
+
+    calculation         displayName or methodName of the calculation, e.g. "voltage_divider_r"
+    parameter_N         value of input N (1-based, in catalog order)
+    inputUnitScale_N    unit scale of input N, e.g. "KILOHMS" (optional, defaults to the catalog scale)
+    outputUnitScale     unit scale of the result (optional, defaults to the catalog scale)
+
+The output file repeats the input columns and adds "result" and "error". Rows are read, evaluated and written in
+chunks, so memory use depends on the chunk size rather than the size of the file. CSV is always supported; Parquet
+(.parquet) and Arrow IPC (.arrow, .feather) files need pyarrow.
+"""
+
+import csv
+import os
+import time
+
+import numpy as np
+
+from .batch import calculateBatch
+from .units import get_UnitScale
+
+DEFAULT_CHUNK_SIZE = 10000
+ARROW_EXTENSIONS = (".parquet", ".arrow", ".feather")
+RESULT_COLUMNS = ("result", "error")
+
+
+class BatchSummary:
+    """Counts and timing of one batch run"""
+
+    def __init__(self, rows, errors, seconds):
+        self.rows = rows
+        self.errors = errors
+        self.seconds = seconds
+
+    @property
+    def rowsPerSecond(self):
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+    def __str__(self):
+        return "Evaluated %d rows (%d errors) in %.2f s: %.0f rows/s" % (self.rows, self.errors, self.seconds,
+                                                                           self.rowsPerSecond)
+
+
+def runBatchFile(engine, inputPath, outputPath, chunkSize=DEFAULT_CHUNK_SIZE, workers=1):
+    """
+    Evaluates every job in inputPath and writes the results to outputPath.
+
+    Inputs:
+        engine [CalculationEngine] - Engine holding the calculation catalog
+
+        inputPath [str] - CSV, Parquet or Arrow IPC file of jobs, chosen by extension
+
+        outputPath [str] - Where the results are written, in the format given by its extension
+
+        chunkSize [int] - Number of rows in each chunk
+
+        workers [int] - Number of worker processes. With 1, rows are evaluated in this process.
+
+    Output:
+        summary [BatchSummary] - Row and error counts, and the throughput
+    """
+
+    start = time.perf_counter()
+    rowCount = 0
+    errorCount = 0
+    columns, inputSchema, chunks = openReader(inputPath, chunkSize)
+
+    # Re-running a results file replaces its previous results instead of repeating the columns
+    columns = [column for column in columns if column not in RESULT_COLUMNS]
+    writer = openWriter(outputPath, columns, inputSchema)
+    evaluator = None
+
+    try:
+        if workers > 1:
+            from .parallel import ParallelEvaluator
+
+            evaluator = ParallelEvaluator(engine, workers)
+            evaluatedChunks = evaluator.evaluateChunks(chunks)
+        else:
+            evaluatedChunks = ((rows,) + evaluateChunk(engine, rows) for rows in chunks)
+
+        for rows, results, errors in evaluatedChunks:
+            writer.write(rows, results, errors)
+            rowCount += len(rows)
+            errorCount += len(errors)
+    finally:
+        writer.close()
+
+        if evaluator is not None:
+            evaluator.close()
+
+    return BatchSummary(rowCount, errorCount, time.perf_counter() - start)
+
+
+def evaluateChunk(engine, rows):
+    """
+    Evaluates a list of job rows. Rows with the same calculation and unit scales are evaluated together in one
+    vectorized call. The results are kept as one float64 column rather than a Python float per row.
+
+    Inputs:
+        engine [CalculationEngine] - Engine holding the calculation catalog
+
+        rows [list] - One dictionary per job, keyed by column name
+
+    Outputs:
+        results [ndarray] - float64 result of each row, NaN where the row failed
+
+        errors [dict] - Error message of each failed row, keyed by its index
+    """
+
+    results = np.full(len(rows), np.nan)
+    errors = {}
+    groups = {}
+
+    for index, row in enumerate(rows):
+        try:
+            name, inputValues, inputUnitScales, outputUnitScale = parseJob(engine, row)
+        except (KeyError, ValueError) as e:
+            errors[index] = e.args[0]
+            continue
+
+        group = groups.setdefault((name, inputUnitScales, outputUnitScale), ([], []))
+        group[0].append(index)
+        group[1].append(inputValues)
+
+    for (name, inputUnitScales, outputUnitScale), (indexes, values) in groups.items():
+        columns = [np.array(column, dtype=np.float64) for column in zip(*values)]
+        groupResults, groupErrors = calculateBatch(engine, name, columns, inputUnitScales, outputUnitScale)
+
+        results[indexes] = groupResults  # NaN where an element failed
+
+        for position, error in groupErrors.items():
+            errors[indexes[position]] = error
+
+    if engine.persistentCache is not None:
+        engine.persistentCache.flush()  # one transaction per chunk, as a worker process may exit before the next
+
+    return results, dict(sorted(errors.items()))
+
+
+def get_ResultLists(results, errors):
+    """
+    Turns the results and errors of evaluateChunk into one entry per row, as JSON answers list them.
+
+    Outputs:
+        results [list] - The result of each row, None where the row failed
+
+        errors [list] - The error message of each row, "" where the row succeeded
+    """
+
+    results = results.tolist()
+    errorList = [""] * len(results)
+
+    for index, error in errors.items():
+        results[index] = None
+        errorList[index] = error
+
+    return results, errorList
+
+
+def parseJob(engine, row):
+    """
+    Validates one job and converts its values to numbers.
+
+    Inputs:
+        engine [CalculationEngine] - Engine holding the calculation catalog
+
+        row [dict] - The job, keyed by column name
+
+    Output:
+        name [str] - displayName of the calculation
+
+        inputValues [tuple] - The numeric inputs
+
+        inputUnitScales [tuple] - The unit scale of every input
+
+        outputUnitScale [str] - The unit scale of the result
+
+    Raises:
+        KeyError - Unknown calculation or unit scale
+
+        ValueError - Missing or non-numeric inputs, or a unit scale of the wrong unit type
+    """
+
+    plan = engine.get_Plan(_get_Cell(row, "calculation"))
+    texts = [_get_Cell(row, "parameter_%d" % count) for count in range(1, len(plan.inputUnitScales) + 1)]
+
+    if plan.tupleMode:
+        # A tuple takes any number of values, so columns past the catalog's parameters are read too
+        while "parameter_%d" % (len(texts) + 1) in row:
+            texts.append(_get_Cell(row, "parameter_%d" % (len(texts) + 1)))
+
+        while texts and texts[-1] == "":
+            texts.pop()
+
+        if not texts:
+            raise ValueError("parameter_1 is missing")
+    else:
+        texts = texts[:plan.arity]
+
+    inputValues = []
+    inputUnitScales = []
+
+    for count, text in enumerate(texts, 1):
+        if text == "":
+            raise ValueError("parameter_%d is missing" % count)
+
+        try:
+            inputValues.append(float(text))
+        except ValueError:
+            raise ValueError("parameter_%d is not numeric: %s" % (count, text)) from None
+
+        inputUnitScales.append(_get_UnitScale(row, "inputUnitScale_%d" % count,
+                                              plan.inputUnitScales[min(count, len(plan.inputUnitScales)) - 1]))
+
+    outputUnitScale = _get_UnitScale(row, "outputUnitScale", plan.outputUnitScale)
+
+    return plan.displayName, tuple(inputValues), tuple(inputUnitScales), outputUnitScale
+
+
+def _get_Cell(row, column):
+    value = row.get(column)
+
+    if value is None:
+        return ""
+
+    return str(value).strip()
+
+
+def _get_UnitScale(row, column, defaultScale):
+    """Reads an optional unit scale column, checking it is a scale of the same unit type as the catalog default"""
+
+    scale = _get_Cell(row, column)
+
+    if scale == "" or scale == defaultScale:
+        return defaultScale
+
+    unitType = get_UnitScale(defaultScale).unitType
+
+    if get_UnitScale(scale).unitType != unitType:
+        raise ValueError("%s must be a %s scale, not %s" % (column, unitType, scale))
+
+    return scale
+
+
+# ===============
+# READERS/WRITERS
+# ===============
+def openReader(path, chunkSize):
+    """
+    Opens a job file for reading in chunks.
+
+    Output:
+        columns [list] - Column names in file order
+
+        schema [pyarrow.Schema] - Column types of Parquet/Arrow files, None for CSV
+
+        chunks [iterator] - Lists of at most chunkSize row dictionaries
+    """
+
+    if os.path.splitext(path)[1].lower() in ARROW_EXTENSIONS:
+        return _openArrowReader(path, chunkSize)
+
+    f = open(path, "r", newline="", encoding="utf-8-sig")
+    reader = csv.DictReader(f)
+    columns = list(reader.fieldnames or [])
+
+    def readChunks():
+        with f:
+            rows = []
+
+            for row in reader:
+                rows.append(row)
+
+                if len(rows) == chunkSize:
+                    yield rows
+                    rows = []
+
+            if rows:
+                yield rows
+
+    return columns, None, readChunks()
+
+
+def _openArrowReader(path, chunkSize):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if path.lower().endswith(".parquet"):
+        parquetFile = pq.ParquetFile(path)
+        schema = parquetFile.schema_arrow
+        batches = parquetFile.iter_batches(batch_size=chunkSize)
+    else:
+        reader = pa.ipc.open_file(pa.memory_map(path, "r"))
+        schema = reader.schema
+        batches = (reader.get_batch(index) for index in range(reader.num_record_batches))
+
+    def readChunks():
+        for batch in batches:
+            for offset in range(0, batch.num_rows, chunkSize):
+                yield batch.slice(offset, chunkSize).to_pylist()
+
+    return list(schema.names), schema, readChunks()
+
+
+def openWriter(path, columns, inputSchema=None):
+    """Opens the results file, which has the input columns followed by result and error"""
+
+    if os.path.splitext(path)[1].lower() in ARROW_EXTENSIONS:
+        return _ArrowWriter(path, columns, inputSchema)
+
+    return _CsvWriter(path, columns)
+
+
+class _CsvWriter:
+    def __init__(self, path, columns):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.columns = columns
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(columns + list(RESULT_COLUMNS))
+
+    def write(self, rows, results, errors):
+        columns = self.columns
+        results, errors = get_ResultLists(results, errors)
+        self.writer.writerows([row.get(column) for column in columns] + ["" if result is None else repr(result), error]
+                              for row, result, error in zip(rows, results, errors))
+
+    def close(self):
+        self.file.close()
+
+
+class _ArrowWriter:
+    def __init__(self, path, columns, inputSchema):
+        import pyarrow as pa
+
+        self.pa = pa
+        self.columns = columns
+
+        if inputSchema is None:
+            fields = [pa.field(column, pa.string()) for column in columns]
+        else:
+            fields = [inputSchema.field(column) for column in columns]
+
+        self.schema = pa.schema(fields + [pa.field("result", pa.float64()), pa.field("error", pa.string())])
+
+        if path.lower().endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            self.writer = pq.ParquetWriter(path, self.schema)
+        else:
+            self.writer = pa.ipc.new_file(path, self.schema)
+
+    def write(self, rows, results, errors):
+        arrays = [self.pa.array([row.get(column) for row in rows], type=self.schema.field(column).type)
+                  for column in self.columns]
+        failed = np.zeros(len(results), dtype=bool)
+        failed[list(errors)] = True
+        arrays.append(self.pa.array(results, type=self.pa.float64(), mask=failed))
+        arrays.append(self.pa.array([errors.get(index, "") for index in range(len(results))], type=self.pa.string()))
+        self.writer.write_table(self.pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
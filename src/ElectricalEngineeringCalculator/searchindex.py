@@ -0,0 +1,148 @@
+"""Type-to-search index over the calculation catalog.
+
+Every calculation is indexed under the words of its displayName, outputName, parameter names, methodName and
+description. Each word is split into all of its prefixes, and each prefix maps to the calculations holding a word
+that starts with it, with a score: the weight of the best field the word appears in, doubled when the prefix is the
+whole word. The prefix postings are a flattened prefix trie. A query costs one dictionary lookup per word typed,
+whatever the size of the catalog, plus an intersection when it has several words.
+
+A query matches the calculations holding a word that starts with each of its words, ranked by the sum of their
+scores and then in selector order. The ranked list of a prefix is sorted the first time it is asked for and kept, so
+typing a word one letter at a time sorts each prefix once.
+"""
+
+import re
+from operator import itemgetter
+
+# Weight of a word by the field it appears in, in decreasing order, so a match in the name ranks above one in the
+# description, and the first word of the name, usually the quantity solved for, above the rest of it
+FIELD_WEIGHTS = (("leadingWord", 32), ("displayName", 16), ("outputName", 8), ("parameters", 4), ("methodName", 2),
+                 ("description", 1))
+WHOLE_WORD_FACTOR = 2  # Score multiplier when a query word is a whole indexed word, not just its prefix
+
+WORD = re.compile(r"[^\W_]+")  # Runs of letters and digits; underscores split methodNames such as power_er
+
+
+def get_Words(text):
+    """Lowercase words of text, in order"""
+
+    return WORD.findall(text.lower())
+
+
+def get_RankedPositions(scores):
+    """Positions of a {position: score} dict by decreasing score, then increasing position"""
+
+    # Two sorts without a Python key function: positions first, then a stable sort by score keeps them in order
+    return sorted(sorted(scores), key=scores.__getitem__, reverse=True)
+
+
+class SearchIndex:
+    """Prefix postings of the calculations in a catalog, queried with search()"""
+
+    def __init__(self, catalog):
+        """
+        Input:
+            catalog [Catalog] - The calculations to index. Matches are returned in catalog.displayNames order on ties.
+        """
+
+        self.displayNames = catalog.displayNames
+        self.positions = {displayName: position for position, displayName in enumerate(self.displayNames)}
+        self.postings = {}  # prefix -> {position: score}
+        self.ranked = {}  # prefix -> positions of its postings, best first; filled as prefixes are searched
+        wordPositions = {}  # word -> {weight: positions of the calculations holding it in a field of that weight}
+
+        for position, displayName in enumerate(self.displayNames):
+            calculation = catalog.byDisplayName[displayName]
+            parameters = calculation["parameters"]
+            words = get_Words(displayName)
+            fields = {
+                "leadingWord": words[:1],
+                "displayName": words[1:],
+                "outputName": get_Words(calculation["outputName"]),
+                "parameters": get_Words(" ".join(parameters["parameter_%d" % count]
+                                                 for count in range(1, len(parameters) // 2 + 1))),
+                "methodName": get_Words(calculation["methodName"]),
+                "description": get_Words(calculation["description"])
+            }
+            bestWeights = {}  # word -> weight of the best field holding it
+
+            for field, weight in reversed(FIELD_WEIGHTS):
+                bestWeights.update(dict.fromkeys(fields[field], weight))
+
+            for word, weight in bestWeights.items():
+                wordPositions.setdefault(word, {}).setdefault(weight, []).append(position)
+
+        # Every (prefix, score, positions) a word contributes. Applied in increasing score order, each prefix's
+        # postings can be overwritten with dict.update and still end up holding the best score of every position.
+        contributions = []
+
+        for word, byWeight in wordPositions.items():
+            for weight, positions in byWeight.items():
+                for length in range(1, len(word)):
+                    contributions.append((weight, word[:length], positions))
+
+                contributions.append((weight * WHOLE_WORD_FACTOR, word, positions))
+
+        contributions.sort(key=itemgetter(0))
+
+        for score, prefix, positions in contributions:
+            postings = self.postings.get(prefix)
+
+            if postings is None:
+                postings = self.postings[prefix] = {}
+
+            postings.update(dict.fromkeys(positions, score))
+
+    def __len__(self):
+        return len(self.displayNames)
+
+    def get_Ranked(self, prefix):
+        """Positions of the calculations holding a word that starts with prefix, best scoring first"""
+
+        ranked = self.ranked.get(prefix)
+
+        if ranked is None:
+            postings = self.postings.get(prefix, {})
+            ranked = self.ranked[prefix] = get_RankedPositions(postings)
+
+        return ranked
+
+    def search(self, query, limit=None):
+        """
+        Finds the calculations matching every word of a query.
+
+        Inputs:
+            query [str] - Words, or the beginnings of words, to look for. An empty query matches every calculation.
+
+            limit [int] - Most matches returned. All of them when omitted.
+
+        Output:
+            displayNames [list] - displayNames of the matches, best first
+        """
+
+        words = get_Words(query)
+
+        if not words:
+            return list(self.displayNames[:limit])
+
+        if len(words) == 1:
+            return [self.displayNames[position] for position in self.get_Ranked(words[0])[:limit]]
+
+        # Start from the word with the fewest matches, so the intersection is never larger than that
+        words = sorted(set(words), key=lambda word: len(self.postings.get(word, ())))
+        scores = dict(self.postings.get(words[0], {}))
+
+        for word in words[1:]:
+            if not scores:
+                break
+
+            postings = self.postings.get(word, {})
+            scores = {position: score + postings[position] for position, score in scores.items()
+                      if position in postings}
+
+        return [self.displayNames[position] for position in get_RankedPositions(scores)[:limit]]
+
+    def get_Position(self, displayName):
+        """Position of a calculation in catalog.displayNames"""
+
+        return self.positions[displayName]
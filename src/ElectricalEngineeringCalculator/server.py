@@ -0,0 +1,324 @@
+"""Headless HTTP/JSON calculation service built on asyncio streams from the standard library.
+
+The server loads the catalog, the unit registry and the precompiled call plans once, at start-up, and keeps them for
+every request. It speaks enough HTTP/1.1 for JSON clients, keep-alive included:
+
+    GET  /calculations  The catalog: each calculation with its parameters, output and the unit scales they accept
+    POST /calculate     One job, answered with {"result": number}, or {"jobs": [job, ...]}, answered with
+                        {"results": [number or null, ...], "errors": ["" or message, ...]} in job order
+
+A job is {"calculation": displayName or methodName, "inputValues": [number, ...]} with optional "inputUnitScales"
+(one scale or null per input, e.g. "KILOHMS") and "outputUnitScale". Jobs are validated exactly like the rows of a
+batch file (see runner.py). A single job is evaluated on the event loop, since it takes microseconds. A batch is
+split into chunks for a pool of worker processes (see parallel.py), so the event loop keeps answering other
+requests while the batch runs. Batches too small to be worth sending to a process are evaluated on the event loop.
+"""
+
+import asyncio
+import json
+import math
+import sys
+import traceback
+
+import numpy as np
+
+from .engine import CalculationEngine
+from .runner import evaluateChunk, get_ResultLists, parseJob
+from .units import get_SiblingScales
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_CHUNK_SIZE = 10000  # Jobs per chunk sent to a worker
+INLINE_BATCH_SIZE = 200  # Batches up to this size cost less to evaluate in place than to send to a worker
+MAX_BODY_SIZE = 64 * 1024 * 1024
+PARAMETER_COLUMNS = tuple("parameter_%d" % count for count in range(1, 101))
+INPUT_UNIT_SCALE_COLUMNS = tuple("inputUnitScale_%d" % count for count in range(1, 101))
+NOT_FINITE_ERROR = "The result is not a finite number"  # JSON has no Infinity or NaN to answer with
+HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HttpError(Exception):
+    """Ends a request with an HTTP error status and a JSON {"error": message} body"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class CalculationServer:
+    """Serves the calculation catalog over HTTP, keeping one warm CalculationEngine for its lifetime"""
+
+    def __init__(self, engine=None, workers=0, chunkSize=DEFAULT_CHUNK_SIZE):
+        """
+        Inputs:
+            engine [CalculationEngine] - Engine evaluating single jobs and small batches. A new one loads the bundled
+                                         catalog when omitted.
+
+            workers [int] - Worker processes evaluating batches. With 0, batches are evaluated on the event loop.
+
+            chunkSize [int] - Most jobs of a batch sent to one worker at a time
+        """
+
+        self.engine = engine if engine is not None else CalculationEngine()
+        self.chunkSize = chunkSize
+        self.evaluator = None
+        self.requestCount = 0
+        self.catalogBody = json.dumps(self.get_Catalog()).encode("utf-8")  # built once, the catalog never changes
+
+        if workers > 0:
+            from .parallel import ParallelEvaluator
+
+            # Workers are started on the first large batch; forked then, they would hold open the sockets of every
+            # connection, so a connection the server closes would stay open until the workers exit
+            self.evaluator = ParallelEvaluator(self.engine, workers, startMethod="spawn")
+
+    def close(self):
+        if self.evaluator is not None:
+            self.evaluator.close()
+            self.evaluator = None
+
+    def get_Catalog(self):
+        """Describes every calculation, in the order of the GUI selector"""
+
+        catalog = []
+
+        for displayName in self.engine.catalog.displayNames:
+            calculation = self.engine.catalog.byDisplayName[displayName]
+            plan = self.engine.get_Plan(displayName)
+            parameters = calculation["parameters"]
+
+            catalog.append({
+                "displayName": displayName,
+                "methodName": calculation["methodName"],
+                "tupleMode": plan.tupleMode,  # Any number of inputs; those past the list take the last one's unit
+                "parameters": [{"name": parameters["parameter_%d" % count],
+                                "inputUnitScale": parameters["inputUnitScale_%d" % count],
+                                "unitScales": list(get_SiblingScales(parameters["inputUnitScale_%d" % count]))}
+                               for count in range(1, len(parameters) // 2 + 1)],
+                "outputName": calculation["outputName"],
+                "outputUnitScale": calculation["outputUnitScale"],
+                "outputUnitScales": list(get_SiblingScales(calculation["outputUnitScale"])),
+            })
+
+        return catalog
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Starts listening, returning the asyncio.Server. Port 0 picks a free port."""
+
+        return await asyncio.start_server(self.handle_Connection, host, port)
+
+    async def handle_Connection(self, reader, writer):
+        """Answers the requests of one connection in turn until the client closes it or asks to"""
+
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break  # the client closed the connection between requests
+
+                method, path, version, headers = parseRequestHead(head)
+                keepAlive = (headers.get("connection", "").lower() != "close" if version == "HTTP/1.1"
+                             else headers.get("connection", "").lower() == "keep-alive")
+
+                bodyRead = False
+
+                try:
+                    body = await self.read_Body(reader, method, headers)
+                    bodyRead = True
+                    status, payload = 200, await self.route(method, path, body)
+                except HttpError as e:
+                    status, payload = e.status, json.dumps({"error": str(e)}).encode("utf-8")
+                except Exception:  # a fault in an endpoint; answer it rather than drop the connection
+                    traceback.print_exc(file=sys.stderr)  # the details stay in the server's log
+                    status, payload = 500, json.dumps({"error": "Internal error"}).encode("utf-8")
+
+                keepAlive = keepAlive and bodyRead  # an unread body would be taken for the next request
+
+                self.requestCount += 1
+                writer.write(b"%s %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n%s\r\n%s" % (
+                    version.encode("ascii"), status, HTTP_REASONS[status].encode("ascii"), len(payload),
+                    b"" if keepAlive else b"Connection: close\r\n", payload))
+                await writer.drain()
+
+                if not keepAlive:
+                    break
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass  # a broken connection, or a request head too long or malformed to answer
+        finally:
+            writer.close()
+
+    async def read_Body(self, reader, method, headers):
+        if method != "POST":
+            return b""
+
+        if "content-length" not in headers:
+            raise HttpError(411, "Content-Length is required")
+
+        try:
+            length = int(headers["content-length"])
+        except ValueError:
+            raise HttpError(400, "Content-Length is not a number") from None
+
+        if length > MAX_BODY_SIZE:
+            raise HttpError(413, "Request bodies are limited to %d bytes" % MAX_BODY_SIZE)
+
+        return await reader.readexactly(length)
+
+    async def route(self, method, path, body):
+        """Dispatches a request to its endpoint, returning the JSON response body"""
+
+        path = path.split("?", 1)[0]
+
+        if path == "/calculations":
+            if method != "GET":
+                raise HttpError(405, "/calculations only accepts GET")
+
+            return self.catalogBody
+
+        if path == "/calculate":
+            if method != "POST":
+                raise HttpError(405, "/calculate only accepts POST")
+
+            try:
+                request = json.loads(body)
+            except ValueError as e:
+                raise HttpError(400, "The body is not valid JSON: %s" % e) from None
+
+            if isinstance(request, dict) and "jobs" in request:
+                response = await self.calculate_Jobs(request["jobs"])
+            else:
+                response = {"result": self.calculate_Job(request)}
+
+            return json.dumps(response, allow_nan=False).encode("utf-8")
+
+        raise HttpError(404, "Unknown path: %s" % path)
+
+    def calculate_Job(self, job):
+        """Evaluates one job on the event loop, through the engine's result cache"""
+
+        try:
+            name, inputValues, inputUnitScales, outputUnitScale = parseJob(self.engine, get_JobRow(job))
+            result = self.engine.calculate(name, inputValues, inputUnitScales, outputUnitScale)
+        except (KeyError, ValueError) as e:
+            raise HttpError(400, e.args[0]) from None
+        except Exception as e:  # Handles exceptions that the electronics_module throws
+            raise HttpError(400, str(e)) from None
+
+        if not math.isfinite(result):
+            raise HttpError(400, NOT_FINITE_ERROR)
+
+        return result
+
+    async def calculate_Jobs(self, jobs):
+        """Evaluates a batch of jobs, in worker processes unless it is small, returning the results and errors"""
+
+        if not isinstance(jobs, list):
+            raise HttpError(400, "jobs must be a list")
+
+        rows = []
+        rowErrors = {}
+
+        for index, job in enumerate(jobs):
+            try:
+                rows.append(get_JobRow(job))
+            except ValueError as e:
+                rows.append({})
+                rowErrors[index] = e.args[0]
+
+        if self.evaluator is None or len(rows) <= INLINE_BATCH_SIZE:
+            results, errors = evaluateChunk(self.engine, rows)
+        else:
+            offsets = range(0, len(rows), self.chunkSize)
+            futures = [asyncio.wrap_future(self.evaluator.submitRows(rows[offset:offset + self.chunkSize]))
+                       for offset in offsets]
+            chunks = await asyncio.gather(*futures)
+            results = np.concatenate([chunkResults for chunkResults, chunkErrors in chunks])
+            errors = {offset + index: error for offset, (chunkResults, chunkErrors) in zip(offsets, chunks)
+                      for index, error in chunkErrors.items()}
+
+        errors.update(rowErrors)
+
+        # Failed rows are NaN too, but keep their own error
+        for index in np.flatnonzero(~np.isfinite(results)).tolist():
+            errors.setdefault(index, NOT_FINITE_ERROR)
+
+        results, errors = get_ResultLists(results, errors)
+
+        return {"results": results, "errors": errors}
+
+
+def get_JobRow(job):
+    """
+    Converts a JSON job into a job row as read from a batch file (see runner.py), so both are validated alike.
+
+    Input:
+        job [dict] - {"calculation": name, "inputValues": [...], "inputUnitScales": [...], "outputUnitScale": scale}
+
+    Output:
+        row [dict] - {"calculation": name, "parameter_1": value, "inputUnitScale_1": scale, ..., "outputUnitScale"}
+    """
+
+    if not isinstance(job, dict):
+        raise ValueError("A job must be a JSON object")
+
+    inputValues = job.get("inputValues") or []
+    inputUnitScales = job.get("inputUnitScales") or []
+
+    if not isinstance(inputValues, list) or not isinstance(inputUnitScales, list):
+        raise ValueError("inputValues and inputUnitScales must be lists")
+
+    # Values are checked by parseJob, which, as for batch files, also accepts numbers written as strings
+    row = dict(zip(PARAMETER_COLUMNS, inputValues))
+    row.update(zip(INPUT_UNIT_SCALE_COLUMNS, inputUnitScales))
+
+    # Tuple calculations take any number of values; name the columns past the precomputed ones as they come
+    for count in range(len(PARAMETER_COLUMNS) + 1, len(inputValues) + 1):
+        row["parameter_%d" % count] = inputValues[count - 1]
+
+    for count in range(len(INPUT_UNIT_SCALE_COLUMNS) + 1, len(inputUnitScales) + 1):
+        row["inputUnitScale_%d" % count] = inputUnitScales[count - 1]
+    row["calculation"] = job.get("calculation")
+    row["outputUnitScale"] = job.get("outputUnitScale")
+
+    return row
+
+
+def parseRequestHead(head):
+    """Splits the request line and headers of an HTTP request, lower-casing the header names"""
+
+    lines = head.decode("latin-1").split("\r\n")
+    method, path, version = lines[0].split(" ")
+    headers = {}
+
+    for line in lines[1:]:
+        if line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    return method, path, version, headers
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=0):
+    """Runs the server until interrupted"""
+
+    server = CalculationServer(workers=workers)
+
+    async def run():
+        listener = await server.start(host, port)
+        address = listener.sockets[0].getsockname()
+        print("Serving %d calculations on http://%s:%d (%d workers)" % (len(server.engine.catalog), address[0],
+                                                                       address[1], workers), file=sys.stderr)
+
+        async with listener:
+            await listener.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+    return 0
@@ -0,0 +1,256 @@
+"""Dialog solving a calculation for one of its inputs, given one or more target outputs.
+
+The unknown input's text box is disabled; the others hold the fixed inputs, as in the main window. Several targets,
+separated by commas, semicolons or spaces, are solved together with one Solver.solve call. A single solution is
+written into the unknown's text box, and every solution is listed with its target.
+"""
+
+import re
+
+import numpy as np
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QComboBox, QDialog, QLabel, QLineEdit, QPlainTextEdit, QPushButton
+
+from .parameterpanel import ParameterPanel
+from .units import get_SiblingScales, get_UnitScale
+
+TARGET_SEPARATORS = re.compile(r"[\s,;]+")
+
+
+def get_Targets(text):
+    """
+    Reads the target outputs typed in a box.
+
+    Input:
+        text [str] - Numbers separated by commas, semicolons or whitespace
+
+    Output:
+        targets [ndarray] - The numbers, in order
+    """
+
+    words = [word for word in TARGET_SEPARATORS.split(text.strip()) if word]
+
+    if not words:
+        raise ValueError("Enter a target output")
+
+    try:
+        return np.array([float(word) for word in words])
+    except ValueError:
+        raise ValueError("Every target must be a number") from None
+
+
+class SolveDialog(QDialog):
+    """Solves a calculation for the input that gives one or more target outputs"""
+
+    def __init__(self, solver, calculation, fontLabel, fontCombo, parent=None):
+        """
+        Inputs:
+            solver [Solver] - Solver of the main window, so later solves warm start from earlier ones
+
+            calculation [dict] - Catalog record of the calculation to solve
+
+            fontLabel [QFont] - Font of the parameter labels and text boxes
+
+            fontCombo [QFont] - Font of the unit combos
+
+            parent [QWidget] - The main window
+        """
+
+        super().__init__(parent)
+        self.solver = solver
+        self.calculation = calculation
+        self.plan = solver.engine.get_Plan(calculation["displayName"])
+        self.fontLabel = fontLabel
+        self.fontCombo = fontCombo
+
+        self.setObjectName("dlgSolve")
+        self.setWindowTitle("Solve For: %s" % calculation["displayName"])
+        self.setFixedSize(800, 560)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.init_UnknownControls()
+        self.init_ParameterControls()
+        self.init_TargetControls()
+        self.init_txtSolutions()
+        self.init_lblErrorDisplay()
+        self.cmbUnknown_Change(0)
+
+    def set_Inputs(self, inputTexts, unitIndexes, outputUnitScale):
+        """Starts from the inputs and unit selections of the main window"""
+
+        for row, inputText, unitIndex in zip(self.parameterPanel.rows, inputTexts, unitIndexes):
+            row.txtParameter.setText(inputText)
+            row.cmbUnitOptions.setCurrentIndex(unitIndex)
+
+        self.cmbTargetUnit.setCurrentText(outputUnitScale)
+        self.cmbUnknown_Change(self.cmbUnknown.currentIndex())
+
+        return
+
+    def get_FixedInputs(self, unknownIndex):
+        """Gets the value and unit scale of every input the solve passes, in catalog order"""
+
+        inputTexts = self.parameterPanel.get_InputTexts()
+        inputUnitScales = self.parameterPanel.get_InputUnitScales()
+
+        if self.plan.tupleMode:
+            # Pass the inputs up to the last one filled in, or up to the unknown
+            filled = [index for index, inputText in enumerate(inputTexts) if inputText]
+            inputCount = max(filled + [unknownIndex]) + 1
+        else:
+            inputCount = self.plan.arity
+
+        fixedValues = []
+
+        for index, row in enumerate(self.parameterPanel.rows[:inputCount]):
+            if index == unknownIndex:
+                fixedValues.append(0.0)
+                continue
+
+            try:
+                fixedValues.append(float(inputTexts[index].strip()))
+            except ValueError:
+                raise ValueError("%s must be a number" % row.parameterName) from None
+
+        return fixedValues, inputUnitScales[:inputCount]
+
+    def run_Solve(self):
+        self.lblErrorDisplay.hide()
+        unknownIndex = self.cmbUnknown.currentIndex()
+        unknownRow = self.parameterPanel.rows[unknownIndex]
+
+        try:
+            targets = get_Targets(self.txtTargets.text())
+            fixedValues, inputUnitScales = self.get_FixedInputs(unknownIndex)
+            solutions, errors, stats = self.solver.solve(self.plan.displayName, unknownIndex, targets, fixedValues,
+                                                         inputUnitScales, self.cmbTargetUnit.currentText())
+        except (ValueError, KeyError) as e:
+            self.set_lblErrorDisplay(str(e).strip("'\""))
+            return
+
+        unknownUnit = get_UnitScale(unknownRow.cmbUnitOptions.currentText()).abbreviation
+        targetUnit = get_UnitScale(self.cmbTargetUnit.currentText()).abbreviation
+        lines = ["%s (%s)\t%s (%s)" % (self.calculation["outputName"], targetUnit, unknownRow.parameterName,
+                                       unknownUnit)]
+
+        for index, (target, solution) in enumerate(zip(targets, solutions)):
+            lines.append("%.10g\t%s" % (target, errors[index] if index in errors else "%.10g" % solution))
+
+        self.txtSolutions.setPlainText("\n".join(lines))
+        unknownRow.txtParameter.setText("%.10g" % solutions[0] if len(targets) == 1 and not errors else "")
+        self.lblSummary.setText(str(stats))
+
+        if errors:
+            self.set_lblErrorDisplay("%s (first unsolved target)" % errors[min(errors)])
+
+        return
+
+    def set_lblErrorDisplay(self, message):
+        self.lblErrorDisplay.setText("ERROR: %s" % message)
+        self.lblErrorDisplay.show()
+
+        return
+
+    # ==============
+    # EVENT HANDLERS
+    # ==============
+    def cmbUnknown_Change(self, index):
+        # The unknown input is what the solve finds, so its text box only shows the solution
+        for rowIndex, row in enumerate(self.parameterPanel.rows[:self.parameterPanel.parameterCount]):
+            row.txtParameter.setEnabled(rowIndex != index)
+            row.txtParameter.setPlaceholderText("Solved" if rowIndex == index else "")
+
+            if rowIndex == index:
+                row.txtParameter.clear()
+
+        return
+
+    def cmdSolve_Click(self):
+        self.run_Solve()
+
+        return
+
+    # ======================
+    # INITIALIZATION METHODS
+    # ======================
+    def init_UnknownControls(self):
+        lblCalculation = QLabel(self.calculation["displayName"])
+        lblCalculation.setParent(self)
+        lblCalculation.setGeometry(10, 10, 780, 25)
+        lblCalculation.setFont(self.fontLabel)
+
+        lblUnknown = QLabel("Solve for:")
+        lblUnknown.setParent(self)
+        lblUnknown.setGeometry(10, 45, 90, 25)
+
+        self.cmbUnknown = QComboBox()
+        self.cmbUnknown.setParent(self)
+        self.cmbUnknown.setGeometry(100, 45, 355, 25)
+        self.cmbUnknown.setToolTip("Select the input to solve for")
+        self.cmbUnknown.addItems([self.calculation["parameters"]["parameter_%d" % count]
+                                  for count in range(1, len(self.calculation["parameters"]) // 2 + 1)])
+        self.cmbUnknown.currentIndexChanged.connect(self.cmbUnknown_Change)
+
+        return
+
+    def init_ParameterControls(self):
+        self.parameterPanel = ParameterPanel(self.fontLabel, self.fontCombo, self)
+        self.parameterPanel.setGeometry(10, 85, 445, 210)
+        self.parameterPanel.set_Parameters(self.calculation["parameters"])
+
+        return
+
+    def init_TargetControls(self):
+        lblTargets = QLabel("Target:")
+        lblTargets.setParent(self)
+        lblTargets.setGeometry(470, 45, 90, 25)
+
+        self.txtTargets = QLineEdit()
+        self.txtTargets.setParent(self)
+        self.txtTargets.setGeometry(560, 45, 230, 25)
+        self.txtTargets.setAlignment(Qt.AlignRight)
+        self.txtTargets.setToolTip("Wanted output. Several, separated by commas or spaces, are solved together.")
+        self.txtTargets.returnPressed.connect(self.cmdSolve_Click)
+
+        lblTargetUnit = QLabel("Unit:")
+        lblTargetUnit.setParent(self)
+        lblTargetUnit.setGeometry(470, 80, 90, 25)
+
+        self.cmbTargetUnit = QComboBox()
+        self.cmbTargetUnit.setParent(self)
+        self.cmbTargetUnit.setGeometry(560, 80, 230, 25)
+        self.cmbTargetUnit.addItems(get_SiblingScales(self.calculation["outputUnitScale"]))
+        self.cmbTargetUnit.setToolTip("Select the unit scale of the targets")
+
+        self.cmdSolve = QPushButton("Solve")
+        self.cmdSolve.setParent(self)
+        self.cmdSolve.setGeometry(470, 120, 155, 40)
+        self.cmdSolve.clicked.connect(self.cmdSolve_Click)
+
+        self.lblSummary = QLabel()
+        self.lblSummary.setParent(self)
+        self.lblSummary.setGeometry(470, 170, 320, 125)
+        self.lblSummary.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.lblSummary.setWordWrap(True)
+
+        return
+
+    def init_txtSolutions(self):
+        self.txtSolutions = QPlainTextEdit()
+        self.txtSolutions.setObjectName("txtSolutions")
+        self.txtSolutions.setParent(self)
+        self.txtSolutions.setGeometry(10, 305, 780, 200)
+        self.txtSolutions.setReadOnly(True)
+        self.txtSolutions.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.txtSolutions.setTabStopDistance(240)  # Lines up the solutions past the longest target column title
+
+        return
+
+    def init_lblErrorDisplay(self):
+        self.lblErrorDisplay = QLabel()
+        self.lblErrorDisplay.setObjectName("lblErrorDisplay")
+        self.lblErrorDisplay.setParent(self)
+        self.lblErrorDisplay.setGeometry(10, 512, 780, 40)
+        self.lblErrorDisplay.setWordWrap(True)
+        self.lblErrorDisplay.hide()
+
+        return
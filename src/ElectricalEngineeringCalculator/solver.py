@@ -0,0 +1,446 @@
+"""Reverse solving: finds the value of one input of a calculation that gives a target output.
+
+Solving calculation f for input k treats it as g(x) = f(..., x, ...) - target and finds a root of g with Brent's
+method, which keeps the root bracketed and steps by inverse quadratic interpolation or the secant wherever that
+converges faster than bisecting. Every input in the catalog is a positive quantity, so the unknown is searched among
+positive values, in ln x rather than x: a picofarad then takes as many steps as a farad, and the tolerance is
+relative to the solution.
+
+Each target starts from a guess, and the search walks away from it on both sides, doubling its step in ln x, until g
+changes sign between two points. Every step of that search and of Brent's method evaluates all the targets still
+unsolved with one calculateBatch call, so solving a thousand targets takes about as many calls as solving one.
+
+A Solver remembers its recent solutions for each calculation, unknown and set of fixed inputs. A target solved before
+starts from the final bracket of that solve, which one evaluation of each end confirms. Any other target starts from
+the solution of the nearest target solved before, with a narrow first bracket. Without history the guess is 1 in the
+unit scale of the unknown.
+"""
+
+import math
+import time
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from .batch import calculateBatch
+
+RELATIVE_TOLERANCE = 1e-12  # Final bracket width in ln x, i.e. relative to the solution
+RESIDUAL_TOLERANCE = 1e-6  # Share of the target a solution may miss it by; more means g jumps across zero there
+MAX_ITERATIONS = 100  # Brent iterations before a target is given up
+COLD_STEP = math.log(10.0)  # Half width in ln x of the first bracket around a guess without history: a decade
+WARM_STEP = math.log(1.5)  # Half width in ln x of the first bracket around the solution of a nearby target
+MAX_HALF_WIDTH = 64 * math.log(10.0)  # Farthest the search goes from the guess, 64 decades on each side
+MIN_STEP = RELATIVE_TOLERANCE  # Smallest step in ln x taken towards points where the calculation fails
+LN_LIMIT = 700.0  # Bound on ln x, within the range of float64
+
+HISTORY_SIZE = 64  # Calculation, unknown and fixed input combinations a Solver remembers solutions for
+HISTORY_TARGETS = 4096  # Most recent targets remembered per combination
+
+
+class SolveStats(namedtuple("SolveStats", ["targets", "solved", "warmStarts", "bracketHits", "iterations",
+                                           "maxIterations", "evaluations", "seconds"])):
+    """Convergence counters of one Solver.solve call"""
+
+    __slots__ = ()
+
+    @property
+    def meanIterations(self):
+        return self.iterations / self.solved if self.solved else 0.0
+
+    def __str__(self):
+        return ("%d of %d targets solved in %.2f ms, %.1f Brent iterations per target (at most %d), "
+                "%d evaluation calls, %d warm starts, %d bracket cache hits") % (
+            self.solved, self.targets, self.seconds * 1000, self.meanIterations, self.maxIterations,
+            self.evaluations, self.warmStarts, self.bracketHits)
+
+
+class _History:
+    """Solved targets of one calculation, unknown and set of fixed inputs, oldest first"""
+
+    __slots__ = ("targets", "solutions", "lows", "highs")
+
+    def __init__(self):
+        self.targets = np.empty(0)
+        self.solutions = np.empty(0)  # ln of each solution
+        self.lows = np.empty(0)  # ln x bracket each solution converged in
+        self.highs = np.empty(0)
+
+    def add(self, targets, solutions, lows, highs):
+        """Appends solutions, replacing any earlier solution of the same target, and drops the oldest beyond
+        HISTORY_TARGETS"""
+
+        keep = ~np.isin(self.targets, targets)
+        self.targets = np.concatenate((self.targets[keep], targets))[-HISTORY_TARGETS:]
+        self.solutions = np.concatenate((self.solutions[keep], solutions))[-HISTORY_TARGETS:]
+        self.lows = np.concatenate((self.lows[keep], lows))[-HISTORY_TARGETS:]
+        self.highs = np.concatenate((self.highs[keep], highs))[-HISTORY_TARGETS:]
+
+    def get_Nearest(self, targets):
+        """
+        Finds the remembered target nearest to each of targets.
+
+        Output:
+            nearest [ndarray] - Index into the history of each target's nearest, or -1 when the history is empty
+
+            exact [ndarray] - True where the nearest is the target itself
+        """
+
+        if not len(self.targets):
+            return np.full(len(targets), -1), np.zeros(len(targets), dtype=bool)
+
+        order = np.argsort(self.targets, kind="stable")
+        sortedTargets = self.targets[order]
+        above = np.clip(np.searchsorted(sortedTargets, targets), 1, len(sortedTargets) - 1)
+        below = above - 1
+
+        if len(sortedTargets) == 1:
+            nearest = np.zeros(len(targets), dtype=np.intp)
+        else:
+            nearest = np.where(np.abs(sortedTargets[above] - targets) < np.abs(targets - sortedTargets[below]),
+                               above, below)
+
+        nearest = order[nearest]
+
+        return nearest, self.targets[nearest] == targets
+
+
+class Solver:
+    """Solves calculations for any of their inputs, warm starting from the solutions it has found before"""
+
+    def __init__(self, engine):
+        """
+        Input:
+            engine [CalculationEngine] - Engine holding the precompiled call plans
+        """
+
+        self.engine = engine
+        self.histories = OrderedDict()  # (methodName, unknownIndex, unit scales, fixed values) -> _History
+
+    def solve(self, name, unknownIndex, targets, fixedValues, inputUnitScales=None, outputUnitScale=None):
+        """
+        Finds, for each target, the value of one input that makes the calculation give that target.
+
+        Inputs:
+            name [str] - displayName or methodName of the calculation
+
+            unknownIndex [int] - Position of the input to solve for, from 0
+
+            targets [array] - Wanted outputs, in outputUnitScale. Any shape.
+
+            fixedValues [sequence] - Value of every input, in catalog order, as for calculateBatch. The value at
+                                     unknownIndex is ignored. The others may be scalars or arrays that broadcast
+                                     with targets.
+
+            inputUnitScales [sequence] - Unit scale of each input, including that of the solutions. Defaults to the
+                                         catalog scales.
+
+            outputUnitScale [str] - Unit scale of the targets. Defaults to the catalog scale.
+
+        Output:
+            solutions [ndarray] - float64 values of the unknown input, in the shape of the targets broadcast with
+                                  the fixed inputs. NaN where none was found.
+
+            errors [dict] - Reason for each target without a solution, keyed by its flat index into solutions
+
+            stats [SolveStats] - Convergence counters and the time taken
+        """
+
+        start = time.perf_counter()
+        plan = self.engine.get_Plan(name)
+        self.engine.check_InputCount(plan, len(fixedValues))
+
+        if not 0 <= unknownIndex < len(fixedValues):
+            raise ValueError("%s has no input %d to solve for" % (plan.methodName, unknownIndex + 1))
+
+        targets = np.asarray(targets, dtype=np.float64)
+        arrays = np.broadcast_arrays(targets, *[np.asarray(0.0 if index == unknownIndex else value, dtype=np.float64)
+                                                for index, value in enumerate(fixedValues)])
+        shape = arrays[0].shape
+        flatTargets = arrays[0].reshape(-1)
+        fixedColumns = [array.reshape(-1) for array in arrays[1:]]
+        count = len(flatTargets)
+        evaluations = [0]
+
+        def evaluate(indexes, u):
+            """g at ln x = u for the targets at indexes, NaN where the calculation fails"""
+
+            if not len(indexes):
+                return np.empty(0)
+
+            inputValues = [column[indexes] for column in fixedColumns]
+            inputValues[unknownIndex] = np.exp(u)
+            evaluations[0] += 1
+
+            with np.errstate(all="ignore"):
+                results = calculateBatch(self.engine, plan.displayName, inputValues, inputUnitScales,
+                                         outputUnitScale)[0]
+
+            return results - flatTargets[indexes]
+
+        solutions = np.full(count, np.nan)
+        lows = np.full(count, np.nan)
+        highs = np.full(count, np.nan)
+        iterations = np.zeros(count, dtype=np.intp)
+        errors = {}
+
+        finite = np.isfinite(flatTargets)
+
+        for index in np.flatnonzero(~finite).tolist():
+            errors[index] = "The target is not a finite number"
+
+        # Guesses, from the history when the fixed inputs are the same for every target
+        history = None
+        guesses = np.zeros(count)
+        steps = np.full(count, COLD_STEP)
+        exact = np.zeros(count, dtype=bool)
+        warm = np.zeros(count, dtype=bool)
+
+        if all(np.ndim(value) == 0 for index, value in enumerate(fixedValues) if index != unknownIndex):
+            history = self.get_History(plan, unknownIndex, fixedValues, inputUnitScales, outputUnitScale)
+            nearest, exact = history.get_Nearest(flatTargets)
+            exact &= finite
+            warm = (nearest >= 0) & finite
+            guesses[warm] = history.solutions[nearest[warm]]
+            steps[warm] = WARM_STEP
+
+        lowValues = np.full(count, np.nan)
+        highValues = np.full(count, np.nan)
+
+        # Targets solved before start from their final bracket, if it still holds the root
+        if exact.any():
+            indexes = np.flatnonzero(exact)
+            lows[indexes] = history.lows[nearest[indexes]]
+            highs[indexes] = history.highs[nearest[indexes]]
+            values = evaluate(np.concatenate((indexes, indexes)), np.concatenate((lows[indexes], highs[indexes])))
+            lowValues[indexes] = values[:len(indexes)]
+            highValues[indexes] = values[len(indexes):]
+
+        bracketHits = int(np.count_nonzero(exact & is_Bracketed(lowValues, highValues)))
+        self.find_Brackets(evaluate, np.flatnonzero(finite & ~is_Bracketed(lowValues, highValues)), guesses, steps,
+                           lows, highs, lowValues, highValues)
+
+        bracketed = finite & is_Bracketed(lowValues, highValues)
+
+        for index in np.flatnonzero(finite & ~bracketed).tolist():
+            errors[index] = "No value from %.6g to %.6g gives the target" % (math.exp(lows[index]),
+                                                                               math.exp(highs[index]))
+
+        indexes = np.flatnonzero(bracketed)
+        self.brent(evaluate, indexes, flatTargets, lows, highs, lowValues, highValues, solutions, iterations, errors)
+
+        solved = np.isfinite(solutions)
+
+        if history is not None and solved.any():
+            history.add(flatTargets[solved], solutions[solved], lows[solved], highs[solved])
+
+        stats = SolveStats(count, int(np.count_nonzero(solved)), int(np.count_nonzero(warm & ~exact)), bracketHits,
+                           int(iterations[solved].sum()), int(iterations.max()) if count else 0,
+                           evaluations[0], time.perf_counter() - start)
+
+        with np.errstate(over="ignore"):
+            solutions = np.exp(solutions)
+
+        return solutions.reshape(shape), errors, stats
+
+    def get_History(self, plan, unknownIndex, fixedValues, inputUnitScales, outputUnitScale):
+        """The _History of solutions for these fixed inputs and unit scales, made when there is none yet"""
+
+        key = (plan.methodName, unknownIndex, tuple(inputUnitScales or plan.inputUnitScales),
+               outputUnitScale or plan.outputUnitScale,
+               tuple(float(value) for index, value in enumerate(fixedValues) if index != unknownIndex))
+        history = self.histories.get(key)
+
+        if history is None:
+            history = self.histories[key] = _History()
+
+            if len(self.histories) > HISTORY_SIZE:
+                self.histories.popitem(last=False)
+        else:
+            self.histories.move_to_end(key)
+
+        return history
+
+    @staticmethod
+    def find_Brackets(evaluate, indexes, guesses, steps, lows, highs, lowValues, highValues):
+        """
+        Walks away from the guess of each target at indexes on both sides, doubling the step each time, until g
+        changes sign between two points on a side. Points where the calculation fails, such as the square root of a
+        negative number, bound the range where a root can be:
+        - A side that reaches them from a point where the calculation works closes in on them, halving its step.
+        - When the guess itself fails, the first side to find a working point turns back towards the guess from
+          there, closing in, and the other side takes over walking outwards from the same point.
+        Writes each bracket found, or else the range searched, into the arrays in place.
+        """
+
+        count = len(indexes)
+
+        if not count:
+            return
+
+        # Low sides then high sides, each walking from the last point it evaluated that did not fail
+        owners = np.concatenate((np.arange(count), np.arange(count)))
+        others = np.concatenate((np.arange(count, 2 * count), np.arange(count)))  # The other side of the target
+        directions = np.repeat((-1.0, 1.0), count)
+        origins = guesses[indexes][owners]
+        inner = origins.copy()
+        steps = steps[indexes][owners]
+        probes = np.clip(inner + directions * steps, -LN_LIMIT, LN_LIMIT)
+        values = evaluate(indexes[np.concatenate((np.arange(count), owners))], np.concatenate((inner[:count], probes)))
+        innerValues = values[:count][owners]
+        probeValues = values[count:]
+        bounded = np.zeros(2 * count, dtype=bool)  # The side is closing in on points where the calculation fails
+        active = np.ones(2 * count, dtype=bool)
+        searchedLows = np.minimum(inner, probes)  # Range each side has evaluated, for the error message
+        searchedHighs = np.maximum(inner, probes)
+
+        while True:
+            with np.errstate(invalid="ignore"):
+                found = active & (probeValues * innerValues <= 0)
+
+            found[count:] &= ~found[:count]  # The low side wins when both sides of a target find a bracket
+
+            if found.any():
+                sides = np.flatnonzero(found)
+                targets = indexes[owners[sides]]
+                lowFirst = probes[sides] < inner[sides]
+                lows[targets] = np.where(lowFirst, probes[sides], inner[sides])
+                highs[targets] = np.where(lowFirst, inner[sides], probes[sides])
+                lowValues[targets] = np.where(lowFirst, probeValues[sides], innerValues[sides])
+                highValues[targets] = np.where(lowFirst, innerValues[sides], probeValues[sides])
+                active[sides] = False
+                active[others[sides]] = False
+
+            failed = active & ~np.isfinite(probeValues)
+            moved = active & ~failed
+            bounded |= failed & np.isfinite(innerValues)
+
+            # The first point that works after a failed guess: this side turns back, the other walks on
+            turned = moved & ~np.isfinite(innerValues)
+            turned[count:] &= ~turned[:count]
+            turnedSides = np.flatnonzero(turned)
+            otherSides = others[turnedSides]
+            inner[otherSides] = probes[turnedSides]
+            innerValues[otherSides] = probeValues[turnedSides]
+            directions[otherSides] = directions[turnedSides]
+            steps[otherSides] = steps[turnedSides]
+            bounded[otherSides] = False
+            active[otherSides] = True
+            directions[turnedSides] *= -1
+            steps[turnedSides] /= 2
+            bounded[turnedSides] = True
+            moved[otherSides] = False
+            failed[otherSides] = False
+
+            inner[moved] = probes[moved]
+            innerValues[moved] = probeValues[moved]
+            steps = np.where(bounded, np.where(failed, steps / 2, steps), steps * 2)
+
+            nextProbes = np.clip(inner + directions * steps, -LN_LIMIT, LN_LIMIT)
+            active &= np.where(bounded, steps >= MIN_STEP,
+                               (np.abs(nextProbes - origins) <= MAX_HALF_WIDTH) & (nextProbes != inner))
+
+            if not active.any():
+                break
+
+            sides = np.flatnonzero(active)
+            probes[sides] = nextProbes[sides]
+            searchedLows[sides] = np.minimum(searchedLows[sides], probes[sides])
+            searchedHighs[sides] = np.maximum(searchedHighs[sides], probes[sides])
+            probeValues[:] = np.nan
+            probeValues[sides] = evaluate(indexes[owners[sides]], probes[sides])
+
+        unsolved = ~is_Bracketed(lowValues[indexes], highValues[indexes])
+        lows[indexes[unsolved]] = np.minimum(searchedLows[:count], searchedLows[count:])[unsolved]
+        highs[indexes[unsolved]] = np.maximum(searchedHighs[:count], searchedHighs[count:])[unsolved]
+
+    @staticmethod
+    def brent(evaluate, indexes, targets, lows, highs, lowValues, highValues, solutions, iterations, errors):
+        """
+        Brent's method on the bracketed targets at indexes, all at once: the steps of scipy's brentq, taken with
+        array operations. Writes each solution, its final bracket and its iteration count in place, and the reason
+        into errors for each target that fails.
+        """
+
+        xpre, xcur = lows[indexes], highs[indexes]
+        fpre, fcur = lowValues[indexes], highValues[indexes]
+        xblk = np.zeros(len(indexes))
+        fblk = np.zeros(len(indexes))
+        spre = np.zeros(len(indexes))
+        scur = np.zeros(len(indexes))
+        scale = np.maximum(np.abs(targets[indexes]), np.minimum(np.abs(fpre), np.abs(fcur)))
+
+        # An end where g is 0 is the solution already
+        onLow = fpre == 0
+        xcur = np.where(onLow, xpre, xcur)
+        fcur = np.where(onLow, fpre, fcur)
+
+        for iteration in range(MAX_ITERATIONS + 1):
+            with np.errstate(all="ignore"):
+                flip = fpre * fcur < 0
+                xblk = np.where(flip, xpre, xblk)
+                fblk = np.where(flip, fpre, fblk)
+                spre = np.where(flip, xcur - xpre, spre)
+                scur = np.where(flip, xcur - xpre, scur)
+
+                swap = np.abs(fblk) < np.abs(fcur)
+                xpre, xcur, xblk = np.where(swap, xcur, xpre), np.where(swap, xblk, xcur), np.where(swap, xcur, xblk)
+                fpre, fcur, fblk = np.where(swap, fcur, fpre), np.where(swap, fblk, fcur), np.where(swap, fcur, fblk)
+
+                delta = (RELATIVE_TOLERANCE + 4 * np.finfo(np.float64).eps * np.abs(xcur)) / 2
+                sbis = (xblk - xcur) / 2
+                done = (fcur == 0) | (np.abs(sbis) < delta)
+                failed = ~np.isfinite(fcur) | (~done & (iteration == MAX_ITERATIONS))
+
+            finished = done | failed
+
+            if finished.any():
+                finishedIndexes = indexes[finished]
+                converged = done[finished] & (np.abs(fcur[finished]) <= RESIDUAL_TOLERANCE * scale[finished])
+                solutions[finishedIndexes[converged]] = xcur[finished][converged]
+                lows[finishedIndexes] = np.minimum(xcur, xblk)[finished]
+                highs[finishedIndexes] = np.maximum(xcur, xblk)[finished]
+                iterations[finishedIndexes] = iteration
+
+                for index, isDone, value, x in zip(finishedIndexes[~converged].tolist(),
+                                                   done[finished][~converged].tolist(),
+                                                   fcur[finished][~converged].tolist(),
+                                                   xcur[finished][~converged].tolist()):
+                    if isDone:
+                        errors[index] = "The output steps over the target at %.6g without reaching it" % math.exp(x)
+                    elif value != value:
+                        errors[index] = "The calculation fails at %.6g, within the bracket" % math.exp(x)
+                    else:
+                        errors[index] = "Did not converge in %d iterations" % MAX_ITERATIONS
+
+                keep = ~finished
+                indexes, xpre, xcur, xblk = indexes[keep], xpre[keep], xcur[keep], xblk[keep]
+                fpre, fcur, fblk = fpre[keep], fcur[keep], fblk[keep]
+                spre, scur, sbis, delta, scale = spre[keep], scur[keep], sbis[keep], delta[keep], scale[keep]
+
+            if not len(indexes):
+                break
+
+            with np.errstate(all="ignore"):
+                # Inverse quadratic interpolation, or the secant when only two points are known
+                secant = xpre == xblk
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = np.where(secant, -fcur * (xcur - xpre) / (fcur - fpre),
+                                -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre)))
+
+                # Take the interpolated step only while it shrinks fast enough, else bisect
+                interpolate = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre))
+                good = interpolate & (2 * np.abs(stry) < np.minimum(np.abs(spre), 3 * np.abs(sbis) - delta))
+                spre = np.where(good, scur, sbis)
+                scur = np.where(good, stry, sbis)
+
+            xpre, fpre = xcur, fcur
+            xcur = xcur + np.where(np.abs(scur) > delta, scur, np.where(sbis > 0, delta, -delta))
+            fcur = evaluate(indexes, xcur)
+
+
+def is_Bracketed(lowValues, highValues):
+    """True where g has opposite signs, or is 0, at the two ends of a bracket"""
+
+    with np.errstate(invalid="ignore"):
+        return lowValues * highValues <= 0
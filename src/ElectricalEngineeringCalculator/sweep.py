@@ -0,0 +1,555 @@
+"""Parameter sweeps: one input of a calculation stepped over a range while the other inputs stay fixed.
+
+The whole range is evaluated with a single calculateBatch call, so most calculations sweep at NumPy speed. The
+SweepDialog plots the results with PlotWidget, a QPainter plot. A sweep can hold far more points than the plot has
+pixel columns, so the plot draws the minimum and maximum of the points falling in each column rather than every
+point. That looks the same as drawing every point and keeps painting time independent of the sweep size. The dialog
+keeps each sweep in a ResultStore, which the plot and the CSV or Arrow export read without copying.
+"""
+
+import math
+import time
+
+import numpy as np
+from PyQt5.QtCore import QPointF, QRectF, Qt
+from PyQt5.QtGui import QColor, QPainter, QPen, QPolygonF
+from PyQt5.QtWidgets import QCheckBox, QComboBox, QDialog, QFileDialog, QLabel, QLineEdit, QPushButton, QWidget
+
+from .batch import calculateBatch
+from .parameterpanel import ParameterPanel
+from .resultstore import ResultStore
+from .units import get_SiblingScales
+
+MAX_SWEEP_POINTS = 10000000
+PLOT_MARGINS = (90, 15, 25, 45)  # left, top, right, bottom space around the plot area for the axis labels
+TICK_COUNT = 5  # Roughly how many labelled ticks each linear axis gets
+
+
+def get_SweepValues(start, stop, step, logarithmic=False):
+    """
+    Gets the values a swept input takes, from start to stop inclusive.
+
+    Inputs:
+        start [float] - First value
+
+        stop [float] - Last value. It may be below start, to sweep downwards.
+
+        step [float] - Distance between successive values, or for a logarithmic sweep the number of values per decade
+
+        logarithmic [bool] - Spaces the values evenly on a logarithmic scale
+
+    Output:
+        values [ndarray] - float64 values in sweep order
+    """
+
+    if logarithmic:
+        if start <= 0 or stop <= 0:
+            raise ValueError("A logarithmic sweep needs a start and stop above zero")
+
+        if step <= 0:
+            raise ValueError("The points per decade must be above zero")
+
+        count = int(math.ceil(abs(math.log10(stop / start)) * step - 1e-9)) + 1
+    else:
+        if step <= 0:
+            raise ValueError("The step must be above zero")
+
+        count = int(math.floor(abs(stop - start) / step + 1e-9)) + 1
+
+    if count > MAX_SWEEP_POINTS:
+        raise ValueError("The sweep would have %d points; the most is %d" % (count, MAX_SWEEP_POINTS))
+
+    if logarithmic:
+        return np.geomspace(start, stop, count)
+
+    return start + np.arange(count) * math.copysign(step, stop - start)
+
+
+def calculateSweep(engine, name, sweepIndex, sweepValues, fixedValues, inputUnitScales=None, outputUnitScale=None):
+    """
+    Evaluates a calculation for every value of one swept input, in one batch.
+
+    Inputs:
+        engine [CalculationEngine] - Engine holding the precompiled call plans
+
+        name [str] - displayName or methodName of the calculation
+
+        sweepIndex [int] - Position of the swept input, from 0
+
+        sweepValues [ndarray] - Values of the swept input, e.g. from get_SweepValues
+
+        fixedValues [sequence] - Value of every input, in catalog order. The value at sweepIndex is ignored.
+
+        inputUnitScales [sequence] - Unit scale of each input. Defaults to the catalog scales.
+
+        outputUnitScale [str] - Unit scale of the results. Defaults to the catalog scale.
+
+    Output:
+        results [ndarray] - One result per swept value, NaN where the calculation failed
+
+        errors [dict] - Error message for each failed point, keyed by its index
+    """
+
+    inputValues = list(fixedValues)
+    inputValues[sweepIndex] = sweepValues
+
+    return calculateBatch(engine, name, inputValues, inputUnitScales, outputUnitScale)
+
+
+def downsampleMinMax(x, y, buckets):
+    """
+    Reduces a series to the lowest and highest y of each of a number of equal runs of points, keeping the order in
+    which they are reached, so a line through the result covers the same pixels as a line through every point.
+
+    Inputs:
+        x [ndarray] - x of each point, in drawing order
+
+        y [ndarray] - y of each point, NaN for gaps. A run of only NaN stays a gap.
+
+        buckets [int] - Number of runs, normally the plot width in pixels
+
+    Output:
+        x, y [ndarray] - At most 2 * buckets points, or the input when it is no longer than that
+    """
+
+    count = len(y)
+
+    if count <= buckets * 2:
+        return x, y
+
+    starts = np.arange(buckets) * count // buckets
+    ends = np.append(starts[1:], count) - 1
+    lows = np.fmin.reduceat(y, starts)
+    highs = np.fmax.reduceat(y, starts)
+    rising = y[ends] >= y[starts]
+
+    xs = np.column_stack((x[starts], x[ends])).ravel()
+    ys = np.column_stack((np.where(rising, lows, highs), np.where(rising, highs, lows))).ravel()
+
+    return xs, ys
+
+
+def get_Ticks(low, high, logarithmic=False):
+    """Returns the values to label along an axis spanning low to high: decades on a log axis, else 1, 2 or 5 steps"""
+
+    if logarithmic and high / low >= 10:
+        return [10.0 ** exponent for exponent in range(math.ceil(math.log10(low) - 1e-9),
+                                                        math.floor(math.log10(high) + 1e-9) + 1)]
+
+    rawStep = (high - low) / TICK_COUNT
+    magnitude = 10.0 ** math.floor(math.log10(rawStep))
+    step = next(multiple * magnitude for multiple in (1, 2, 5, 10) if multiple * magnitude >= rawStep)
+
+    return [index * step for index in range(math.ceil(low / step - 1e-9), math.floor(high / step + 1e-9) + 1)]
+
+
+class PlotWidget(QWidget):
+    """Line plot of one sweep, drawn with QPainter from a per-pixel-column min/max reduction of the points"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sweepValues = None
+        self.results = None
+        self.logarithmic = False
+        self.xLabel = ""
+        self.yLabel = ""
+        self.xRange = (0.0, 1.0)
+        self.yRange = (0.0, 1.0)
+        self.polylines = None  # QPolygonFs of the current series in widget coordinates, made when first painted
+        self.polylinesSize = None  # Widget size the polylines were made for
+        self.paintSeconds = 0.0  # Duration of the latest paintEvent
+
+    def set_Series(self, sweepValues, results, logarithmic, xLabel, yLabel):
+        """
+        Plots a sweep, replacing the previous one.
+
+        Inputs:
+            sweepValues [ndarray] - x of each point, in sweep order
+
+            results [ndarray] - y of each point, NaN where there is none
+
+            logarithmic [bool] - Draws the x axis on a logarithmic scale
+
+            xLabel, yLabel [str] - Axis titles
+        """
+
+        self.sweepValues = sweepValues
+        self.results = results
+        self.logarithmic = logarithmic
+        self.xLabel = xLabel
+        self.yLabel = yLabel
+        self.xRange = self.get_Range(sweepValues)
+        self.yRange = self.get_Range(results[np.isfinite(results)])
+        self.polylines = None
+        self.update()
+
+    def clear_Series(self):
+        self.sweepValues = None
+        self.results = None
+        self.polylines = None
+        self.update()
+
+    @staticmethod
+    def get_Range(values):
+        """Returns the lowest and highest value, widened when they are equal so the axis has a span"""
+
+        if len(values) == 0:
+            return 0.0, 1.0
+
+        low = float(values.min())
+        high = float(values.max())
+
+        if low == high:
+            margin = abs(low) * 0.5 or 1.0
+            low, high = low - margin, high + margin
+
+        return low, high
+
+    def get_PlotRect(self):
+        left, top, right, bottom = PLOT_MARGINS
+
+        return QRectF(left, top, self.width() - left - right, self.height() - top - bottom)
+
+    def map_X(self, values, rect):
+        low, high = self.xRange
+
+        if self.logarithmic:
+            values, low, high = np.log10(values), math.log10(low), math.log10(high)
+
+        return rect.left() + (values - low) / (high - low) * rect.width()
+
+    def map_Y(self, values, rect):
+        low, high = self.yRange
+
+        return rect.bottom() - (values - low) / (high - low) * rect.height()
+
+    def get_Polylines(self, rect):
+        """Converts the series to one QPolygonF per run of finite points, at most two points per pixel column"""
+
+        xs, ys = downsampleMinMax(self.sweepValues, self.results, max(int(rect.width()), 1))
+        xs = self.map_X(xs, rect)
+        ys = self.map_Y(ys, rect)
+        finite = np.isfinite(ys)
+        polylines = []
+
+        # Each run of finite points becomes one polyline; NaN results leave gaps
+        boundaries = np.flatnonzero(np.diff(finite)) + 1
+
+        for run in np.split(np.arange(len(ys)), boundaries):
+            if len(run) and finite[run[0]]:
+                polylines.append(QPolygonF([QPointF(x, y) for x, y in zip(xs[run].tolist(), ys[run].tolist())]))
+
+        return polylines
+
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#3D3D3D"))
+        rect = self.get_PlotRect()
+
+        if self.sweepValues is not None and rect.width() > 0 and rect.height() > 0:
+            self.draw_Axes(painter, rect)
+
+            if self.polylines is None or self.polylinesSize != self.size():
+                self.polylines = self.get_Polylines(rect)
+                self.polylinesSize = self.size()
+
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(QColor("orange"), 1.5))
+
+            for polyline in self.polylines:
+                painter.drawPolyline(polyline)
+
+        painter.end()
+        self.paintSeconds = time.perf_counter() - start
+
+    def draw_Axes(self, painter, rect):
+        """Draws the frame, the grid lines at the ticks, the tick labels and the axis titles"""
+
+        gridPen = QPen(QColor("#555555"), 1)
+        textPen = QPen(QColor("#14BC57"))
+        metrics = painter.fontMetrics()
+
+        for tick in get_Ticks(*self.xRange, self.logarithmic):
+            x = float(self.map_X(tick, rect))
+            painter.setPen(gridPen)
+            painter.drawLine(QPointF(x, rect.top()), QPointF(x, rect.bottom()))
+            painter.setPen(textPen)
+            label = "%.4g" % tick
+            left = min(max(x - metrics.width(label) / 2, 0), self.width() - metrics.width(label))
+            painter.drawText(QPointF(left, rect.bottom() + metrics.height()), label)
+
+        for tick in get_Ticks(*self.yRange):
+            y = float(self.map_Y(tick, rect))
+            painter.setPen(gridPen)
+            painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
+            painter.setPen(textPen)
+            label = "%.4g" % tick
+            painter.drawText(QPointF(rect.left() - metrics.width(label) - 5, y + metrics.ascent() / 2), label)
+
+        painter.setPen(QPen(QColor("#212121"), 1))
+        painter.drawRect(rect)
+        painter.setPen(textPen)
+        painter.drawText(QRectF(rect.left(), rect.bottom() + metrics.height() + 5, rect.width(), metrics.height()),
+                         Qt.AlignHCenter, self.xLabel)
+        painter.save()
+        painter.translate(metrics.height(), rect.center().y())
+        painter.rotate(-90)
+        painter.drawText(QRectF(-rect.height() / 2, -metrics.height(), rect.height(), metrics.height()),
+                         Qt.AlignHCenter, self.yLabel)
+        painter.restore()
+
+
+class SweepDialog(QDialog):
+    """Sweeps one input of a calculation over a range, plots the results and exports them to CSV"""
+
+    def __init__(self, engine, calculation, fontLabel, fontCombo, parent=None):
+        """
+        Inputs:
+            engine [CalculationEngine] - Engine holding the precompiled call plans
+
+            calculation [dict] - Catalog record of the calculation to sweep
+
+            fontLabel [QFont] - Font of the parameter labels and text boxes
+
+            fontCombo [QFont] - Font of the unit combos
+
+            parent [QWidget] - The main window
+        """
+
+        super().__init__(parent)
+        self.engine = engine
+        self.calculation = calculation
+        self.plan = engine.get_Plan(calculation["displayName"])
+        self.fontLabel = fontLabel
+        self.fontCombo = fontCombo
+        self.store = None  # ResultStore of the latest sweep: the swept input, then the output, with their units
+
+        self.setObjectName("dlgSweep")
+        self.setWindowTitle("Sweep: %s" % calculation["displayName"])
+        self.setFixedSize(800, 720)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.init_SweepControls()
+        self.init_ParameterControls()
+        self.init_OutputControls()
+        self.init_plot()
+        self.init_lblErrorDisplay()
+        self.cmbSweepParameter_Change(0)
+
+    def set_Inputs(self, inputTexts, unitIndexes, outputUnitScale):
+        """Starts from the inputs and unit selections of the main window"""
+
+        for row, inputText, unitIndex in zip(self.parameterPanel.rows, inputTexts, unitIndexes):
+            row.txtParameter.setText(inputText)
+            row.cmbUnitOptions.setCurrentIndex(unitIndex)
+
+        self.cmbOutputUnit.setCurrentText(outputUnitScale)
+
+        return
+
+    def get_Number(self, text, name):
+        """Converts the text of a box to a number, raising ValueError naming the box when it is not one"""
+
+        try:
+            return float(text.strip())
+        except ValueError:
+            raise ValueError("%s must be a number" % name) from None
+
+    def get_SweepInputs(self, sweepIndex):
+        """Gets the fixed value and unit scale of every input the sweep passes, in catalog order"""
+
+        inputTexts = self.parameterPanel.get_InputTexts()
+        inputUnitScales = self.parameterPanel.get_InputUnitScales()
+
+        if self.plan.tupleMode:
+            # Pass the inputs up to the last one filled in, or up to the swept one
+            filled = [index for index, inputText in enumerate(inputTexts) if inputText]
+            inputCount = max(filled + [sweepIndex]) + 1
+        else:
+            inputCount = self.plan.arity
+
+        fixedValues = [0.0 if index == sweepIndex else self.get_Number(inputTexts[index], row.parameterName)
+                       for index, row in enumerate(self.parameterPanel.rows[:inputCount])]
+
+        return fixedValues, inputUnitScales[:inputCount]
+
+    def run_Sweep(self):
+        self.lblErrorDisplay.hide()
+        sweepIndex = self.cmbSweepParameter.currentIndex()
+        logarithmic = self.chkLogarithmic.isChecked()
+
+        try:
+            sweepValues = get_SweepValues(self.get_Number(self.txtStart.text(), "Start"),
+                                          self.get_Number(self.txtStop.text(), "Stop"),
+                                          self.get_Number(self.txtStep.text(), self.lblStep.text().rstrip(":")),
+                                          logarithmic)
+            fixedValues, inputUnitScales = self.get_SweepInputs(sweepIndex)
+            start = time.perf_counter()
+            results, errors = calculateSweep(self.engine, self.plan.displayName, sweepIndex, sweepValues, fixedValues,
+                                             inputUnitScales, self.cmbOutputUnit.currentText())
+        except (ValueError, KeyError) as e:
+            self.set_lblErrorDisplay(str(e).strip("'\""))
+            return
+
+        seconds = time.perf_counter() - start
+        sweepRow = self.parameterPanel.rows[sweepIndex]
+        self.store = ResultStore.from_Arrays([(sweepRow.parameterName, sweepRow.cmbUnitOptions.currentText()),
+                                              (self.calculation["outputName"], self.cmbOutputUnit.currentText())],
+                                             [sweepValues, results], errors)
+        self.plot.set_Series(self.store.get_Column(0), self.store.get_Column(1), logarithmic, self.store.get_Title(0),
+                             self.store.get_Title(1))
+        self.cmdExport.setEnabled(True)
+        self.lblSummary.setText("%d points evaluated in %.1f ms\n%d points failed" % (len(sweepValues), seconds * 1000,
+                                                                                   len(errors)))
+
+        if errors:
+            self.set_lblErrorDisplay("%s (first failed point)" % errors[min(errors)])
+
+        return
+
+    def set_lblErrorDisplay(self, message):
+        self.lblErrorDisplay.setText("ERROR: %s" % message)
+        self.lblErrorDisplay.show()
+
+        return
+
+    # ==============
+    # EVENT HANDLERS
+    # ==============
+    def cmbSweepParameter_Change(self, index):
+        # The swept input takes its values from start, stop and step instead of its text box
+        for rowIndex, row in enumerate(self.parameterPanel.rows[:self.parameterPanel.parameterCount]):
+            row.txtParameter.setEnabled(rowIndex != index)
+            row.txtParameter.setPlaceholderText("Swept" if rowIndex == index else "")
+
+        return
+
+    def chkLogarithmic_Toggled(self, checked):
+        self.lblStep.setText("Per decade:" if checked else "Step:")
+
+        return
+
+    def cmbOutputUnit_Change(self, index):
+        if index != -1 and self.store is not None:
+            self.run_Sweep()
+
+        return
+
+    def cmdSweep_Click(self):
+        self.run_Sweep()
+
+        return
+
+    def cmdExport_Click(self):
+        path = QFileDialog.getSaveFileName(self, "Export Sweep", "sweep.csv",
+                                           "CSV files (*.csv);;Arrow IPC files (*.arrow)")[0]
+
+        if path:
+            try:
+                self.store.save(path)
+            except (OSError, ImportError) as e:
+                self.set_lblErrorDisplay(str(e))
+
+        return
+
+    # ======================
+    # INITIALIZATION METHODS
+    # ======================
+    def init_SweepControls(self):
+        lblCalculation = QLabel(self.calculation["displayName"])
+        lblCalculation.setParent(self)
+        lblCalculation.setGeometry(10, 10, 780, 25)
+        lblCalculation.setFont(self.fontLabel)
+
+        lblSweepParameter = QLabel("Sweep:")
+        lblSweepParameter.setParent(self)
+        lblSweepParameter.setGeometry(10, 45, 90, 25)
+
+        self.cmbSweepParameter = QComboBox()
+        self.cmbSweepParameter.setParent(self)
+        self.cmbSweepParameter.setGeometry(100, 45, 355, 25)
+        self.cmbSweepParameter.setToolTip("Select the input to sweep")
+        self.cmbSweepParameter.addItems([self.calculation["parameters"]["parameter_%d" % count]
+                                         for count in range(1, len(self.calculation["parameters"]) // 2 + 1)])
+        self.cmbSweepParameter.currentIndexChanged.connect(self.cmbSweepParameter_Change)
+
+        self.txtStart = QLineEdit("1")
+        self.txtStop = QLineEdit("100")
+        self.txtStep = QLineEdit("1")
+        textBoxes = ((self.txtStart, "Start:", 230, "First value of the swept input, in the unit of its row"),
+                     (self.txtStop, "Stop:", 230, "Last value of the swept input, in the unit of its row"),
+                     (self.txtStep, "Step:", 130, "Step between values, or values per decade when logarithmic"))
+
+        for top, (textBox, text, width, toolTip) in zip((85, 120, 155), textBoxes):
+            label = QLabel(text)
+            label.setParent(self)
+            label.setGeometry(470, top, 90, 25)
+
+            textBox.setParent(self)
+            textBox.setGeometry(560, top, width, 25)
+            textBox.setAlignment(Qt.AlignRight)
+            textBox.setToolTip(toolTip)
+
+        self.lblStep = label
+
+        self.chkLogarithmic = QCheckBox("Log")
+        self.chkLogarithmic.setParent(self)
+        self.chkLogarithmic.setGeometry(710, 155, 80, 25)
+        self.chkLogarithmic.setToolTip("Space the values evenly on a logarithmic scale")
+        self.chkLogarithmic.toggled.connect(self.chkLogarithmic_Toggled)
+
+        return
+
+    def init_ParameterControls(self):
+        self.parameterPanel = ParameterPanel(self.fontLabel, self.fontCombo, self)
+        self.parameterPanel.setGeometry(10, 85, 445, 210)
+        self.parameterPanel.set_Parameters(self.calculation["parameters"])
+
+        return
+
+    def init_OutputControls(self):
+        lblOutputUnit = QLabel("Output:")
+        lblOutputUnit.setParent(self)
+        lblOutputUnit.setGeometry(470, 45, 90, 25)
+
+        self.cmbOutputUnit = QComboBox()
+        self.cmbOutputUnit.setParent(self)
+        self.cmbOutputUnit.setGeometry(560, 45, 230, 25)
+        self.cmbOutputUnit.addItems(get_SiblingScales(self.calculation["outputUnitScale"]))
+        self.cmbOutputUnit.setToolTip("Select the unit scale of the plotted results")
+        self.cmbOutputUnit.currentIndexChanged.connect(self.cmbOutputUnit_Change)
+
+        self.cmdSweep = QPushButton("Sweep")
+        self.cmdSweep.setParent(self)
+        self.cmdSweep.setGeometry(470, 195, 155, 40)
+        self.cmdSweep.clicked.connect(self.cmdSweep_Click)
+
+        self.cmdExport = QPushButton("Export")
+        self.cmdExport.setParent(self)
+        self.cmdExport.setGeometry(635, 195, 155, 40)
+        self.cmdExport.setEnabled(False)  # until there is a sweep to export
+        self.cmdExport.clicked.connect(self.cmdExport_Click)
+
+        self.lblSummary = QLabel()
+        self.lblSummary.setParent(self)
+        self.lblSummary.setGeometry(470, 245, 320, 50)
+        self.lblSummary.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.lblSummary.setWordWrap(True)
+
+        return
+
+    def init_plot(self):
+        self.plot = PlotWidget(self)
+        self.plot.setGeometry(10, 305, 780, 360)
+
+        return
+
+    def init_lblErrorDisplay(self):
+        self.lblErrorDisplay = QLabel()
+        self.lblErrorDisplay.setObjectName("lblErrorDisplay")
+        self.lblErrorDisplay.setParent(self)
+        self.lblErrorDisplay.setGeometry(10, 672, 780, 40)
+        self.lblErrorDisplay.setWordWrap(True)
+        self.lblErrorDisplay.hide()
+
+        return
@@ -0,0 +1,123 @@
+"""Registry of every unit scale the calculator understands, built once when the module is imported.
+
+Each unit scale (see the glossary in eecalc.py) maps to its unit type, display abbreviation,
+ElectronicsCalculator.scale_factors Enum member and numeric scale factor. The scale factors are also kept in flat
+tables, so converting a value is one dictionary lookup and one multiply by a precomputed power of ten. The registry is
+immutable, so the GUI, the engine and the batch paths can all share it.
+"""
+
+from collections import namedtuple
+from types import MappingProxyType
+
+import ElectronicsCalculator.scale_factors as sf
+
+UnitScale = namedtuple("UnitScale", ["scale", "unitType", "abbreviation", "factorEnum", "exponent", "factor"])
+UnitScale.__doc__ = """One unit scale, e.g. ("KILOHMS", "Resistance", "KΩ", sf.Resistance.KILOHMS, 3, 1000)"""
+
+# Unit types in display order, each with its scales and their abbreviations. The unit type names are the names of
+# the Enum classes in ElectronicsCalculator.scale_factors.
+_ABBREVIATIONS = (
+    ("Capacitance", (("FARADS", "F"), ("MILLIFARADS", "mF"), ("MICROFARADS", "µF"), ("NANOFARADS", "nF"),
+                     ("PICOFARADS", "pF"))),
+    ("Inductance", (("HENRIES", "H"), ("MILLIHENRIES", "mH"), ("MICROHENRIES", "µH"))),
+    ("Resistance", (("OHMS", "Ω"), ("KILOHMS", "KΩ"), ("MEGAOHMS", "MΩ"))),
+    ("Frequency", (("HERTZ", "Hz"), ("KILOHERTZ", "KHz"), ("MEGAHERTZ", "MHz"), ("GIGAHERTZ", "GHz"))),
+    ("Current", (("AMPERES", "A"), ("MILLIAMPERES", "mA"), ("MICROAMPERES", "µA"))),
+    ("Power", (("WATTS", "W"), ("MEGAWATTS", "MW"), ("MILLIWATTS", "mW"), ("MICROWATTS", "µW"))),
+    ("Voltage", (("VOLTS", "V"), ("KILOVOLTS", "KV"), ("MILLIVOLTS", "mV"), ("MICROVOLTS", "µV"))),
+    ("Distance", (("METERS", "m"), ("CENTIMETERS", "cm"), ("MILLIMETERS", "mm"), ("KILOMETERS", "Km"))),
+    ("Time", (("SECONDS", "s"), ("MILLISECONDS", "ms"), ("MICROSECONDS", "µs"))),
+    ("Angle", (("DEGREES", "°"),)),
+    ("GainDB", (("DECIBELS", "dB"),)),
+    ("GainA", (("RATIO", "A"),)),
+)
+
+
+def _buildRegistry():
+    unitScales = {}
+    unitTypeEnums = {}
+    abbreviationsByType = {}
+    scaleFactors = {}
+    typeScaleFactors = {}
+    scaleByAbbreviation = {}
+    scaleByTypeAbbreviation = {}
+
+    for unitType, abbreviations in _ABBREVIATIONS:
+        factorEnums = getattr(sf, unitType)
+        unitTypeEnums[unitType] = factorEnums
+        abbreviationsByType[unitType] = MappingProxyType(dict(abbreviations))
+
+        for scale, abbreviation in abbreviations:
+            factorEnum = factorEnums[scale]
+            exponent = factorEnum.value if factorEnum.value != 1 else 0  # sf.scale_in treats 1 as the base unit
+            factor = 10 ** exponent  # same value as the pow(10, exponent) in sf.scale_in / sf.scale_out
+            unitScales[scale] = UnitScale(scale, unitType, abbreviation, factorEnum, exponent, factor)
+            scaleFactors[scale] = factor
+            typeScaleFactors[(unitType, scale)] = factor
+            scaleByAbbreviation.setdefault(abbreviation, scale)  # "A" is both AMPERES and RATIO; AMPERES wins
+            scaleByTypeAbbreviation[(unitType, abbreviation)] = scale
+
+    return (MappingProxyType(unitScales), MappingProxyType(unitTypeEnums), MappingProxyType(abbreviationsByType),
+            MappingProxyType(scaleFactors), MappingProxyType(typeScaleFactors),
+            MappingProxyType(scaleByAbbreviation), MappingProxyType(scaleByTypeAbbreviation))
+
+
+(UNIT_SCALES, UNIT_TYPE_ENUMS, ABBREVIATIONS_BY_TYPE, SCALE_FACTORS, TYPE_SCALE_FACTORS, _SCALE_BY_ABBREVIATION,
+ _SCALE_BY_TYPE_ABBREVIATION) = _buildRegistry()
+
+
+def get_UnitScale(scale):
+    """Returns the UnitScale record of a scale name such as "KILOHMS", raising KeyError for unknown scales"""
+
+    try:
+        return UNIT_SCALES[scale]
+    except KeyError:
+        raise KeyError("Unknown unit scale: %s" % scale) from None
+
+
+def get_ScaleFactor(scale):
+    """
+    Returns the number a value in the given scale is multiplied by to convert it to the base unit, and divided by to
+    convert a base unit value into the scale, e.g. 1000 for "KILOHMS" and 1 for "OHMS".
+    """
+
+    try:
+        return SCALE_FACTORS[scale]
+    except KeyError:
+        raise KeyError("Unknown unit scale: %s" % scale) from None
+
+
+def get_SiblingScales(scale):
+    """
+    Gets every scale of the same unit type as the given scale, mapped to its abbreviation, in display order.
+
+    Input:
+        scale [str] - Any scale of the unit type, e.g. "OHMS"
+
+    Output:
+        abbreviations [Mapping[str, str]] - e.g. {"OHMS": "Ω", "KILOHMS": "KΩ", "MEGAOHMS": "MΩ"}
+    """
+
+    return ABBREVIATIONS_BY_TYPE[get_UnitScale(scale).unitType]
+
+
+def get_ScaleFromAbbreviation(abbreviation, unitType=None):
+    """
+    Looks up the scale name for an abbreviation such as "KΩ".
+
+    Inputs:
+        abbreviation [str] - The abbreviation, which is case-sensitive ("MW" is megawatts, "mW" milliwatts)
+
+        unitType [str] - Restricts the lookup to one unit type. Needed for "A", which is both AMPERES and RATIO.
+
+    Output:
+        scale [str] - The scale name
+    """
+
+    try:
+        if unitType is None:
+            return _SCALE_BY_ABBREVIATION[abbreviation]
+
+        return _SCALE_BY_TYPE_ABBREVIATION[(unitType, abbreviation)]
+    except KeyError:
+        raise KeyError("Unknown unit abbreviation: %s" % abbreviation) from None